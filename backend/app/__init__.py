@@ -6,45 +6,66 @@ from flask_cors import CORS
 
 # Import the extensions that will be linked to the app
 from .extensions import db, api
+from . import database
 
 # Import all your models so that Flask-Migrate can see them
-from .models import Article, User, Category
+from .models import Article, User, Category, LLMCacheEntry, TopicFetchLog, ContentGeneration, CategoryTraffic, CategoryStats, ArticleUrl
+# Registers the session listeners that keep category_stats in step with follow changes
+from .service import category_stats_service
 
 # Import all your API namespaces
+# (the news namespace is imported in create_app, so read-only workers never load the pipeline)
 from .routes.article_routes import api as articles_ns
-from .routes.news_routes import api as news_ns
+from .routes import metrics_routes, compression
 
 migrate = Migrate()
 
-def create_app():
+# --- App modes ---
+# "full" serves every endpoint; "read" serves only the article read API and
+# /metrics, for read-only workers that should start without the news pipeline.
+APP_MODES = ("full", "read")
+
+def create_app(mode: str = None):
     """
     Application Factory: Creates and configures the Flask app.
     This is the industry-standard pattern to avoid circular imports and context errors.
+    `mode` defaults to the APP_MODE environment variable, or "full".
     """
+    mode = (mode or os.environ.get("APP_MODE", "full")).lower()
+    if mode not in APP_MODES:
+        raise ValueError(f"Unknown APP_MODE '{mode}', expected one of {', '.join(APP_MODES)}")
     app = Flask(__name__)
  # Allow both your local development server and your deployed frontend
     origins = [
     "http://localhost:5173",
     "https://news-mann.netlify.app" # Your Netlify URL
     ]
-    CORS(app, resources={r"/*": {"origins": origins}})
+    CORS(app, resources={r"/*": {"origins": origins}}, expose_headers=["X-Next-Cursor"])
 
     # --- Configuration ---
     # Load configuration from environment variables
     app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("SUPABASE_DB_URI")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["RESTX_MASK_SWAGGER"] = False
+    # Connection pool, statement timeout and read replica settings (see app/database.py)
+    database.configure(app)
 
     # --- Initialize Extensions with the App ---
     # This is the crucial step that links your db and api objects to the
     # Flask app instance, fixing the "app is not registered" error.
     db.init_app(app)
+    database.init_app(app)
     api.init_app(app)
     migrate.init_app(app, db)
+    metrics_routes.init_app(app)
+    compression.init_app(app)
 
     # --- Add API Namespaces (Routes) ---
     # Define URL prefixes here for better organization
     api.add_namespace(articles_ns, path='/articles')
-    api.add_namespace(news_ns, path='/news')
+    if mode == "full":
+        from .routes.news_routes import api as news_ns
+        api.add_namespace(news_ns, path='/news')
+    app.config["APP_MODE"] = mode
 
     return app
\ No newline at end of file
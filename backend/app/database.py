@@ -0,0 +1,93 @@
+import os
+from flask import g
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from .extensions import db
+
+# --- Engine settings (environment variables) ---
+# DB_POOL_SIZE / DB_MAX_OVERFLOW    connections kept open / allowed on top under load (5 / 10)
+# DB_POOL_TIMEOUT                   seconds to wait for a free connection (30)
+# DB_POOL_RECYCLE                   seconds after which a connection is replaced (1800); keep it
+#                                   below the server's or pooler's idle timeout
+# DB_POOL_PRE_PING                  test connections before use, dropping stale ones ("true")
+# DB_STATEMENT_TIMEOUT_MS           server-side statement timeout, 0 disables it (15000)
+# DB_PGBOUNCER_MODE                 "session" (default) or "transaction" for PgBouncer /
+#                                   Supabase transaction pooling (port 6543): no startup
+#                                   parameters, and locks/settings scoped to transactions
+# DB_REPLICA_URI                    optional read replica used by ArticleService reads
+
+
+def pgbouncer_transaction_mode():
+    return os.environ.get("DB_PGBOUNCER_MODE", "session").lower() == "transaction"
+
+
+def _is_postgres(uri: str):
+    return bool(uri) and uri.startswith(("postgres://", "postgresql"))
+
+
+def engine_options(uri: str):
+    """Pool and connection options for one database URI; SQLite keeps SQLAlchemy's defaults."""
+    if not _is_postgres(uri):
+        return {}
+    options = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.environ.get("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": os.environ.get("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+    }
+    timeout_ms = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 15000))
+    if timeout_ms and not pgbouncer_transaction_mode():
+        # Transaction poolers reject startup parameters; see _set_local_statement_timeout
+        options["connect_args"] = {"options": f"-c statement_timeout={timeout_ms}"}
+    return options
+
+
+def _set_local_statement_timeout(engine, timeout_ms: int):
+    """In PgBouncer transaction mode, applies the statement timeout inside every transaction."""
+    @event.listens_for(engine, "begin")
+    def set_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+def configure(app):
+    """Sets engine options and the optional replica bind on the app config, before db.init_app."""
+    uri = app.config["SQLALCHEMY_DATABASE_URI"]
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(uri)
+    replica_uri = os.environ.get("DB_REPLICA_URI")
+    if replica_uri:
+        app.config["SQLALCHEMY_BINDS"] = {"replica": {"url": replica_uri, **engine_options(replica_uri)}}
+
+
+def init_app(app):
+    """Installs per-engine hooks once the engines exist, and closes replica sessions on teardown."""
+    timeout_ms = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 15000))
+    with app.app_context():
+        if timeout_ms and pgbouncer_transaction_mode():
+            for engine in db.engines.values():
+                if engine.dialect.name == 'postgresql':
+                    _set_local_statement_timeout(engine, timeout_ms)
+
+    @app.teardown_appcontext
+    def close_read_session(exc):
+        session = g.pop('read_session', None)
+        if session is not None:
+            session.close()
+
+
+_read_sessionmakers = {}
+
+
+def read_session():
+    """
+    Session for read-only queries. Bound to the replica when DB_REPLICA_URI is
+    set (one session per app context), otherwise the regular db.session.
+    """
+    engine = db.engines.get("replica")
+    if engine is None:
+        return db.session
+    if 'read_session' not in g:
+        if engine not in _read_sessionmakers:
+            _read_sessionmakers[engine] = sessionmaker(bind=engine)
+        g.read_session = _read_sessionmakers[engine]()
+    return g.read_session
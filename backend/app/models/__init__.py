@@ -4,4 +4,11 @@
 from .articles_model import Article, article_categories
 from .user_model import User
 from .category_model import Category
-from .user_category_join_table import user_categories
\ No newline at end of file
+from .user_category_join_table import user_categories
+from .llm_cache_model import LLMCacheEntry
+from .topic_fetch_log_model import TopicFetchLog
+from .content_generation_model import ContentGeneration
+from .article_search import install_search_index
+from .category_traffic_model import CategoryTraffic
+from .category_stats_model import CategoryStats
+from .article_url_model import ArticleUrl
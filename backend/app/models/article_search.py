@@ -0,0 +1,71 @@
+from sqlalchemy import event, text
+from .articles_model import Article
+
+# --- Full-text search index over headline, summary and source_name ---
+# Postgres: a stored, generated tsvector column with a GIN index.
+# SQLite (local/test runs): an external-content FTS5 table kept in sync by triggers.
+# Every statement is idempotent, so install_search_index() can also be run
+# against an existing database.
+
+POSTGRES_DDL = [
+    """
+    ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(headline, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(source_name, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_articles_search_vector ON articles USING GIN (search_vector)",
+]
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+        headline, summary, source_name, content='articles', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, headline, summary, source_name)
+        VALUES (new.rowid, new.headline, new.summary, new.source_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, headline, summary, source_name)
+        VALUES ('delete', old.rowid, old.headline, old.summary, old.source_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, headline, summary, source_name)
+        VALUES ('delete', old.rowid, old.headline, old.summary, old.source_name);
+        INSERT INTO articles_fts(rowid, headline, summary, source_name)
+        VALUES (new.rowid, new.headline, new.summary, new.source_name);
+    END
+    """,
+    # Index any rows that existed before the FTS table was created
+    "INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')",
+]
+
+
+def install_search_index(connection):
+    """Creates the search column/table and index for the connection's dialect."""
+    statements = {
+        'postgresql': POSTGRES_DDL,
+        'sqlite': SQLITE_DDL,
+    }.get(connection.dialect.name, [])
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+@event.listens_for(Article.__table__, 'after_create')
+def _create_search_index(target, connection, **kw):
+    install_search_index(connection)
+
+
+@event.listens_for(Article.__table__, 'before_drop')
+def _drop_search_index(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        connection.execute(text("DROP TABLE IF EXISTS articles_fts"))
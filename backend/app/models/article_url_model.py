@@ -0,0 +1,17 @@
+from ..extensions import db
+
+# --- SQLAlchemy Database Model for stored source URLs ---
+# One row per stored article URL. When articles is partitioned by month, a
+# unique constraint can only hold within a partition, so this unpartitioned
+# table is what keeps a URL from being stored twice: writers claim the URL
+# here first and only insert the articles whose claim succeeded.
+class ArticleUrl(db.Model):
+    __tablename__ = 'article_urls'
+
+    source_url = db.Column(db.Text, primary_key=True)
+    article_id = db.Column(db.String, nullable=False)
+    # Lets retention find the claims of archived months
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), index=True)
+
+    def __repr__(self):
+        return f'<ArticleUrl {self.source_url}>'
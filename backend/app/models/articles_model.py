@@ -1,3 +1,4 @@
+import datetime
 from flask_restx import fields
 # import sys
 # import os
@@ -7,22 +8,34 @@ from ..extensions import db
 # --- Many-to-Many Join Table ---
 article_categories = db.Table('article_categories',
     db.Column('article_id', db.String, db.ForeignKey('articles.id'), primary_key=True),
-    db.Column('category_id', db.Integer, db.ForeignKey('categories.id'), primary_key=True)
+    db.Column('category_id', db.Integer, db.ForeignKey('categories.id'), primary_key=True),
+    # Copy of the article's created_at: the partition key when the table is partitioned by month
+    db.Column('article_created_at', db.DateTime, nullable=True),
+    # The primary key leads with article_id, so category feeds need their own index
+    db.Index('ix_article_categories_category_id_article_id', 'category_id', 'article_id')
 )
 
 # --- SQLAlchemy Database Model ---
 class Article(db.Model):
     __tablename__ = 'articles'
+    __table_args__ = (
+        # Composite index backing the (created_at, id) keyset used by the feed endpoints
+        db.Index('ix_articles_created_at_id', 'created_at', 'id'),
+    )
 
     id = db.Column(db.String, primary_key=True)
-    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    # Set in Python so every row carries microseconds in one format; SQLite's CURRENT_TIMESTAMP
+    # text has none, and the (created_at, id) cursor comparison would not advance past it
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, server_default=db.func.now())
     title = db.Column(db.Text, nullable=False) # The original title
     headline = db.Column(db.Text, nullable=True) # The new AI-generated headline
     summary = db.Column(db.Text, nullable=False)
-    source_url = db.Column(db.Text, nullable=False, unique=True)
+    # Unique through article_urls: a partitioned articles table cannot enforce it across months
+    source_url = db.Column(db.Text, nullable=False, index=True)
     image_url = db.Column(db.Text, nullable=True)
     published_at = db.Column(db.DateTime, nullable=True)
     source_name = db.Column(db.Text, nullable=True)
+    simhash = db.Column(db.BigInteger, nullable=True) # 64-bit content fingerprint for near-duplicate detection
 
     categories = db.relationship(
         'Category',
@@ -0,0 +1,16 @@
+from ..extensions import db
+
+# --- SQLAlchemy Database Model for materialized category statistics ---
+# One row per category, kept up to date incrementally in the same transaction
+# as article links and follow changes, so listing categories with their counts
+# is a single primary-key join instead of a scan of article_categories.
+class CategoryStats(db.Model):
+    __tablename__ = 'category_stats'
+
+    category_id = db.Column(db.Integer, db.ForeignKey('categories.id', ondelete='CASCADE'), primary_key=True)
+    article_count = db.Column(db.Integer, nullable=False, default=0)
+    latest_created_at = db.Column(db.DateTime, nullable=True) # created_at of the newest linked article
+    follower_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<CategoryStats {self.category_id} articles={self.article_count} followers={self.follower_count}>'
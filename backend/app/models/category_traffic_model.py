@@ -0,0 +1,14 @@
+from ..extensions import db
+
+# --- SQLAlchemy Database Model for category read traffic ---
+# Holds an exponentially decayed count of reads per category, flushed in
+# batches by the web workers and used by the refresh scheduler for priority.
+class CategoryTraffic(db.Model):
+    __tablename__ = 'category_traffic'
+
+    category_name = db.Column(db.String(50), primary_key=True)
+    read_score = db.Column(db.Float, nullable=False, default=0.0)
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f'<CategoryTraffic {self.category_name} {self.read_score:.1f}>'
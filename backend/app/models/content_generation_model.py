@@ -0,0 +1,14 @@
+from ..extensions import db
+
+# --- SQLAlchemy Database Model for the content generation counter ---
+# A single row whose counter is bumped in the same transaction as every
+# article write. Read endpoints derive their ETags and cache keys from it.
+class ContentGeneration(db.Model):
+    __tablename__ = 'content_generation'
+
+    id = db.Column(db.Integer, primary_key=True) # always 1
+    generation = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<ContentGeneration {self.generation}>'
@@ -0,0 +1,15 @@
+from ..extensions import db
+
+# --- SQLAlchemy Database Model for cached LLM results ---
+# Summaries and validation verdicts are keyed by a hash of the article
+# content plus the prompt version, so overlapping topics reuse earlier work.
+class LLMCacheEntry(db.Model):
+    __tablename__ = 'llm_cache'
+
+    cache_key = db.Column(db.String(64), primary_key=True) # sha256 hex digest
+    kind = db.Column(db.String(20), nullable=False) # 'summary' or 'validation'
+    value = db.Column(db.Text, nullable=False) # JSON-encoded result
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), index=True)
+
+    def __repr__(self):
+        return f'<LLMCacheEntry {self.kind} {self.cache_key[:12]}>'
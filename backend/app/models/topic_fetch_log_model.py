@@ -0,0 +1,16 @@
+from ..extensions import db
+
+# --- SQLAlchemy Database Model for pipeline run history ---
+# One row per topic, updated after every process_topic run (including
+# runs that found or stored nothing), and used for the refresh cooldown.
+class TopicFetchLog(db.Model):
+    __tablename__ = 'topic_fetch_log'
+
+    topic = db.Column(db.String(50), primary_key=True)
+    last_run_at = db.Column(db.DateTime, nullable=False)
+    outcome = db.Column(db.String(20), nullable=False) # 'stored', 'empty' or 'failed'
+    fetched_count = db.Column(db.Integer, nullable=False, default=0)
+    stored_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<TopicFetchLog {self.topic} {self.outcome}>'
@@ -1,8 +1,47 @@
-from flask_restx import Namespace, Resource, fields
-from ..service.article_service import ArticleService
+import functools
+from flask_restx import Namespace, Resource, fields, reqparse
+from ..service.article_service import ArticleService, InvalidCursorError, MAX_PAGE_SIZE
+from .http_cache import cached_get
+from .serializers import serialize_articles
+from ..service.traffic_service import ReadTraffic
 
 api = Namespace('articles', description='Article retrieval operations')
 
+# Query parameters for cursor (keyset) pagination.
+# Without `limit` or `after` the endpoints keep returning the full list.
+page_parser = reqparse.RequestParser()
+page_parser.add_argument('limit', type=int, location='args',
+                         help=f'Page size (max {MAX_PAGE_SIZE})')
+page_parser.add_argument('after', type=str, location='args',
+                         help='Cursor from the X-Next-Cursor header of the previous page')
+
+
+def _is_paged(params):
+    return params['limit'] is not None or params['after'] is not None
+
+
+def _paged_response(params, page_fn, *args):
+    """Runs a keyset page query and exposes the next cursor as a response header."""
+    try:
+        articles, next_cursor = page_fn(*args, limit=params['limit'], after=params['after'])
+    except InvalidCursorError as e:
+        api.abort(400, str(e))
+    headers = {'X-Next-Cursor': next_cursor} if next_cursor else {}
+    return serialize_articles(articles), 200, headers
+
+# Query parameters for full-text search, also keyset-paginated
+search_parser = page_parser.copy()
+search_parser.add_argument('q', type=str, location='args', required=True,
+                           help='Search terms matched against headline, summary and source name')
+
+def _counts_category_reads(fn):
+    """Records a category read; applied outside cached_get so 304s and cache hits count too."""
+    @functools.wraps(fn)
+    def wrapper(self, category_name, *args, **kwargs):
+        ReadTraffic.record(category_name.lower())
+        return fn(self, category_name, *args, **kwargs)
+    return wrapper
+
 # DTO for displaying a single article
 article_display_dto = api.model('ArticleDisplay', {
     'id': fields.String(readonly=True),
@@ -20,26 +59,80 @@ category_display_dto = api.model('CategoryDisplay', {
     'category_name': fields.String(required=True)
 })
 
+# DTO for a category with its materialized statistics
+category_stats_dto = api.inherit('CategoryStatsDisplay', category_display_dto, {
+    'article_count': fields.Integer(readonly=True),
+    'latest_created_at': fields.DateTime(readonly=True, description='When the newest article was stored'),
+    'follower_count': fields.Integer(readonly=True)
+})
+
 @api.route('/')
 class ArticleList(Resource):
     """Resource for getting all articles for the main news feed."""
-    @api.marshal_list_with(article_display_dto)
+    @api.expect(page_parser)
+    @api.response(200, 'Success', [article_display_dto])
+    @cached_get
     def get(self):
         """Get all articles for the main feed, sorted by most recent"""
-        return ArticleService.get_all_articles()
+        params = page_parser.parse_args()
+        if _is_paged(params):
+            return _paged_response(params, ArticleService.get_articles_page)
+        return serialize_articles(ArticleService.get_all_articles())
 
 @api.route('/by-category/<string:category_name>')
 class ArticlesByCategory(Resource):
     """Resource for getting articles filtered by a specific category."""
-    @api.marshal_list_with(article_display_dto)
+    @api.expect(page_parser)
+    @api.response(200, 'Success', [article_display_dto])
+    @_counts_category_reads
+    @cached_get
     def get(self, category_name):
         """Get articles for a specific category, sorted by most recent"""
-        return ArticleService.get_articles_by_category(category_name)
+        params = page_parser.parse_args()
+        if _is_paged(params):
+            return _paged_response(params, ArticleService.get_articles_by_category_page, category_name)
+        return serialize_articles(ArticleService.get_articles_by_category(category_name))
+
+@api.route('/feed/<int:user_id>')
+@api.param('user_id', 'The user whose followed categories make up the feed')
+class UserFeed(Resource):
+    """Resource for a user's personalized feed across all followed categories."""
+    @api.expect(page_parser)
+    @api.response(200, 'Success', [article_display_dto])
+    @api.response(404, 'User not found')
+    @cached_get
+    def get(self, user_id):
+        """Get the newest articles from every category the user follows"""
+        if not ArticleService.user_exists(user_id):
+            api.abort(404, f"User {user_id} not found")
+        return _paged_response(page_parser.parse_args(), ArticleService.get_user_feed_page, user_id)
+
+@api.route('/search')
+class ArticleSearch(Resource):
+    """Resource for ranked full-text search over stored articles."""
+    @api.expect(search_parser)
+    @api.response(200, 'Success', [article_display_dto])
+    @cached_get
+    def get(self):
+        """Search articles by headline, summary and source, best matches first"""
+        params = search_parser.parse_args()
+        return _paged_response(params, ArticleService.search_articles, params['q'])
 
 @api.route('/categories')
 class CategoryList(Resource):
     """Resource for getting all unique categories."""
+    @cached_get
     @api.marshal_list_with(category_display_dto)
     def get(self):
         """Get all unique categories"""
         return ArticleService.get_all_categories()
+
+@api.route('/categories/stats')
+class CategoryStatsList(Resource):
+    """Resource for categories with their article counts, freshness and followers."""
+    @cached_get
+    @api.marshal_list_with(category_stats_dto)
+    def get(self):
+        """Get all categories with article count, newest article time and follower count"""
+        return ArticleService.get_category_stats()
+
@@ -0,0 +1,55 @@
+import os
+import gzip
+from flask import request
+from ..service.metrics import RESPONSE_COMPRESSIONS
+
+# brotli is an optional extra; without it only gzip is offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# --- Response compression ---
+# JSON bodies are compressed according to Accept-Encoding. Smaller bodies are
+# sent as-is: below about a kilobyte the framing costs more than compression saves.
+COMPRESS_MIN_BYTES = int(os.environ.get("COMPRESS_MIN_BYTES", 1024))
+GZIP_LEVEL = int(os.environ.get("COMPRESS_GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.environ.get("COMPRESS_BROTLI_QUALITY", 5))
+
+# Preferred first when the client rates them equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(size: int):
+    """Returns the encoding to use for a body of `size` bytes in this request, or None."""
+    if size < COMPRESS_MIN_BYTES:
+        return None
+    return request.accept_encodings.best_match(ENCODINGS)
+
+
+def compress(body: bytes, encoding: str, source: str = "live"):
+    RESPONSE_COMPRESSIONS.inc(encoding=encoding, source=source)
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _compress_response(response):
+    """Compresses JSON responses that cached_get has not already encoded."""
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or response.mimetype != 'application/json'):
+        return response
+    response.vary.add('Accept-Encoding')
+    if 'Content-Encoding' in response.headers:
+        return response
+    body = response.get_data()
+    encoding = negotiate(len(body))
+    if encoding:
+        response.set_data(compress(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def init_app(app):
+    """Adds Accept-Encoding driven gzip/brotli compression of JSON responses."""
+    app.after_request(_compress_response)
@@ -0,0 +1,129 @@
+import os
+import hashlib
+import datetime
+import functools
+import threading
+from collections import OrderedDict
+from flask import request, Response
+from ..service.generation_service import GenerationService
+from ..service.metrics import RESPONSE_CACHE_LOOKUPS
+from .serializers import dumps
+from .compression import ENCODINGS, compress, negotiate
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of serialized response bodies keyed by (endpoint, params, generation).
+    Entries from older generations are dropped as soon as a newer generation is seen.
+    Each entry also keeps its compressed variants, so a body is compressed at most
+    once per encoding per generation.
+    """
+    def __init__(self, max_entries: int = None):
+        self.max_entries = max_entries or int(os.environ.get("RESPONSE_CACHE_SIZE", 256))
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = None
+
+    def get(self, key, generation):
+        with self._lock:
+            if generation != self._generation:
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, generation, entry):
+        with self._lock:
+            if self._generation is None or generation > self._generation:
+                self._entries.clear()
+                self._generation = generation
+            elif generation < self._generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+def _unpack(rv):
+    """Splits a Resource return value into (data, status, headers)."""
+    if isinstance(rv, tuple):
+        data, status, headers = (tuple(rv) + (200, {}))[:3]
+        return data, status, dict(headers or {})
+    return rv, 200, {}
+
+
+def _variant_etag(etag, encoding):
+    # Each encoding is a different representation, so it needs its own strong ETag
+    return f"{etag}-{encoding}" if encoding else etag
+
+
+def _not_modified(etag, last_modified):
+    """Returns the ETag to send with a 304 if the client's copy is current, else None."""
+    if request.if_none_match:
+        variants = (_variant_etag(etag, encoding) for encoding in (None,) + ENCODINGS)
+        return next((tag for tag in variants if request.if_none_match.contains(tag)), None)
+    if request.if_modified_since and last_modified:
+        return etag if last_modified.replace(microsecond=0) <= request.if_modified_since else None
+    return None
+
+
+def cached_get(fn):
+    """
+    Adds ETag / Last-Modified headers, conditional GET (304) handling and a
+    server-side response cache to a read-only Resource method.
+
+    Both the ETag and the cache key are derived from the content generation
+    counter, so they change exactly when a pipeline run commits new content.
+    Bodies are compressed per Accept-Encoding (see compression.py) and the
+    compressed bytes are cached alongside the plain body.
+    Only non-empty 200 responses are cached and tagged: the service layer
+    returns an empty list on database errors, and that must not stick.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        generation, updated_at = GenerationService.current()
+        last_modified = updated_at.replace(tzinfo=datetime.timezone.utc) if updated_at else None
+        key = (request.endpoint, tuple(sorted(kwargs.items())), tuple(sorted(request.args.items(multi=True))))
+        etag = hashlib.sha1(repr((key, generation)).encode('utf-8')).hexdigest()
+
+        current_etag = _not_modified(etag, last_modified)
+        if current_etag:
+            RESPONSE_CACHE_LOOKUPS.inc(result="not_modified")
+            response = Response(status=304)
+            response.set_etag(current_etag)
+        else:
+            entry = response_cache.get(key, generation)
+            RESPONSE_CACHE_LOOKUPS.inc(result="miss" if entry is None else "hit")
+            if entry is None:
+                data, status, headers = _unpack(fn(*args, **kwargs))
+                if status != 200 or not data:
+                    return data, status, headers
+                entry = (dumps(data), headers, {})
+                response_cache.put(key, generation, entry)
+            body, headers, variants = entry
+            encoding = negotiate(len(body))
+            if encoding:
+                # Concurrent misses may both compress; either result is the same bytes
+                if encoding not in variants:
+                    variants[encoding] = compress(body, encoding, source="cached")
+                body = variants[encoding]
+                headers = {**headers, 'Content-Encoding': encoding}
+            response = Response(body, status=200, mimetype='application/json', headers=headers)
+            response.set_etag(_variant_etag(etag, encoding))
+
+        response.vary.add('Accept-Encoding')
+        if last_modified:
+            response.last_modified = last_modified
+        # Clients may keep the body but must revalidate it on every use
+        response.cache_control.no_cache = True
+        return response
+    return wrapper
@@ -0,0 +1,31 @@
+import time
+from flask import Response, g, request
+from ..service.metrics import REGISTRY, HTTP_REQUEST_SECONDS, configure_logging
+
+
+def metrics_view():
+    """Prometheus scrape endpoint. Metrics are per process; scrape every worker."""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+
+def _start_timer():
+    g.request_started_at = time.perf_counter()
+
+
+def _observe_request(response):
+    started_at = g.pop('request_started_at', None)
+    if started_at is not None:
+        # Labelled by endpoint name rather than path, so ids in URLs don't explode cardinality
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started_at,
+            endpoint=request.endpoint or "unmatched", method=request.method, status=response.status_code
+        )
+    return response
+
+
+def init_app(app):
+    """Adds request latency tracking, structured logging and the /metrics endpoint to the app."""
+    configure_logging()
+    app.before_request(_start_timer)
+    app.after_request(_observe_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
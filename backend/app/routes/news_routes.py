@@ -1,8 +1,48 @@
+import json
+import time
+import queue
+from flask import current_app, url_for, Response
 from flask_restx import Namespace, Resource
 from ..service.news_service import NewsService
+from ..service.job_queue import JobQueue
+from ..service.rate_limit import all_limiters
 
 api = Namespace('news', description='News fetching and processing operations')
 news_service = NewsService()
+job_queue = JobQueue()
+
+# How often an idle event stream checks on its job, and sends a keep-alive comment
+STREAM_POLL_SECONDS = 0.5
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+def _sse(event: str, data: dict):
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _stream_job_events(topic: str, job, subscription):
+    """
+    Relays the topic's progress events until the job finishes, then sends a
+    final "complete" event with the job status and pipeline result.
+    """
+    try:
+        yield _sse("job", {"job_id": job.id, "status": job.status})
+        last_sent = time.monotonic()
+        while True:
+            try:
+                event = subscription.get(timeout=STREAM_POLL_SECONDS)
+            except queue.Empty:
+                if job.is_finished:
+                    yield _sse("complete", job.to_dict())
+                    return
+                if time.monotonic() - last_sent >= STREAM_KEEPALIVE_SECONDS:
+                    last_sent = time.monotonic()
+                    yield ": keep-alive\n\n"
+                continue
+            last_sent = time.monotonic()
+            yield _sse(event["event"], {key: value for key, value in event.items() if key != "event"})
+    finally:
+        news_service.progress.unsubscribe(topic, subscription)
 
 @api.route('/process/<string:topic>')
 @api.param('topic', 'The news topic to fetch, process, and store')
@@ -12,9 +52,65 @@ class ProcessNews(Resource):
     Includes a 30-minute cache check before fetching.
     """
     @api.doc('process_news_by_topic')
+    @api.response(202, 'Pipeline run queued; poll the returned status_url')
     def get(self, topic):
         """
-        Runs the full data processing pipeline for a given topic.
+        Queues the full data processing pipeline for a given topic.
+        Returns immediately with a job id; repeat submissions join the running job.
+        """
+        job, created = job_queue.submit(
+            current_app._get_current_object(), topic.lower(), news_service.process_topic
+        )
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "coalesced": not created,
+            "status_url": url_for("news_job_status", job_id=job.id),
+        }, 202
+
+@api.route('/stream/<string:topic>')
+@api.param('topic', 'The news topic to fetch, process, and store')
+class StreamNews(Resource):
+    """Runs (or joins) the pipeline for a topic and streams its progress as Server-Sent Events."""
+    @api.doc('stream_news_by_topic')
+    @api.produces(['text/event-stream'])
+    def get(self, topic):
+        """
+        Streams "stage" progress events and one "article" event per stored article,
+        then a final "complete" event carrying the same payload as /news/jobs/<job_id>.
+        """
+        topic = topic.lower()
+        # Subscribe before submitting, so no event of a newly started run is missed
+        subscription = news_service.progress.subscribe(topic)
+        job, _ = job_queue.submit(current_app._get_current_object(), topic, news_service.process_topic)
+        return Response(
+            _stream_job_events(topic, job, subscription),
+            mimetype='text/event-stream',
+            # Proxies must not buffer the stream
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
+
+@api.route('/jobs/<string:job_id>')
+@api.param('job_id', 'The id returned by /news/process/<topic>')
+class JobStatus(Resource):
+    """Reports the status and pipeline metrics of a queued processing job."""
+    @api.doc('get_job_status')
+    def get(self, job_id):
+        """
+        Returns the job status, plus the pipeline result once it has finished.
+        """
+        job = job_queue.get(job_id)
+        if job is None:
+            api.abort(404, f"Job {job_id} not found")
+        return job.to_dict(), 200
+
+
+@api.route('/rate-limits')
+class RateLimits(Resource):
+    """Exposes the client-side rate limiter state for each upstream provider."""
+    @api.doc('get_rate_limits')
+    def get(self):
+        """
+        Returns per-provider request, throttle, retry and circuit breaker counters.
         """
-        result, status_code = news_service.process_topic(topic.lower())
-        return result, status_code
\ No newline at end of file
+        return [limiter.snapshot() for limiter in all_limiters()], 200
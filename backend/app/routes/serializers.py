@@ -0,0 +1,40 @@
+import json
+import datetime
+
+# orjson is an optional speed-up; the standard library encoder is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data):
+    """Serializes `data` to JSON bytes with the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _format_date(value):
+    # Matches flask_restx fields.Date, which renders datetimes as their date part
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return value.isoformat()
+
+
+def serialize_articles(rows):
+    """
+    Turns article display rows into plain dicts shaped like the ArticleDisplay DTO,
+    without running flask_restx marshalling over each field.
+    """
+    return [{
+        'id': row.id,
+        'published_at': _format_date(row.published_at),
+        'headline': row.headline,
+        'summary': row.summary,
+        'source_url': row.source_url,
+        'image_url': row.image_url,
+        'source_name': row.source_name,
+    } for row in rows]
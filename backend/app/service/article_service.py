@@ -1,36 +1,254 @@
-from sqlalchemy import desc
+import os
+import datetime
+from sqlalchemy import desc, tuple_, text, exists, select, func
 from ..extensions import db
-from ..models import Article, Category
+from ..database import read_session
+from ..models import Article, Category, CategoryStats, User, article_categories, user_categories
+from .metrics import log_error
+
+# Page size limits for the cursor-based feed endpoints
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Optional feed horizon: feeds only list articles stored in the last N days, so
+# with a partitioned articles table they only touch recent partitions. 0 disables it.
+FEED_HORIZON_DAYS = float(os.environ.get("NEWS_FEED_HORIZON_DAYS", 0))
+
+# Only the columns the ArticleDisplay DTO needs, plus created_at for cursors.
+# Feed queries return lightweight rows instead of full ORM instances.
+DISPLAY_COLUMNS = (
+    Article.id, Article.published_at, Article.headline, Article.summary,
+    Article.source_url, Article.image_url, Article.source_name, Article.created_at,
+)
+
+# Ranked full-text search, one statement per supported dialect.
+# Pages are keyed on (rank, id); `:after_rank` is NULL for the first page.
+SEARCH_SQL = {
+    'postgresql': """
+        SELECT * FROM (
+            SELECT a.id, a.published_at, a.headline, a.summary, a.source_url,
+                   a.image_url, a.source_name, a.created_at,
+                   ts_rank(a.search_vector, q.query)::float8 AS rank
+            FROM articles a, websearch_to_tsquery('english', :query) AS q(query)
+            WHERE a.search_vector @@ q.query
+        ) ranked
+        WHERE :after_rank IS NULL OR (ranked.rank, ranked.id) < (:after_rank, :after_id)
+        ORDER BY ranked.rank DESC, ranked.id DESC
+        LIMIT :limit
+    """,
+    'sqlite': """
+        SELECT * FROM (
+            SELECT a.id, a.published_at, a.headline, a.summary, a.source_url,
+                   a.image_url, a.source_name, a.created_at,
+                   -bm25(articles_fts, 10.0, 5.0, 1.0) AS rank
+            FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid
+            WHERE articles_fts MATCH :query
+        ) ranked
+        WHERE :after_rank IS NULL OR (ranked.rank, ranked.id) < (:after_rank, :after_id)
+        ORDER BY ranked.rank DESC, ranked.id DESC
+        LIMIT :limit
+    """,
+}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when an `after` cursor cannot be decoded."""
+
 
 class ArticleService:
     """
     A service layer to handle database operations for articles.
+    All queries here are reads, so they go to the read replica when one is configured.
     """
+    @staticmethod
+    def encode_cursor(article):
+        """Builds the opaque `<created_at>,<id>` cursor for an article."""
+        return f"{article.created_at.isoformat()},{article.id}"
+
+    @staticmethod
+    def decode_cursor(cursor: str):
+        """Parses a `<created_at>,<id>` cursor into its keyset values."""
+        try:
+            created_at, article_id = cursor.split(',', 1)
+            return datetime.datetime.fromisoformat(created_at), article_id
+        except (ValueError, AttributeError):
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+
+    @staticmethod
+    def _feed_horizon():
+        if not FEED_HORIZON_DAYS:
+            return None
+        return datetime.datetime.utcnow() - datetime.timedelta(days=FEED_HORIZON_DAYS)
+
+    @staticmethod
+    def _display_query():
+        query = read_session().query(*DISPLAY_COLUMNS)
+        horizon = ArticleService._feed_horizon()
+        return query.filter(Article.created_at >= horizon) if horizon else query
+
+    @staticmethod
+    def _link_filters():
+        # The same horizon on the links' partition key prunes article_categories too
+        horizon = ArticleService._feed_horizon()
+        return [article_categories.c.article_created_at >= horizon] if horizon else []
+
+    @staticmethod
+    def _category_display_query(category_name: str):
+        return ArticleService._display_query() \
+            .join(article_categories, article_categories.c.article_id == Article.id) \
+            .join(Category, Category.id == article_categories.c.category_id) \
+            .filter(Category.category_name == category_name.lower(), *ArticleService._link_filters())
+
+    @staticmethod
+    def _user_feed_query(user_id: int):
+        # EXISTS rather than a join, so an article in several followed categories appears once
+        followed = select(user_categories.c.category_id).where(user_categories.c.user_id == user_id)
+        in_followed_category = exists().where(
+            article_categories.c.article_id == Article.id,
+            article_categories.c.category_id.in_(followed),
+            *ArticleService._link_filters()
+        )
+        return ArticleService._display_query().filter(in_followed_category)
+
+    @staticmethod
+    def _paginate(query, limit: int, after: str = None):
+        """
+        Applies (created_at, id) keyset pagination to an article query.
+        Returns the page and the cursor for the next one (None on the last page).
+        """
+        limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        if after:
+            created_at, article_id = ArticleService.decode_cursor(after)
+            query = query.filter(tuple_(Article.created_at, Article.id) < (created_at, article_id))
+
+        # Fetch one extra row to find out whether another page exists
+        rows = query.order_by(desc(Article.created_at), desc(Article.id)).limit(limit + 1).all()
+        page = rows[:limit]
+        next_cursor = ArticleService.encode_cursor(page[-1]) if len(rows) > limit else None
+        return page, next_cursor
+
     @staticmethod
     def get_all_articles():
-        """Retrieves all articles from the database, newest first."""
+        """Retrieves display rows for all articles, newest first."""
         try:
-            return Article.query.order_by(desc(Article.created_at)).all()
+            return ArticleService._display_query().order_by(desc(Article.created_at)).all()
         except Exception as e:
-            print(f"Error getting all articles: {e}")
+            log_error("read", "Error getting all articles", e)
             return []
 
+    @staticmethod
+    def get_articles_page(limit: int, after: str = None):
+        """Retrieves one keyset page of the main feed, newest first."""
+        try:
+            return ArticleService._paginate(ArticleService._display_query(), limit, after)
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            log_error("read", "Error getting articles page", e)
+            return [], None
+
     @staticmethod
     def get_articles_by_category(category_name: str):
-        """Retrieves all articles for a specific category, newest first."""
+        """Retrieves display rows for all articles in a specific category, newest first."""
         try:
-            return Article.query.join(Article.categories).filter(
-                Category.category_name == category_name.lower()
-            ).order_by(desc(Article.created_at)).all()
+            return ArticleService._category_display_query(category_name) \
+                .order_by(desc(Article.created_at)).all()
         except Exception as e:
-            print(f"Error getting articles for category '{category_name}': {e}")
+            log_error("read", "Error getting articles for category", e, category=category_name)
             return []
 
+    @staticmethod
+    def get_articles_by_category_page(category_name: str, limit: int, after: str = None):
+        """Retrieves one keyset page of articles for a specific category, newest first."""
+        try:
+            return ArticleService._paginate(ArticleService._category_display_query(category_name), limit, after)
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            log_error("read", "Error getting articles page for category", e, category=category_name)
+            return [], None
+
+    @staticmethod
+    def user_exists(user_id: int):
+        return read_session().query(exists().where(User.id == user_id)).scalar()
+
+    @staticmethod
+    def get_user_feed_page(user_id: int, limit: int, after: str = None):
+        """
+        Retrieves one keyset page of articles from every category the user follows,
+        newest first, in a single query.
+        """
+        try:
+            return ArticleService._paginate(ArticleService._user_feed_query(user_id), limit, after)
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            log_error("read", "Error getting feed page", e, user_id=user_id)
+            return [], None
+
+    @staticmethod
+    def _fts5_query(query: str):
+        # Quote every term so user input can't break FTS5 query syntax; terms are ANDed
+        return ' '.join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+    @staticmethod
+    def search_articles(query: str, limit: int, after: str = None):
+        """
+        Ranked full-text search over headline, summary and source name.
+        Returns one page of display rows and the `<rank>,<id>` cursor for the next page.
+        """
+        limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        after_rank, after_id = None, None
+        if after:
+            try:
+                rank, after_id = after.split(',', 1)
+                after_rank = float(rank)
+            except ValueError:
+                raise InvalidCursorError(f"Invalid cursor: {after!r}")
+
+        try:
+            dialect = read_session().get_bind().dialect.name
+            if dialect not in SEARCH_SQL or not query.strip():
+                return [], None
+            if dialect == 'sqlite':
+                query = ArticleService._fts5_query(query)
+
+            statement = text(SEARCH_SQL[dialect]).columns(*DISPLAY_COLUMNS, rank=db.Float)
+            rows = read_session().execute(statement, {
+                "query": query, "after_rank": after_rank, "after_id": after_id, "limit": limit + 1
+            }).all()
+        except Exception as e:
+            read_session().rollback()
+            log_error("read", "Error searching articles", e, query=query)
+            return [], None
+
+        page = rows[:limit]
+        next_cursor = f"{page[-1].rank!r},{page[-1].id}" if len(rows) > limit else None
+        return page, next_cursor
+
     @staticmethod
     def get_all_categories():
         """Retrieves all unique categories from the database."""
         try:
-            return Category.query.order_by(Category.category_name).all()
+            return read_session().query(Category).order_by(Category.category_name).all()
+        except Exception as e:
+            log_error("read", "Error getting all categories", e)
+            return []
+
+    @staticmethod
+    def get_category_stats():
+        """
+        Retrieves every category with its materialized article count, newest
+        article time and follower count, in one primary-key join.
+        Categories without a stats row yet report zero counts.
+        """
+        try:
+            return read_session().query(
+                Category.id, Category.category_name,
+                func.coalesce(CategoryStats.article_count, 0).label('article_count'),
+                CategoryStats.latest_created_at,
+                func.coalesce(CategoryStats.follower_count, 0).label('follower_count'),
+            ).outerjoin(CategoryStats, CategoryStats.category_id == Category.id).order_by(Category.category_name).all()
         except Exception as e:
-            print(f"Error getting all categories: {e}")
+            log_error("read", "Error getting category stats", e)
             return []
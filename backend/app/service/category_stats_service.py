@@ -0,0 +1,144 @@
+from collections import defaultdict
+from sqlalchemy import case, event, func, inspect, select, update
+from ..extensions import db
+from ..models import Article, Category, CategoryStats, User, article_categories, user_categories
+from .db_utils import insert_ignoring_conflicts
+from .generation_service import GenerationService
+
+STATS = CategoryStats.__table__
+
+
+class CategoryStatsService:
+    """
+    Maintains the materialized category_stats rows. Updates run inside the
+    caller's transaction, so the counts commit or roll back with the change
+    they describe. Increments are atomic UPDATEs, safe under concurrent writers.
+    """
+    @staticmethod
+    def _ensure_rows(connection, category_ids):
+        connection.execute(insert_ignoring_conflicts(STATS), [
+            {"category_id": category_id, "article_count": 0, "follower_count": 0} for category_id in category_ids
+        ])
+
+    @classmethod
+    def record_links(cls, category_id: int, created_ats: list):
+        """
+        Counts articles newly linked to a category, given their created_at values,
+        and advances the category's latest_created_at.
+        """
+        if not created_ats:
+            return
+        latest = max((created for created in created_ats if created is not None), default=None)
+        cls._ensure_rows(db.session, [category_id])
+        values = {"article_count": STATS.c.article_count + len(created_ats)}
+        if latest is not None:
+            values["latest_created_at"] = case(
+                (STATS.c.latest_created_at.is_(None), latest),
+                (STATS.c.latest_created_at < latest, latest),
+                else_=STATS.c.latest_created_at,
+            )
+        db.session.execute(update(STATS).where(STATS.c.category_id == category_id).values(**values))
+
+    @classmethod
+    def adjust_followers(cls, connection, deltas: dict):
+        """Applies {category_id: change in followers}."""
+        deltas = {category_id: delta for category_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        cls._ensure_rows(connection, deltas)
+        for category_id, delta in deltas.items():
+            connection.execute(
+                update(STATS).where(STATS.c.category_id == category_id)
+                .values(follower_count=STATS.c.follower_count + delta)
+            )
+
+    @staticmethod
+    def rebuild():
+        """
+        Recomputes every row from article_categories and user_categories, in the
+        caller's transaction. Used to backfill the table and after bulk deletes.
+        """
+        articles = {
+            category_id: (count, latest) for category_id, count, latest in db.session.execute(
+                select(article_categories.c.category_id, func.count(), func.max(Article.created_at))
+                .join(Article, Article.id == article_categories.c.article_id)
+                .group_by(article_categories.c.category_id)
+            )
+        }
+        followers = dict(db.session.execute(
+            select(user_categories.c.category_id, func.count()).group_by(user_categories.c.category_id)
+        ).all())
+        rows = [{
+            "category_id": category_id,
+            "article_count": articles.get(category_id, (0, None))[0],
+            "latest_created_at": articles.get(category_id, (0, None))[1],
+            "follower_count": followers.get(category_id, 0),
+        } for category_id in db.session.scalars(select(Category.id))]
+        db.session.execute(STATS.delete())
+        if rows:
+            db.session.execute(STATS.insert(), rows)
+        GenerationService.bump()
+        return len(rows)
+
+
+# --- Follow tracking ---
+# User.categories / Category.users changes made through the ORM are picked up
+# at flush time: the (user, category) pairs are collected before the flush,
+# and applied once new categories have ids. Follows change the personalized
+# feed and the category list, so they also bump the content generation.
+
+def _follow_changes(session):
+    added, removed = set(), set()
+    for obj in session.new | session.dirty:
+        if isinstance(obj, User):
+            history = inspect(obj).attrs.categories.history
+            added.update((obj, category) for category in history.added)
+            removed.update((obj, category) for category in history.deleted)
+        elif isinstance(obj, Category):
+            history = inspect(obj).attrs.users.history
+            added.update((user, obj) for user in history.added)
+            removed.update((user, obj) for user in history.deleted)
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            removed.update((obj, category) for category in obj.categories)
+        elif isinstance(obj, Category):
+            removed.update((user, obj) for user in obj.users)
+    return added - removed, removed - added
+
+
+@event.listens_for(db.session, 'before_flush')
+def _collect_follow_changes(session, flush_context, instances):
+    added, removed = _follow_changes(session)
+    if not added and not removed:
+        return
+    session.info.setdefault('follow_changes', []).append((added, removed))
+    GenerationService.bump()
+    session.info['generation_bumped'] = True
+
+
+@event.listens_for(db.session, 'after_flush')
+def _apply_follow_changes(session, flush_context):
+    changes = session.info.pop('follow_changes', None)
+    if not changes:
+        return
+    deltas = defaultdict(int)
+    for added, removed in changes:
+        for _, category in added:
+            deltas[category] += 1
+        for _, category in removed:
+            deltas[category] -= 1
+    # A deleted category's stats row is removed with it (ON DELETE CASCADE)
+    deltas = {category.id: delta for category, delta in deltas.items() if not inspect(category).deleted}
+    CategoryStatsService.adjust_followers(session.connection(), deltas)
+
+
+@event.listens_for(db.session, 'after_commit')
+def _invalidate_generation(session):
+    if session.info.pop('generation_bumped', False):
+        GenerationService.invalidate()
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard_follow_changes(session):
+    session.info.pop('follow_changes', None)
+    session.info.pop('generation_bumped', None)
@@ -0,0 +1,70 @@
+import os
+import re
+
+# Scraped pages are cut to this many (estimated) tokens before any fingerprinting, caching or LLM call
+MAX_CONTENT_TOKENS = int(os.environ.get("NEWS_CONTENT_MAX_TOKENS", 6000))
+
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_URL_RE = re.compile(r"https?://\S+")
+_SPACE_RE = re.compile(r"\s+")
+_KEY_RE = re.compile(r"\W+", re.UNICODE)
+_BOILERPLATE_RE = re.compile(
+    r"^(©|(advertisement|sponsored( content)?|subscribe|sign up|sign in|log in|share( this)?( article| story)?|"
+    r"read more|related( articles| stories| coverage)?|most (read|popular)|accept( all)? cookies|"
+    r"we use cookies|cookie|all rights reserved|copyright|follow us|skip to( main)? content|"
+    r"newsletter|download (our|the) app|comments?|leave a comment)\b)",
+    re.IGNORECASE,
+)
+# Lines at least this long are treated as article text even if they start like boilerplate
+BOILERPLATE_MAX_WORDS = 12
+# Lines whose text is mostly link labels are navigation menus or "related" lists
+LINK_TEXT_RATIO = 0.6
+
+
+def _clean_line(line: str):
+    """Returns the line's readable text, or None if it is boilerplate."""
+    line = _IMAGE_RE.sub(' ', line)
+    link_chars = sum(len(label) for label in _LINK_RE.findall(line))
+    line = _SPACE_RE.sub(' ', _URL_RE.sub(' ', _LINK_RE.sub(r'\1', line))).strip(' |*#>-•\t')
+    if not line:
+        return None
+    if link_chars and link_chars >= LINK_TEXT_RATIO * len(line):
+        return None
+    words = line.split(' ')
+    if len(words) <= BOILERPLATE_MAX_WORDS and _BOILERPLATE_RE.match(line):
+        return None
+    if len(words) <= 2 and not any(char.isdigit() for char in line):
+        return None
+    return line
+
+
+def prepare_content(raw_content: str, max_tokens: int = None):
+    """
+    Turns scraped page text into prompt-ready article text: drops images, link-heavy
+    navigation lines and common boilerplate, removes repeated paragraphs, and cuts
+    the result to `max_tokens` estimated tokens at a line (or word) boundary.
+    """
+    if not raw_content:
+        return raw_content
+    # Same ~4 characters per token estimate as rate_limit.estimate_tokens()
+    budget = (max_tokens or MAX_CONTENT_TOKENS) * 4
+
+    lines, seen, used = [], set(), 0
+    for raw_line in raw_content.splitlines():
+        line = _clean_line(raw_line)
+        if line is None:
+            continue
+        key = _KEY_RE.sub(' ', line.lower()).strip()
+        if key in seen:
+            continue
+        seen.add(key)
+        if used + len(line) > budget:
+            remaining = budget - used
+            if remaining > 0:
+                lines.append(line[:remaining].rsplit(' ', 1)[0])
+            break
+        lines.append(line)
+        used += len(line) + 1
+    return '\n'.join(lines)
+
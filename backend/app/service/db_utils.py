@@ -0,0 +1,17 @@
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from ..extensions import db
+
+
+def insert_ignoring_conflicts(table):
+    """
+    Builds an INSERT for `table` that silently skips rows violating a unique
+    constraint (`ON CONFLICT DO NOTHING`) on Postgres and SQLite.
+    Other dialects get a plain INSERT.
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgresql.insert(table).on_conflict_do_nothing()
+    if dialect == 'sqlite':
+        return sqlite.insert(table).on_conflict_do_nothing()
+    return insert(table)
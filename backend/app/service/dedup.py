@@ -0,0 +1,152 @@
+import os
+import re
+import hashlib
+import datetime
+import threading
+from collections import OrderedDict
+from ..extensions import db
+from ..models import Article
+from .metrics import log_error
+
+FINGERPRINT_BITS = 64
+
+SHINGLE_SIZE = 3
+# Syndicated copies share their opening; fingerprinting a bounded prefix keeps this fast
+MAX_TOKENS = 3000
+# created_at is set by the inserting worker before its transaction commits, so a row can
+# become visible after rows with a later created_at (and worker clocks can drift apart)
+SYNC_OVERLAP = datetime.timedelta(minutes=5)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# Bit-sliced counting: every fingerprint bit gets its own COUNTER_BITS-wide field in
+# one big integer, so adding a shingle's contribution is 8 table lookups instead of
+# 64 per-bit branches. _SPREAD[k][b] holds byte value b of byte position k spread out.
+COUNTER_BITS = 16
+_SPREAD = [
+    [sum(1 << ((8 * k + i) * COUNTER_BITS) for i in range(8) if b >> i & 1) for b in range(256)]
+    for k in range(FINGERPRINT_BITS // 8)
+]
+_COUNTER_MASK = (1 << COUNTER_BITS) - 1
+
+
+def simhash(text: str):
+    """Computes a 64-bit SimHash over word 3-shingles of the text."""
+    tokens = _TOKEN_RE.findall((text or '').lower())[:MAX_TOKENS]
+    if len(tokens) < SHINGLE_SIZE:
+        tokens = tokens + [''] * (SHINGLE_SIZE - len(tokens))
+
+    shingle_count = len(tokens) - SHINGLE_SIZE + 1
+    counts = 0
+    for i in range(shingle_count):
+        shingle = ' '.join(tokens[i:i + SHINGLE_SIZE]).encode('utf-8')
+        digest = hashlib.blake2b(shingle, digest_size=8).digest()
+        for position, byte in enumerate(digest):
+            counts += _SPREAD[position][byte]
+
+    # A bit is set when more than half of the shingles had it set
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        if 2 * ((counts >> (bit * COUNTER_BITS)) & _COUNTER_MASK) > shingle_count:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def to_signed(fingerprint: int):
+    """Maps an unsigned 64-bit fingerprint into the BIGINT range for storage."""
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def to_unsigned(value: int):
+    return value + (1 << 64) if value < 0 else value
+
+
+def hamming_distance(a: int, b: int):
+    return bin(a ^ b).count('1')
+
+
+def _band_layout(bands: int):
+    """Splits the fingerprint into `bands` contiguous (offset, mask) ranges."""
+    layout, offset = [], 0
+    for band in range(bands):
+        width = FINGERPRINT_BITS // bands + (1 if band < FINGERPRINT_BITS % bands else 0)
+        layout.append((offset, (1 << width) - 1))
+        offset += width
+    return layout
+
+
+class SimHashIndex:
+    """
+    Banded LSH index over the fingerprints of recently stored articles.
+    The fingerprint is cut into max_distance + 1 bands; two fingerprints within
+    max_distance bits must agree exactly on at least one band (pigeonhole), so
+    band lookups find every near-duplicate while comparing only a few candidates.
+    Holds at most `max_entries` fingerprints; the oldest are evicted first.
+    """
+    def __init__(self, max_distance: int = None, window_days: float = None, max_entries: int = None):
+        # Rewording ~1% of a story moves its fingerprint by roughly 3-8 bits;
+        # unrelated articles sit around 32 bits apart.
+        self.max_distance = max_distance if max_distance is not None \
+            else int(os.environ.get("NEWS_DEDUP_MAX_DISTANCE", 6))
+        self.window = datetime.timedelta(days=window_days or float(os.environ.get("NEWS_DEDUP_WINDOW_DAYS", 7)))
+        self.max_entries = max_entries or int(os.environ.get("NEWS_DEDUP_MAX_ENTRIES", 200000))
+        self._lock = threading.Lock()
+        self._layout = _band_layout(self.max_distance + 1)
+        self._bands = [{} for _ in self._layout] # band value -> set of (fingerprint, article_id)
+        self._entries = OrderedDict() # article_id -> fingerprint, oldest first
+        self._synced_until = None
+
+    def _band_values(self, fingerprint: int):
+        return [(fingerprint >> offset) & mask for offset, mask in self._layout]
+
+    def add(self, fingerprint: int, article_id: str):
+        with self._lock:
+            if article_id in self._entries:
+                return
+            for band, value in enumerate(self._band_values(fingerprint)):
+                self._bands[band].setdefault(value, set()).add((fingerprint, article_id))
+            self._entries[article_id] = fingerprint
+            while len(self._entries) > self.max_entries:
+                oldest_id, oldest_fingerprint = self._entries.popitem(last=False)
+                self._remove(oldest_fingerprint, oldest_id)
+
+    def _remove(self, fingerprint: int, article_id: str):
+        entry = (fingerprint, article_id)
+        for band, value in enumerate(self._band_values(fingerprint)):
+            bucket = self._bands[band].get(value)
+            if bucket:
+                bucket.discard(entry)
+                if not bucket:
+                    del self._bands[band][value]
+
+    def find(self, fingerprint: int):
+        """Returns the id of an indexed article within max_distance bits, or None."""
+        with self._lock:
+            for band, value in enumerate(self._band_values(fingerprint)):
+                for candidate, article_id in self._bands[band].get(value, ()):
+                    if hamming_distance(fingerprint, candidate) <= self.max_distance:
+                        return article_id
+        return None
+
+    def sync(self):
+        """
+        Loads fingerprints stored since the last sync (by any worker), so the
+        index covers the dedup window without rescanning it on every run.
+        """
+        since = self._synced_until - SYNC_OVERLAP if self._synced_until \
+            else datetime.datetime.utcnow() - self.window
+        try:
+            rows = db.session.query(Article.simhash, Article.id, Article.created_at).filter(
+                Article.created_at > since, Article.simhash.isnot(None)
+            ).order_by(Article.created_at).all()
+        except Exception as e:
+            db.session.rollback()
+            log_error("dedup", "Error loading article fingerprints", e)
+            return
+        for stored, article_id, created_at in rows:
+            self.add(to_unsigned(stored), article_id)
+            if created_at and (self._synced_until is None or created_at > self._synced_until):
+                self._synced_until = created_at
+        if self._synced_until is None:
+            self._synced_until = datetime.datetime.utcnow() - self.window
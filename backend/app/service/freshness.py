@@ -0,0 +1,65 @@
+import os
+import time
+import datetime
+import threading
+from ..extensions import db
+from ..models import TopicFetchLog
+from .metrics import log_error
+
+
+class FreshnessIndex:
+    """
+    Answers "was this topic processed within the cooldown window?" from a
+    process-local cache in front of the `topic_fetch_log` table.
+
+    A "fresh" answer stays valid until the cooldown ends, since a topic's last
+    run time only moves forward. "Not fresh" answers are only trusted for a few
+    seconds because another worker may have run the topic meanwhile.
+    """
+    def __init__(self, cooldown_minutes: float = None, negative_ttl_seconds: float = None):
+        self.cooldown = datetime.timedelta(
+            minutes=cooldown_minutes or float(os.environ.get("NEWS_REFRESH_COOLDOWN_MINUTES", 30))
+        )
+        self.negative_ttl = negative_ttl_seconds if negative_ttl_seconds is not None \
+            else float(os.environ.get("NEWS_FRESHNESS_CACHE_SECONDS", 5))
+        self._lock = threading.Lock()
+        self._cache = {} # topic -> (last_run_at or None, checked_at monotonic)
+
+    def _is_fresh(self, last_run_at):
+        return last_run_at is not None and last_run_at > datetime.datetime.utcnow() - self.cooldown
+
+    def last_run(self, topic: str, use_cache: bool = True):
+        """Returns when the topic was last processed, or None if it never was."""
+        if use_cache:
+            with self._lock:
+                cached = self._cache.get(topic)
+            if cached:
+                last_run_at, checked_at = cached
+                if self._is_fresh(last_run_at) or time.monotonic() - checked_at < self.negative_ttl:
+                    return last_run_at
+
+        entry = db.session.get(TopicFetchLog, topic)
+        last_run_at = entry.last_run_at if entry else None
+        with self._lock:
+            self._cache[topic] = (last_run_at, time.monotonic())
+        return last_run_at
+
+    def is_fresh(self, topic: str, use_cache: bool = True):
+        """Returns (fresh, last_run_at) for the topic."""
+        last_run_at = self.last_run(topic, use_cache)
+        return self._is_fresh(last_run_at), last_run_at
+
+    def record(self, topic: str, outcome: str, fetched_count: int = 0, stored_count: int = 0):
+        """Logs a finished run; every outcome, including empty and failed runs, starts a new cooldown."""
+        now = datetime.datetime.utcnow()
+        try:
+            db.session.merge(TopicFetchLog(
+                topic=topic, last_run_at=now, outcome=outcome,
+                fetched_count=fetched_count, stored_count=stored_count
+            ))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            log_error("freshness_record", "Error recording fetch log", e, topic=topic)
+        with self._lock:
+            self._cache[topic] = (now, time.monotonic())
@@ -0,0 +1,66 @@
+import os
+import time
+import datetime
+import threading
+from sqlalchemy import update
+from ..extensions import db
+from ..database import read_session
+from ..models import ContentGeneration
+from .metrics import log_error
+
+GENERATION_ROW_ID = 1
+
+
+class GenerationService:
+    """
+    Reads and bumps the global content generation counter.
+    Reads are memoized per process for a couple of seconds, so a burst of
+    feed requests costs at most one primary-key lookup per interval.
+    """
+    _lock = threading.Lock()
+    _memo = None # (generation, updated_at, fetched_at monotonic)
+    memo_seconds = float(os.environ.get("CONTENT_GENERATION_CACHE_SECONDS", 2))
+
+    @classmethod
+    def current(cls):
+        """Returns (generation, updated_at) of the stored content."""
+        with cls._lock:
+            memo = cls._memo
+        if memo and time.monotonic() - memo[2] < cls.memo_seconds:
+            return memo[0], memo[1]
+
+        # Read from the same database as the feeds, so a lagging replica yields an
+        # older generation instead of caching stale feeds under a newer one
+        session = read_session()
+        try:
+            row = session.get(ContentGeneration, GENERATION_ROW_ID)
+            generation, updated_at = (row.generation, row.updated_at) if row else (0, None)
+        except Exception as e:
+            session.rollback()
+            log_error("generation", "Error reading content generation", e)
+            return (memo[0], memo[1]) if memo else (0, None)
+
+        with cls._lock:
+            cls._memo = (generation, updated_at, time.monotonic())
+        return generation, updated_at
+
+    @classmethod
+    def bump(cls):
+        """
+        Increments the counter inside the caller's transaction; it becomes
+        visible to readers when the caller commits.
+        """
+        now = datetime.datetime.utcnow()
+        result = db.session.execute(
+            update(ContentGeneration)
+            .where(ContentGeneration.id == GENERATION_ROW_ID)
+            .values(generation=ContentGeneration.generation + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            db.session.add(ContentGeneration(id=GENERATION_ROW_ID, generation=1, updated_at=now))
+
+    @classmethod
+    def invalidate(cls):
+        """Drops the memoized value; call after committing a bump so this process sees it at once."""
+        with cls._lock:
+            cls._memo = None
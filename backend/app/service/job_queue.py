@@ -0,0 +1,107 @@
+import os
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .metrics import log_error
+
+# Job lifecycle states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class Job:
+    """A single pipeline run tracked by the JobQueue."""
+    def __init__(self, topic: str):
+        self.id = str(uuid.uuid4())
+        self.topic = topic
+        self.status = QUEUED
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.http_status = None
+
+    @property
+    def is_finished(self):
+        return self.finished_at is not None
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "topic": self.topic,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "http_status": self.http_status,
+            "result": self.result,
+        }
+
+
+class JobQueue:
+    """
+    In-process job queue backed by a worker pool.
+    Submitting a topic that already has a queued or running job returns
+    that job instead of starting a second pipeline run.
+    """
+    def __init__(self, max_workers: int = None, retention_seconds: int = None):
+        max_workers = max_workers or int(os.environ.get("NEWS_JOB_WORKERS", 2))
+        self.retention_seconds = retention_seconds or int(os.environ.get("NEWS_JOB_RETENTION_SECONDS", 3600))
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="news-job")
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._active_by_topic = {}
+
+    def submit(self, app, topic: str, fn):
+        """
+        Enqueues `fn(topic)` to run inside an app context.
+        Returns (job, created) where `created` is False if the call coalesced onto an active job.
+        """
+        with self._lock:
+            self._prune()
+            active_id = self._active_by_topic.get(topic)
+            if active_id:
+                return self._jobs[active_id], False
+
+            job = Job(topic)
+            self._jobs[job.id] = job
+            self._active_by_topic[topic] = job.id
+
+        self._executor.submit(self._run, app, job, fn)
+        return job, True
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, app, job: Job, fn):
+        with self._lock:
+            job.started_at = time.time()
+            job.status = RUNNING
+        try:
+            with app.app_context():
+                result, http_status = fn(job.topic)
+            status = COMPLETED
+        except Exception as e:
+            log_error("job", "Pipeline job failed", e, job_id=job.id, topic=job.topic)
+            result, http_status, status = {"status": "error", "message": "Pipeline run failed."}, 500, FAILED
+        finally:
+            with self._lock:
+                # Published together, and the status last, so pollers and _prune
+                # never see a finished status without finished_at and the result
+                job.result, job.http_status = result, http_status
+                job.finished_at = time.time()
+                job.status = status
+                if self._active_by_topic.get(job.topic) == job.id:
+                    del self._active_by_topic[job.topic]
+
+    def _prune(self):
+        """Forgets finished jobs older than the retention window. Caller holds the lock."""
+        cutoff = time.time() - self.retention_seconds
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.is_finished and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
@@ -0,0 +1,72 @@
+import os
+import json
+import hashlib
+import datetime
+from ..extensions import db
+from ..models import LLMCacheEntry
+from .db_utils import insert_ignoring_conflicts
+from .metrics import log_error, LLM_CACHE_LOOKUPS
+
+# Bump these whenever the matching prompt changes, so stale results are not reused
+SUMMARY_PROMPT_VERSION = "summary-v1"
+VALIDATION_PROMPT_VERSION = "validation-v1"
+# Verdicts from the combined summarize-and-self-check batch prompt
+SELF_CHECK_PROMPT_VERSION = "self-check-v1"
+
+
+class LLMCache:
+    """
+    Persistent cache of LLM results stored in the `llm_cache` table.
+    Entries older than the TTL are ignored on read and purged on write.
+    """
+    def __init__(self, ttl_hours: float = None):
+        self.ttl = datetime.timedelta(hours=ttl_hours or float(os.environ.get("LLM_CACHE_TTL_HOURS", 24 * 7)))
+
+    @staticmethod
+    def make_key(prompt_version: str, *parts: str):
+        """Hashes the prompt version and the prompt inputs into a cache key."""
+        digest = hashlib.sha256(prompt_version.encode('utf-8'))
+        for part in parts:
+            digest.update(b'\0')
+            digest.update((part or '').encode('utf-8'))
+        return digest.hexdigest()
+
+    def _cutoff(self):
+        return datetime.datetime.utcnow() - self.ttl
+
+    def get_many(self, kind: str, keys: list):
+        """Returns {key: value} for every unexpired entry of one kind among `keys`, in a single query."""
+        keys = set(key for key in keys if key)
+        if not keys:
+            return {}
+        try:
+            rows = db.session.query(LLMCacheEntry.cache_key, LLMCacheEntry.value).filter(
+                LLMCacheEntry.cache_key.in_(keys),
+                LLMCacheEntry.created_at >= self._cutoff()
+            ).all()
+            LLM_CACHE_LOOKUPS.inc(len(rows), kind=kind, result="hit")
+            LLM_CACHE_LOOKUPS.inc(len(keys) - len(rows), kind=kind, result="miss")
+            return {key: json.loads(value) for key, value in rows}
+        except Exception as e:
+            db.session.rollback()
+            log_error("llm_cache", "Error reading LLM cache", e, kind=kind)
+            return {}
+
+    def put_many(self, kind: str, entries: dict):
+        """Stores {key: value} results of one kind and purges expired entries."""
+        if not entries:
+            return
+        try:
+            db.session.query(LLMCacheEntry).filter(
+                LLMCacheEntry.created_at < self._cutoff()
+            ).delete(synchronize_session=False)
+            db.session.execute(
+                insert_ignoring_conflicts(LLMCacheEntry.__table__),
+                [{"cache_key": key, "kind": kind, "value": json.dumps(value),
+                  "created_at": datetime.datetime.utcnow()}
+                 for key, value in entries.items()]
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            log_error("llm_cache", "Error writing LLM cache", e, kind=kind)
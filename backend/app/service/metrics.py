@@ -0,0 +1,197 @@
+import os
+import json
+import time
+import logging
+import functools
+import threading
+
+# Latency buckets in seconds, from fast cached reads up to slow LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in list(zip(names, values)) + list(extra)]
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter, optionally split by labels."""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values, optionally split by labels."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._values = {} # labels -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def samples(self):
+        with self._lock:
+            values = {key: list(state) for key, state in self._values.items()}
+        for key, state in sorted(values.items()):
+            for bound, count in zip(self.buckets, state):
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', bound)])} {count}"
+            yield f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', '+Inf')])} {state[-1]}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {state[-1]}"
+
+
+class Registry:
+    """
+    Process-local metric registry rendered in the Prometheus text format.
+    Collectors are callables returning extra (name, kind, documentation, samples)
+    families computed at scrape time, e.g. from the rate limiters.
+    """
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()):
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        self._collectors.append(collector)
+
+    def render(self):
+        families = [(metric.name, metric.kind, metric.documentation, metric.samples()) for metric in self._metrics]
+        for collector in self._collectors:
+            families.extend(collector())
+        lines = []
+        for name, kind, documentation, samples in families:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+# --- Pipeline metrics ---
+STAGE_SECONDS = REGISTRY.histogram(
+    "news_pipeline_stage_seconds", "Time spent in each news pipeline stage or LLM call.", ("stage",))
+STAGE_ERRORS = REGISTRY.counter(
+    "news_pipeline_stage_errors_total", "Errors raised or handled in each news pipeline stage.", ("stage",))
+PIPELINE_RUNS = REGISTRY.counter(
+    "news_pipeline_runs_total", "process_topic calls by result status.", ("status",))
+PIPELINE_ARTICLES = REGISTRY.counter(
+    "news_pipeline_articles_total", "Articles counted at each pipeline step.", ("step",))
+LLM_TOKENS = REGISTRY.counter(
+    "news_llm_tokens_total", "LLM tokens by stage and direction (estimated when the SDK reports no usage).",
+    ("stage", "direction"))
+LLM_CACHE_LOOKUPS = REGISTRY.counter(
+    "news_llm_cache_lookups_total", "LLM result cache lookups by kind and result.", ("kind", "result"))
+
+# --- HTTP metrics ---
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_seconds", "HTTP request latency by endpoint, method and status.", ("endpoint", "method", "status"))
+RESPONSE_CACHE_LOOKUPS = REGISTRY.counter(
+    "http_response_cache_lookups_total", "Cached GET endpoint outcomes (hit, miss, not_modified).", ("result",))
+RESPONSE_COMPRESSIONS = REGISTRY.counter(
+    "http_response_compressions_total", "Response bodies compressed, by encoding and source (cached or live).",
+    ("encoding", "source"))
+
+
+# --- Structured logging ---
+logger = logging.getLogger("news_man")
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {"ts": round(record.created, 3), "level": record.levelname.lower(), "logger": record.name}
+        payload.update(getattr(record, "fields", None) or {"message": record.getMessage()})
+        return json.dumps(payload, default=str)
+
+
+def configure_logging():
+    """Sends the news_man logger to stderr as one JSON object per line (LOG_LEVEL, default INFO)."""
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+    logger.addHandler(handler)
+    logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+
+
+def log_event(event: str, level: int = logging.INFO, **fields):
+    logger.log(level, event, extra={"fields": {"event": event, **fields}})
+
+
+def log_error(stage: str, message: str, error: Exception = None, **fields):
+    """Counts an error against `stage` and logs it as a structured event."""
+    STAGE_ERRORS.inc(stage=stage)
+    if error is not None:
+        fields["error"] = f"{type(error).__name__}: {error}"
+    log_event("error", logging.ERROR, stage=stage, message=message, **fields)
+
+
+class stage_timer:
+    """Context manager / decorator recording a stage's latency, and counting exceptions that escape it."""
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        STAGE_SECONDS.observe(time.perf_counter() - self._start, stage=self.stage)
+        if exc_type is not None:
+            STAGE_ERRORS.inc(stage=self.stage)
+        return False
+
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage_timer(self.stage):
+                return fn(*args, **kwargs)
+        return wrapper
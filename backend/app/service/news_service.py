@@ -1,94 +1,418 @@
 import os
 import json
+import time
 import uuid
 import datetime
-from tavily import TavilyClient
-import google.generativeai as genai
-from sqlalchemy import desc
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from ..extensions import db
 # --- CORRECTED IMPORTS ---
 # This now imports from your central models/__init__.py file,
 # which fixes the circular dependency error.
-from ..models import Article, Category
+from ..models import Article, ArticleUrl, Category, article_categories
+from .topic_lock import SingleFlight, advisory_lock
+from .db_utils import insert_ignoring_conflicts
+from .dedup import SimHashIndex, simhash, hamming_distance, to_signed, to_unsigned
+from .freshness import FreshnessIndex
+from .generation_service import GenerationService
+from .category_stats_service import CategoryStatsService
+from .progress import ProgressHub
+from .llm_cache import LLMCache, SUMMARY_PROMPT_VERSION, VALIDATION_PROMPT_VERSION, SELF_CHECK_PROMPT_VERSION
+from .rate_limit import get_limiter, estimate_tokens
+from .pipeline_run import PipelineRun
+from .partitions import ensure_partitions_periodically
+from .metrics import stage_timer, log_event, log_error, LLM_TOKENS, PIPELINE_RUNS, PIPELINE_ARTICLES
+
+# How long past the LLM deadline a pool waits for requests that were already in flight
+LLM_DEADLINE_GRACE_SECONDS = 5
 
 class NewsService:
-    def __init__(self):
-        self.tavily_client = TavilyClient(api_key=os.environ.get("TAVILY_API_KEY"))
-        genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
-        summarization_config = {"response_mime_type": "application/json"}
-        self.summarization_model = genai.GenerativeModel("gemini-2.5-flash", generation_config=summarization_config)
-        self.validation_model = genai.GenerativeModel("gemini-2.5-flash")
-        self.raw_content_map = {}
+    def __init__(self, tavily_client=None, summarization_model=None, validation_model=None):
+        """
+        Clients default to the real Tavily and Gemini SDK clients; benchmarks and
+        offline runs can pass stand-ins with the same search / generate_content methods.
+        The SDKs are only imported and configured when a pipeline first needs them.
+        """
+        self._tavily_client = tavily_client
+        self._summarization_model = summarization_model
+        self._validation_model = validation_model
+        self._clients_lock = threading.Lock()
+        # Process-wide rate limiters, shared by every pipeline run and worker thread
+        self.tavily_limiter = get_limiter("tavily")
+        self.gemini_limiter = get_limiter("gemini-2.5-flash")
+
+        # --- Concurrency settings ---
+        # NEWS_LLM_CONCURRENCY=1 keeps the original one-article-at-a-time behaviour.
+        self.llm_concurrency = max(1, int(os.environ.get("NEWS_LLM_CONCURRENCY", 5)))
+        self.llm_timeout = float(os.environ.get("NEWS_LLM_TIMEOUT_SECONDS", 60))
+        # Budget for each pool task's LLM calls, including waits for rate-limit budget and retries
+        self.llm_deadline = float(os.environ.get("NEWS_LLM_DEADLINE_SECONDS", 2 * self.llm_timeout + 5))
+        self._task_deadline = threading.local()
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.llm_concurrency, thread_name_prefix="news-llm"
+        ) if self.llm_concurrency > 1 else None
+
+        # --- Batching settings ---
+        # NEWS_LLM_BATCH_MODE: "off" (one request per article and stage), "batch" (several
+        # articles per summarization and per validation request) or "combined" (one request
+        # summarizes a batch and self-checks each summary, replacing validation requests).
+        self.batch_mode = os.environ.get("NEWS_LLM_BATCH_MODE", "off").lower()
+        self.batch_token_budget = int(os.environ.get("NEWS_LLM_BATCH_TOKENS", 24000))
+        self.batch_max_items = max(1, int(os.environ.get("NEWS_LLM_BATCH_MAX_ITEMS", 8)))
+
+        # Concurrent process_topic calls for the same topic share one pipeline run
+        self.in_flight = SingleFlight()
+        self.llm_cache = LLMCache()
+        self.freshness = FreshnessIndex()
+        self.dedup_index = SimHashIndex()
+        # Stage and per-article events of in-progress runs, for streaming clients
+        self.progress = ProgressHub()
+
+    # --- Provider clients, created on first use ---
+
+    @property
+    def tavily_client(self):
+        if self._tavily_client is None:
+            with self._clients_lock:
+                if self._tavily_client is None:
+                    from tavily import TavilyClient
+                    self._tavily_client = TavilyClient(api_key=os.environ.get("TAVILY_API_KEY"))
+        return self._tavily_client
+
+    def _init_gemini_models(self):
+        with self._clients_lock:
+            if self._summarization_model is None or self._validation_model is None:
+                import google.generativeai as genai
+                genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
+                if self._summarization_model is None:
+                    summarization_config = {"response_mime_type": "application/json"}
+                    self._summarization_model = genai.GenerativeModel("gemini-2.5-flash", generation_config=summarization_config)
+                if self._validation_model is None:
+                    self._validation_model = genai.GenerativeModel("gemini-2.5-flash")
+
+    @property
+    def summarization_model(self):
+        if self._summarization_model is None:
+            self._init_gemini_models()
+        return self._summarization_model
+
+    @property
+    def validation_model(self):
+        if self._validation_model is None:
+            self._init_gemini_models()
+        return self._validation_model
 
     def process_topic(self, topic_name: str):
         """
         Main public method to run the entire pipeline for a given topic.
         Includes caching check, fetch, summarize, validate, and store.
+        Concurrent callers for the same topic wait for and share a single run.
         """
         # --- CACHING LOGIC ---
+        # Cheap process-local check first, so most repeat requests never touch the lock
         recently_fetched, message = self._is_recently_fetched(topic_name)
         if recently_fetched:
+            PIPELINE_RUNS.inc(status="skipped")
             return {"status": "skipped", "message": message}, 429 # 429 Too Many Requests
 
+        result, status_code = self.in_flight.do(topic_name, lambda: self._process_topic_locked(topic_name))
+        PIPELINE_RUNS.inc(status=result.get("status"))
+        return result, status_code
+
+    def _process_topic_locked(self, topic_name: str):
+        """Runs the pipeline while holding the cross-worker lock for this topic."""
+        with advisory_lock(f"news:process:{topic_name}") as waited:
+            # Re-checked against the table under the lock, so a worker that waited sees the other worker's run
+            recently_fetched, message = self._is_recently_fetched(topic_name, use_cache=False)
+            if recently_fetched and waited:
+                return {"status": "coalesced", "message": "This topic was just refreshed by another request."}, 200
+            if recently_fetched:
+                return {"status": "skipped", "message": message}, 429 # 429 Too Many Requests
+
+            try:
+                return self._run_pipeline(topic_name)
+            except Exception:
+                self.freshness.record(topic_name, "failed")
+                raise
+
+    @stage_timer("pipeline")
+    def _run_pipeline(self, topic_name: str):
+        """
+        Runs the pipeline for a topic that is due for a refresh, publishing its
+        progress events to self.progress. Returns (result, status_code).
+        """
+        try:
+            # Stores need this month's partition; cheap after the first check
+            ensure_partitions_periodically(db.engine)
+        except Exception as e:
+            log_error("partitions", "Could not create upcoming partitions", e, topic=topic_name)
+        self.progress.begin(topic_name)
+        try:
+            for event in self._pipeline_events(topic_name):
+                if event["event"] == "complete":
+                    return event["result"], event["status_code"]
+                self.progress.publish(topic_name, event)
+        finally:
+            self.progress.end(topic_name)
+
+    def _pipeline_events(self, topic_name: str):
+        """
+        Fetch -> Summarize -> Validate -> Store as a generator of progress events.
+        Each article is committed as soon as it passes validation and is followed
+        by an "article" event, so readers see the first articles long before the
+        slowest one is done. The last event is "complete", carrying the result.
+
+        Raw content lives in a per-run PipelineRun and is released article by
+        article, so concurrent runs never share or outlive each other's pages.
+        """
+        with PipelineRun(topic_name) as run:
+            yield from self._run_events(topic_name, run)
+
+    def _run_events(self, topic_name: str, run: PipelineRun):
         # Step 1: Fetch
-        raw_articles = self._fetch_raw_articles(topic_name)
+        yield {"event": "stage", "stage": "fetch", "status": "started"}
+        raw_articles = self._fetch_raw_articles(topic_name, run)
+        yield {"event": "stage", "stage": "fetch", "status": "done", "count": len(raw_articles),
+               "over_budget": run.over_budget}
         if not raw_articles:
-            return {"status": "success", "message": "No new articles found from provider."}, 200
-        
-        # Step 2: Summarize
-        summarized_articles = self._summarize_articles(raw_articles)
+            self.freshness.record(topic_name, "empty")
+            result = {"status": "success", "message": "No new articles found from provider."}
+            if run.over_budget_urls:
+                result["over_budget_urls"] = run.over_budget_urls
+            yield {"event": "complete", "status_code": 200, "result": result}
+            return
+
+        # Skip LLM work entirely for URLs we have already stored;
+        # those articles are still linked to this topic below
+        new_articles, stored_article_ids = self._drop_stored_articles(raw_articles)
+
+        # Drop syndicated copies before any LLM call; a copy of a stored
+        # story links the stored (canonical) article to this topic instead
+        unique_articles, canonical_ids = self._drop_near_duplicates(new_articles, run)
+        stored_article_ids = stored_article_ids + canonical_ids
+        unique_urls = {article.get('url') for article in unique_articles}
+        run.release(*(article.get('url') for article in raw_articles if article.get('url') not in unique_urls))
+        yield {"event": "stage", "stage": "dedup", "status": "done", "count": len(unique_articles)}
+
+        stored_count, linked_count, failed_stores = 0, 0, 0
+        if stored_article_ids:
+            storage_result = self._store_articles([], topic_name, stored_article_ids)
+            linked_count += storage_result.get("existing_articles_linked", 0)
+            failed_stores += "error" in storage_result
+            yield {"event": "stage", "stage": "link_existing", "status": "done", "count": linked_count}
+
+        # Steps 2-4: Summarize, validate and store each article as it completes
+        yield {"event": "stage", "stage": "summarize", "status": "started", "count": len(unique_articles)}
+        summarized_count, validated_count = 0, 0
+        for summarized, is_valid in self._summarized_stream(unique_articles, run):
+            summarized_count += 1
+            # Nothing needs this article's page any more
+            run.release(summarized.get('source_url'))
+            if not is_valid:
+                continue
+            validated_count += 1
+            storage_result = self._store_articles([summarized], topic_name)
+            if "error" in storage_result:
+                failed_stores += 1
+                continue
+            stored_count += storage_result["new_articles_stored"]
+            linked_count += storage_result["existing_articles_linked"]
+            for row in storage_result["stored_articles"]:
+                yield {"event": "article", "article": self._article_event(row)}
+        yield {"event": "stage", "stage": "store", "status": "done", "count": stored_count}
+
+        self.freshness.record(
+            topic_name, "failed" if failed_stores and not stored_count else "stored",
+            fetched_count=len(raw_articles), stored_count=stored_count
+        )
 
-        # Step 3: Validate
-        validated_articles = self._validate_articles(summarized_articles)
+        metrics = {
+            "initial_fetch_count": len(raw_articles) + run.over_budget,
+            "over_budget_count": run.over_budget,
+            "already_stored_count": len(raw_articles) - len(new_articles),
+            "near_duplicate_count": len(new_articles) - len(unique_articles),
+            "summarized_count": summarized_count,
+            "validated_count": validated_count,
+            "newly_stored_count": stored_count,
+            "linked_existing_count": linked_count
+        }
+        for step, count in metrics.items():
+            PIPELINE_ARTICLES.inc(count, step=step[:-len("_count")])
+        log_event("pipeline_complete", topic=topic_name, content_peak_bytes=run.peak_bytes, **metrics)
+        result = {"status": "pipeline_complete", "metrics": metrics}
+        if run.over_budget_urls:
+            # Dropped by the content cap; reported so callers can see what the run skipped
+            result["over_budget_urls"] = run.over_budget_urls
+        yield {"event": "complete", "status_code": 200, "result": result}
 
-        # Step 4: Store
-        storage_result = self._store_articles(validated_articles, topic_name)
+    def _summarized_stream(self, articles: list, run: PipelineRun):
+        """Yields (summarized_article, is_valid) for every article that got a summary, in completion order."""
+        if self.batch_mode in ("batch", "combined"):
+            # Several articles per LLM request; results arrive together
+            summarized_articles, validated_articles = self._summarize_and_validate_batched(articles, run)
+        elif self.executor:
+            # Each article is summarized and validated in its own pool task
+            yield from self._summarize_and_validate(articles, run)
+            return
+        else:
+            summarized_articles = self._summarize_articles(articles, run)
+            validated_articles = self._validate_articles(summarized_articles, run)
+        validated = {id(article) for article in validated_articles}
+        for summarized in summarized_articles:
+            yield summarized, id(summarized) in validated
 
+    @staticmethod
+    def _article_event(row: dict):
+        """Shapes a stored article row like the ArticleDisplay DTO."""
+        published_at = row.get("published_at")
         return {
-            "status": "pipeline_complete",
-            "metrics": {
-                "initial_fetch_count": len(raw_articles),
-                "summarized_count": len(summarized_articles),
-                "validated_count": len(validated_articles),
-                "newly_stored_count": storage_result.get("new_articles_stored", 0)
-            }
-        }, 200
+            "id": row["id"], "published_at": published_at.isoformat() if published_at else None,
+            "headline": row.get("headline"), "summary": row.get("summary"), "source_url": row.get("source_url"),
+            "image_url": row.get("image_url"), "source_name": row.get("source_name"),
+        }
 
-    def _is_recently_fetched(self, topic_name: str):
+    @stage_timer("freshness_check")
+    def _is_recently_fetched(self, topic_name: str, use_cache: bool = True):
         """
-        Checks if articles for a given category have been fetched in the last 30 minutes.
+        Checks if the topic was processed within the cooldown window (30 minutes by default),
+        whatever the outcome of that run.
         """
-        thirty_minutes_ago = datetime.datetime.utcnow() - datetime.timedelta(minutes=30)
-        
-        # Find the most recent article fetched for this category
-        most_recent_article = Article.query \
-            .join(Article.categories) \
-            .filter(Category.category_name == topic_name) \
-            .order_by(desc(Article.created_at)) \
-            .first()
-
-        if most_recent_article and most_recent_article.created_at > thirty_minutes_ago:
-            time_since = (datetime.datetime.utcnow() - most_recent_article.created_at).seconds // 60
+        recently_fetched, last_run_at = self.freshness.is_fresh(topic_name, use_cache)
+        if recently_fetched:
+            time_since = int((datetime.datetime.utcnow() - last_run_at).total_seconds()) // 60
             return True, f"This topic was updated {time_since} minutes ago. Please try again later."
-            
+
         return False, None
 
-    def _fetch_raw_articles(self, topic: str, max_results: int = 5):
+    @stage_timer("fetch")
+    def _fetch_raw_articles(self, topic: str, run: PipelineRun, max_results: int = 5):
+        """Searches Tavily for the topic; the run takes the raw content, within its memory cap."""
         try:
             query = f"latest top {max_results} news articles about {topic}"
-            response = self.tavily_client.search(query=query, search_depth="advanced", max_results=max_results, include_raw_content=True)
-            self.raw_content_map = {item['url']: item['raw_content'] for item in response.get('results', [])}
-            return response.get('results', [])
+            response = self.tavily_limiter.call(
+                self.tavily_client.search,
+                query=query, search_depth="advanced", max_results=max_results, include_raw_content=True
+            )
+            return run.admit(response.get('results', []))
         except Exception as e:
-            print(f"Error fetching from Tavily: {e}")
+            log_error("fetch", "Error fetching from Tavily", e, topic=topic)
             return []
 
-    def _summarize_articles(self, articles: list):
-        summarized_articles = []
+    @staticmethod
+    def _find_stored_ids(urls):
+        """Maps each already-stored source URL to its article id, using a single IN query."""
+        if not urls:
+            return {}
+        return dict(db.session.query(Article.source_url, Article.id).filter(Article.source_url.in_(set(urls))))
+
+    @staticmethod
+    def _find_created_at(article_ids):
+        """Maps each stored article id to its created_at; ids of missing (e.g. archived) articles are left out."""
+        if not article_ids:
+            return {}
+        return dict(db.session.query(Article.id, Article.created_at).filter(Article.id.in_(set(article_ids))))
+
+    @stage_timer("lookup_stored")
+    def _drop_stored_articles(self, articles: list):
+        """
+        Splits fetched articles into ones we still need to process and the ids of ones already stored.
+        Returns (new_articles, stored_article_ids).
+        """
+        try:
+            stored = self._find_stored_ids([article.get('url') for article in articles if article.get('url')])
+        except Exception as e:
+            db.session.rollback()
+            log_error("lookup_stored", "Error checking for stored articles", e)
+            return articles, []
+        new_articles = [article for article in articles if article.get('url') not in stored]
+        return new_articles, list(stored.values())
+
+    @stage_timer("dedup")
+    def _drop_near_duplicates(self, articles: list, run: PipelineRun):
+        """
+        Fingerprints each article's raw content and drops near-duplicates of recently
+        stored articles or of earlier articles in the same batch.
+        Returns (unique_articles, canonical_article_ids).
+        """
+        self.dedup_index.sync()
+        unique_articles, canonical_ids, batch_fingerprints = [], [], []
         for article in articles:
-            try:
-                raw_content = self.raw_content_map.get(article.get('url'))
-                if not raw_content: continue
+            content = run.content(article.get('url'))
+            if not content:
+                unique_articles.append(article)
+                continue
+            fingerprint = simhash(content)
+            canonical_id = self.dedup_index.find(fingerprint)
+            if canonical_id:
+                canonical_ids.append(canonical_id)
+                continue
+            if any(hamming_distance(fingerprint, other) <= self.dedup_index.max_distance for other in batch_fingerprints):
+                continue
+            batch_fingerprints.append(fingerprint)
+            unique_articles.append({**article, "simhash": fingerprint})
+        return unique_articles, canonical_ids
+
+    # --- LLM result cache helpers ---
+    # Lookups and writes happen in bulk on the calling thread; pool tasks only see the results.
+
+    @staticmethod
+    def _summary_key(raw_content: str):
+        return LLMCache.make_key(SUMMARY_PROMPT_VERSION, raw_content) if raw_content else None
+
+    @staticmethod
+    def _validation_key(raw_content: str, summary: str, prompt_version: str = VALIDATION_PROMPT_VERSION):
+        return LLMCache.make_key(prompt_version, raw_content, summary) if raw_content and summary else None
+
+    @staticmethod
+    def _summary_fields(processed_article: dict):
+        return {field: processed_article.get(field) for field in ('headline', 'summary', 'published_at', 'source_name')}
+
+    def _cache_summaries(self, keys: list, cached: dict, results: list):
+        self.llm_cache.put_many('summary', {
+            key: self._summary_fields(result) for key, result in zip(keys, results)
+            if key and result is not None and key not in cached
+        })
+
+    def _cache_verdicts(self, keys: list, cached: dict, verdicts: list):
+        self.llm_cache.put_many('validation', {
+            key: verdict for key, verdict in zip(keys, verdicts)
+            if key and verdict is not None and key not in cached
+        })
+
+    def _generate(self, model, prompt: str, stage: str):
+        """Calls Gemini through the rate limiter, recording latency and token usage under `stage`."""
+        deadline = getattr(self._task_deadline, 'value', None)
+
+        def request():
+            # Sized per attempt, after any wait for budget, so no request outlives the task's deadline
+            timeout = self.llm_timeout if deadline is None else \
+                max(1.0, min(self.llm_timeout, deadline - time.monotonic()))
+            return model.generate_content(prompt, request_options={"timeout": timeout})
+
+        with stage_timer(stage):
+            response = self.gemini_limiter.call(request, tokens=estimate_tokens(prompt), deadline=deadline)
+        usage = getattr(response, 'usage_metadata', None)
+        LLM_TOKENS.inc(getattr(usage, 'prompt_token_count', None) or estimate_tokens(prompt), stage=stage, direction="prompt")
+        LLM_TOKENS.inc(getattr(usage, 'candidates_token_count', None) or estimate_tokens(response.text),
+                       stage=stage, direction="completion")
+        return response
+
+    @staticmethod
+    def _summary_result(article: dict, summary_data: dict):
+        return {
+            "title": article.get('title'), "headline": summary_data.get('headline'),
+            "source_url": article.get('url'), "summary": summary_data.get('summary'),
+            "published_at": summary_data.get('published_at'), "source_name": summary_data.get('source_name'),
+            "simhash": article.get('simhash')
+        }
+
+    def _summarize_one(self, article: dict, raw_content: str, cached: dict = None):
+        """Summarizes a single article, reusing a cached result if given. Returns None on failure."""
+        try:
+            if not raw_content: return None
+            if cached is not None:
+                summary_data = cached
+            else:
                 prompt = f"""
                 You are a neutral news editor. Process the following article.
                 Article: --- {raw_content} ---
@@ -99,67 +423,399 @@ class NewsService:
                 4. Extract the name of the news source.
                 Provide the output as a valid JSON object.
                 """
-                response = self.summarization_model.generate_content(prompt)
+                response = self._generate(self.summarization_model, prompt, "summarize")
                 summary_data = json.loads(response.text)
-                processed_article = {
-                    "title": article.get('title'), "headline": summary_data.get('headline'),
-                    "source_url": article.get('url'), "summary": summary_data.get('summary'),
-                    "published_at": summary_data.get('published_at'), "source_name": summary_data.get('source_name')
-                }
-                summarized_articles.append(processed_article)
-            except Exception as e:
-                print(f"Error summarizing article {article.get('url')}: {e}")
-        return summarized_articles
-
-    def _validate_articles(self, summarized_articles: list):
-        validated_articles = []
-        for article in summarized_articles:
+            return self._summary_result(article, summary_data)
+        except Exception as e:
+            log_error("summarize", "Error summarizing article", e, url=article.get('url'))
+            return None
+
+    def _validate_one(self, article: dict, original_content: str, cached: bool = None):
+        """
+        Asks the validation model whether a summary is faithful to its source.
+        Returns True/False, or None if no verdict could be obtained.
+        """
+        try:
+            if not article.get('summary') or not article.get('source_url'): return None
+            if not original_content: return None
+            if cached is not None:
+                return cached
+            validation_prompt = f"Based ONLY on the Original Article Text, is the Summary factually accurate? Answer only YES or NO.\nOriginal Text: ---{original_content}---\nSummary: ---{article['summary']}---"
+            response = self._generate(self.validation_model, validation_prompt, "validate")
+            return "YES" in response.text.upper()
+        except Exception as e:
+            log_error("validate", "Error validating article", e, url=article.get('source_url'))
+            return None
+
+    def _summarize_and_validate_one(self, article: dict, raw_content: str, cached_summary: dict = None, cached_verdict: bool = None):
+        """Runs summarize -> validate for one article; used as a single pool task."""
+        summarized = self._summarize_one(article, raw_content, cached_summary)
+        if summarized is None:
+            return None, None
+        return summarized, self._validate_one(summarized, raw_content, cached_verdict)
+
+    def _with_deadline(self, deadline: float, fn, *args):
+        """Runs a pool task with `deadline` applied to every LLM call it makes."""
+        self._task_deadline.value = deadline
+        try:
+            return fn(*args)
+        finally:
+            self._task_deadline.value = None
+
+    def _run_in_pool(self, fn, items: list):
+        """
+        Fans `fn(*item)` out over the executor and returns the results in input order.
+        Tasks still running after the LLM deadline are dropped.
+        """
+        deadline = time.monotonic() + self.llm_deadline
+        futures = [self.executor.submit(self._with_deadline, deadline, fn, *item) for item in items]
+        # LLM calls stop waiting and retrying at the deadline; the grace covers requests in flight
+        done, not_done = wait(futures, timeout=self.llm_deadline + LLM_DEADLINE_GRACE_SECONDS)
+        for future in not_done:
+            future.cancel()
+        if not_done:
+            log_error("llm_deadline", "Dropped LLM tasks that exceeded the pipeline deadline", dropped=len(not_done))
+        return [future.result() if future in done else None for future in futures]
+
+    def _summarize_articles(self, articles: list, run: PipelineRun):
+        contents = [run.content(article.get('url')) for article in articles]
+        keys = [self._summary_key(content) for content in contents]
+        cached = self.llm_cache.get_many('summary', keys)
+        items = [(article, content, cached.get(key)) for article, content, key in zip(articles, contents, keys)]
+        if self.executor:
+            results = self._run_in_pool(self._summarize_one, items)
+        else:
+            results = [self._summarize_one(*item) for item in items]
+        self._cache_summaries(keys, cached, results)
+        return [result for result in results if result is not None]
+
+    def _validate_articles(self, summarized_articles: list, run: PipelineRun):
+        contents = [run.content(article.get('source_url')) for article in summarized_articles]
+        keys = [self._validation_key(content, article.get('summary'))
+                for article, content in zip(summarized_articles, contents)]
+        cached = self.llm_cache.get_many('validation', keys)
+        items = [(article, content, cached.get(key)) for article, content, key in zip(summarized_articles, contents, keys)]
+        if self.executor:
+            verdicts = self._run_in_pool(self._validate_one, items)
+        else:
+            verdicts = [self._validate_one(*item) for item in items]
+        self._cache_verdicts(keys, cached, verdicts)
+        return [article for article, is_valid in zip(summarized_articles, verdicts) if is_valid]
+
+    def _summarize_and_validate(self, articles: list, run: PipelineRun):
+        """
+        Pipelined concurrent mode: each article is summarized and then validated
+        inside one pool task, so validation never waits for the slowest summary.
+        Yields (summarized_article, is_valid) as each task completes; results are
+        cached once the stream is exhausted. An article's content is no longer
+        referenced here once its task is done.
+        """
+        contents = [run.content(article.get('url')) for article in articles]
+        summary_keys = [self._summary_key(content) for content in contents]
+        cached_summaries = self.llm_cache.get_many('summary', summary_keys)
+        # Verdicts can only be looked up ahead of time for summaries we already had
+        cached_verdicts = self.llm_cache.get_many('validation', [
+            self._validation_key(content, cached_summaries[key].get('summary'))
+            for content, key in zip(contents, summary_keys) if key in cached_summaries
+        ])
+
+        deadline = time.monotonic() + self.llm_deadline
+        futures = {}
+        for index, (article, content, key) in enumerate(zip(articles, contents, summary_keys)):
+            cached_summary = cached_summaries.get(key)
+            verdict_key = self._validation_key(content, cached_summary.get('summary')) if cached_summary else None
+            future = self.executor.submit(
+                self._with_deadline, deadline, self._summarize_and_validate_one,
+                article, content, cached_summary, cached_verdicts.get(verdict_key)
+            )
+            futures[future] = index
+
+        summaries, verdicts, verdict_keys = [None] * len(articles), [None] * len(articles), [None] * len(articles)
+        pending = set(futures)
+        while pending:
+            # Waits against the tasks' own deadline, so time the consumer spends between
+            # yields is not counted and tasks that finished meanwhile are never dropped
+            done, pending = wait(pending, timeout=max(0, deadline + LLM_DEADLINE_GRACE_SECONDS - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                index = futures[future]
+                summarized, verdict = future.result()
+                if summarized is not None:
+                    summaries[index], verdicts[index] = summarized, verdict
+                    verdict_keys[index] = self._validation_key(contents[index], summarized.get('summary'))
+                contents[index] = None
+                if summarized is not None:
+                    yield summarized, bool(verdict)
+        if pending:
+            for future in pending:
+                future.cancel()
+            log_error("llm_deadline", "Dropped LLM tasks that exceeded the pipeline deadline", dropped=len(pending))
+
+        self._cache_summaries(summary_keys, cached_summaries, summaries)
+        self._cache_verdicts(verdict_keys, cached_verdicts, verdicts)
+
+    # --- Batched LLM requests ---
+
+    def _map_tasks(self, fn, items: list):
+        """Runs `fn(*item)` for every item, over the executor when there is one."""
+        if self.executor:
+            return self._run_in_pool(fn, items)
+        return [fn(*item) for item in items]
+
+    def _pack_batches(self, indexes: list, sizes: list):
+        """
+        Greedily groups indexes, in order, into batches of at most batch_max_items
+        whose estimated token sizes fit batch_token_budget. An oversized item gets a batch of its own.
+        """
+        batches, batch, used = [], [], 0
+        for index, size in zip(indexes, sizes):
+            if batch and (used + size > self.batch_token_budget or len(batch) >= self.batch_max_items):
+                batches.append(batch)
+                batch, used = [], 0
+            batch.append(index)
+            used += size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _parse_batch_response(text: str, count: int, is_valid):
+        """
+        Maps the 1-based "id" of each entry in a JSON array response to the entry.
+        Only well-formed entries are kept, so the rest can fall back to per-article requests.
+        """
+        try:
+            data = json.loads(text)
+        except (TypeError, ValueError):
+            return {}
+        if isinstance(data, dict):
+            # Some responses wrap the array in an object
+            data = next((value for value in data.values() if isinstance(value, list)), [])
+        parsed = {}
+        for entry in data if isinstance(data, list) else []:
+            if not isinstance(entry, dict):
+                continue
             try:
-                if not article.get('summary') or not article.get('source_url'): continue
-                original_content = self.raw_content_map.get(article['source_url'])
-                if not original_content: continue
-                validation_prompt = f"Based ONLY on the Original Article Text, is the Summary factually accurate? Answer only YES or NO.\nOriginal Text: ---{original_content}---\nSummary: ---{article['summary']}---"
-                response = self.validation_model.generate_content(validation_prompt)
-                if "YES" in response.text.upper():
-                    validated_articles.append(article)
-            except Exception as e:
-                print(f"Error validating article {article.get('title')}: {e}")
-        return validated_articles
-
-    def _store_articles(self, validated_articles: list, topic_name: str):
-        new_articles_count = 0
+                position = int(entry.get('id')) - 1
+            except (TypeError, ValueError):
+                continue
+            if 0 <= position < count and position not in parsed and is_valid(entry):
+                parsed[position] = entry
+        return parsed
+
+    @staticmethod
+    def _is_summary_entry(entry: dict):
+        return isinstance(entry.get('headline'), str) and isinstance(entry.get('summary'), str) \
+            and bool(entry['summary'].strip())
+
+    def _summarize_batch(self, articles: list, raw_contents: list, self_check: bool = False):
+        """
+        Summarizes several articles in one JSON-mode request.
+        Returns {position: summary entry} for the entries that came back well-formed.
+        """
+        try:
+            sections = "\n".join(f"Article {i}: --- {content} ---" for i, content in enumerate(raw_contents, 1))
+            self_check_field = (
+                '\n- "faithful": true if, re-reading the article, every statement in your summary '
+                'is supported by it, otherwise false.'
+            ) if self_check else ""
+            prompt = f"""
+            You are a neutral news editor. Process each of the following {len(articles)} articles independently.
+            {sections}
+            Based ONLY on each article, return a JSON array with one object per article containing:
+            - "id": the article number.
+            - "headline": a compelling, neutral, and short headline.
+            - "summary": a single, concise paragraph that summarizes the key points.
+            - "published_at": the publication date in 'YYYY-MM-DD' format (or null).
+            - "source_name": the name of the news source.{self_check_field}
+            """
+            response = self._generate(self.summarization_model, prompt, "summarize_batch")
+            return self._parse_batch_response(response.text, len(articles), self._is_summary_entry)
+        except Exception as e:
+            log_error("summarize_batch", "Error summarizing a batch of articles", e, batch_size=len(articles))
+            return {}
+
+    def _validate_batch(self, summarized_articles: list, raw_contents: list):
+        """
+        Validates several summaries in one JSON-mode request.
+        Returns {position: verdict} for the verdicts that came back well-formed.
+        """
         try:
-            # Find or create the category for this topic
-            category = Category.query.filter_by(category_name=topic_name).first()
-            if not category:
-                category = Category(category_name=topic_name)
-                db.session.add(category)
-            
+            sections = "\n".join(
+                f"Item {i}:\nOriginal Text: ---{content}---\nSummary: ---{article['summary']}---"
+                for i, (article, content) in enumerate(zip(summarized_articles, raw_contents), 1)
+            )
+            prompt = (
+                "For each item, based ONLY on its Original Article Text, is its Summary factually accurate?\n"
+                f"{sections}\n"
+                'Return a JSON array with one object per item: {"id": <item number>, "accurate": true or false}.'
+            )
+            response = self._generate(self.summarization_model, prompt, "validate_batch")
+            parsed = self._parse_batch_response(
+                response.text, len(summarized_articles), lambda entry: isinstance(entry.get('accurate'), bool)
+            )
+            return {position: entry['accurate'] for position, entry in parsed.items()}
+        except Exception as e:
+            log_error("validate_batch", "Error validating a batch of summaries", e, batch_size=len(summarized_articles))
+            return {}
+
+    def _summarize_and_validate_batched(self, articles: list, run: PipelineRun):
+        """
+        Batched mode: summaries come from one request per batch of articles and
+        verdicts from one request per batch of summaries. In "combined" mode the
+        summarization request also self-checks each summary, so validation requests
+        are only needed for cached summaries. Items a batch response omits or mangles
+        fall back to per-article requests.
+        Returns (summarized_articles, validated_articles).
+        """
+        self_check = self.batch_mode == "combined"
+        verdict_version = SELF_CHECK_PROMPT_VERSION if self_check else VALIDATION_PROMPT_VERSION
+        contents = [run.content(article.get('url')) for article in articles]
+
+        # Summaries: cached, else batched, else one request per article
+        summary_keys = [self._summary_key(content) for content in contents]
+        cached_summaries = self.llm_cache.get_many('summary', summary_keys)
+        summaries = [self._summary_result(article, cached_summaries[key]) if key in cached_summaries else None
+                     for article, key in zip(articles, summary_keys)]
+        self_checked = {}
+        pending = [i for i, content in enumerate(contents) if content and summaries[i] is None]
+        batches = self._pack_batches(pending, [estimate_tokens(contents[i]) for i in pending])
+        responses = self._map_tasks(self._summarize_batch, [
+            ([articles[i] for i in batch], [contents[i] for i in batch], self_check) for batch in batches
+        ])
+        for batch, parsed in zip(batches, responses):
+            for position, index in enumerate(batch):
+                entry = (parsed or {}).get(position)
+                if entry is None:
+                    continue
+                summaries[index] = self._summary_result(articles[index], entry)
+                if isinstance(entry.get('faithful'), bool):
+                    self_checked[index] = entry['faithful']
+        fallback = [i for i in pending if summaries[i] is None]
+        for index, result in zip(fallback, self._map_tasks(self._summarize_one, [(articles[i], contents[i]) for i in fallback])):
+            summaries[index] = result
+        self._cache_summaries(summary_keys, cached_summaries, summaries)
+
+        # Verdicts: cached, else self-checked, else batched, else one request per summary
+        verdict_keys = [self._validation_key(content, summarized.get('summary'), verdict_version) if summarized else None
+                        for content, summarized in zip(contents, summaries)]
+        cached_verdicts = self.llm_cache.get_many('validation', verdict_keys)
+        verdicts = [cached_verdicts.get(key, self_checked.get(i)) for i, key in enumerate(verdict_keys)]
+        pending = [i for i, summarized in enumerate(summaries) if summarized is not None and verdicts[i] is None]
+        batches = self._pack_batches(pending, [
+            estimate_tokens(contents[i]) + estimate_tokens(summaries[i].get('summary')) for i in pending
+        ])
+        responses = self._map_tasks(self._validate_batch, [
+            ([summaries[i] for i in batch], [contents[i] for i in batch]) for batch in batches
+        ])
+        for batch, parsed in zip(batches, responses):
+            for position, index in enumerate(batch):
+                verdicts[index] = (parsed or {}).get(position)
+        fallback = [i for i in pending if verdicts[i] is None]
+        for index, verdict in zip(fallback, self._map_tasks(self._validate_one, [(summaries[i], contents[i]) for i in fallback])):
+            verdicts[index] = verdict
+        self._cache_verdicts(verdict_keys, cached_verdicts, verdicts)
+
+        summarized_articles = [summarized for summarized in summaries if summarized is not None]
+        validated_articles = [summarized for summarized, verdict in zip(summaries, verdicts)
+                              if summarized is not None and verdict]
+        return summarized_articles, validated_articles
+
+    @staticmethod
+    def _parse_published_at(date_str):
+        if date_str and str(date_str).lower() != 'null':
+            try:
+                return datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
+            except (ValueError, TypeError):
+                return None
+        return None
+
+    def _get_or_create_category_id(self, topic_name: str):
+        """
+        Creates the category if needed (safe against concurrent creators).
+        Returns its id and whether this call created it.
+        """
+        result = db.session.execute(insert_ignoring_conflicts(Category.__table__).values(category_name=topic_name))
+        return db.session.query(Category.id).filter_by(category_name=topic_name).scalar(), result.rowcount > 0
+
+    @stage_timer("store")
+    def _store_articles(self, validated_articles: list, topic_name: str, existing_article_ids: list = ()):
+        """
+        Bulk-stores validated articles and links them, plus any already-stored
+        articles, to the topic's category in a single transaction.
+        """
+        try:
+            category_id, category_created = self._get_or_create_category_id(topic_name)
+
+            # One row per URL; the unique source_url constraint settles races with other runs
+            rows = {}
             for article_data in validated_articles:
-                exists = Article.query.filter_by(source_url=article_data['source_url']).first()
-                if not exists:
-                    pub_date = None
-                    date_str = article_data.get('published_at')
-                    if date_str and str(date_str).lower() != 'null':
-                        try:
-                            pub_date = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-                        except (ValueError, TypeError):
-                            pub_date = None
-                    
-                    new_article = Article(
-                        id=str(uuid.uuid4()), title=article_data.get('title'),
-                        headline=article_data.get('headline'), summary=article_data.get('summary'),
-                        source_url=article_data.get('source_url'), published_at=pub_date,
-                        source_name=article_data.get('source_name')
+                rows.setdefault(article_data['source_url'], {
+                    "id": str(uuid.uuid4()), "title": article_data.get('title'),
+                    "headline": article_data.get('headline'), "summary": article_data.get('summary'),
+                    "source_url": article_data['source_url'],
+                    "published_at": self._parse_published_at(article_data.get('published_at')),
+                    "source_name": article_data.get('source_name'),
+                    "simhash": to_signed(article_data['simhash']) if article_data.get('simhash') is not None else None
+                })
+
+            inserted, created_at = {}, {}
+            if rows:
+                # URLs are claimed first; with a partitioned articles table this is the
+                # only cross-month uniqueness check, so only claimed rows are inserted
+                claimed = set(db.session.execute(
+                    insert_ignoring_conflicts(ArticleUrl.__table__)
+                    .values([{"source_url": url, "article_id": row["id"]} for url, row in rows.items()])
+                    .returning(ArticleUrl.source_url)
+                ).scalars())
+                if claimed:
+                    result = db.session.execute(
+                        insert_ignoring_conflicts(Article.__table__)
+                        .values([row for url, row in rows.items() if url in claimed])
+                        .returning(Article.id, Article.source_url, Article.created_at)
                     )
-                    # Associate the article with its category
-                    new_article.categories.append(category)
-                    db.session.add(new_article)
-                    new_articles_count += 1
-            
+                    for article_id, url, created in result:
+                        inserted[url], created_at[article_id] = article_id, created
+
+            # URLs another run stored in the meantime still get linked to this category
+            conflicted = self._find_stored_ids([url for url in rows if url not in inserted])
+            linked_existing_ids = set(existing_article_ids) | set(conflicted.values())
+            # Links carry the article's created_at, the partition key of article_categories
+            created_at.update(self._find_created_at(linked_existing_ids))
+
+            newly_linked = []
+            if created_at:
+                newly_linked = db.session.execute(
+                    insert_ignoring_conflicts(article_categories)
+                    .values([{"article_id": article_id, "category_id": category_id, "article_created_at": created}
+                             for article_id, created in created_at.items()])
+                    .returning(article_categories.c.article_id, article_categories.c.article_created_at)
+                ).all()
+                # Same transaction, so the category's counts never drift from its links
+                CategoryStatsService.record_links(category_id, [created for _, created in newly_linked])
+            # Existing articles that were already in this category are not counted as linked
+            existing_linked = sum(1 for article_id, _ in newly_linked if article_id in linked_existing_ids)
+
+            # New content invalidates ETags and cached feed responses once this commits.
+            # Runs where every row already existed leave the generation (and its row lock) alone.
+            changed = bool(category_created or inserted or newly_linked)
+            if changed:
+                GenerationService.bump()
             db.session.commit()
-            return {"status": "success", "new_articles_stored": new_articles_count}
+            if changed:
+                GenerationService.invalidate()
+            for url, article_id in inserted.items():
+                if rows[url]["simhash"] is not None:
+                    self.dedup_index.add(to_unsigned(rows[url]["simhash"]), article_id)
+            return {
+                "status": "success",
+                "new_articles_stored": len(inserted),
+                "existing_articles_linked": existing_linked,
+                "stored_articles": [{**rows[url], "id": article_id} for url, article_id in inserted.items()]
+            }
         except Exception as e:
             db.session.rollback()
-            print(f"Database error during storage: {e}")
+            log_error("store", "Database error during storage", e, topic=topic_name)
             return {"error": "Failed to store articles in the database."}
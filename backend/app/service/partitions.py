@@ -0,0 +1,152 @@
+import os
+import re
+import gzip
+import time
+import datetime
+import threading
+from sqlalchemy import text
+
+# --- Monthly range partitions of articles and article_categories (Postgres only) ---
+# Both tables are partitioned on the article's creation time, so an article and
+# its category links always live in the same month, and a month can be detached,
+# archived and dropped as a unit. Partitions are named <table>_pYYYY_MM.
+
+# (table, partition key column), parents first: links reference articles
+PARTITIONED_TABLES = (("articles", "created_at"), ("article_categories", "article_created_at"))
+# Partitions created ahead of time; there is no default partition, so inserts need them
+MONTHS_AHEAD = int(os.environ.get("PARTITION_MONTHS_AHEAD", 3))
+# How often each process re-checks, from the pipeline, that the coming months have partitions
+CHECK_SECONDS = float(os.environ.get("PARTITION_CHECK_SECONDS", 6 * 3600))
+
+_check_lock = threading.Lock()
+_last_check = None # monotonic time of this process's last successful check
+
+_PARTITION_RE = re.compile(r"^(?P<table>\w+)_p(?P<year>\d{4})_(?P<month>\d{2})$")
+
+
+def month_start(value):
+    return datetime.date(value.year, value.month, 1)
+
+
+def add_months(month: datetime.date, count: int):
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: datetime.date):
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def parse_partition_name(name: str):
+    """Returns (table, month) for a partition name, or None."""
+    match = _PARTITION_RE.match(name)
+    if not match:
+        return None
+    return match.group("table"), datetime.date(int(match.group("year")), int(match.group("month")), 1)
+
+
+def is_partitioned(connection, table: str = "articles"):
+    return connection.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = :table AND pg_table_is_visible(c.oid))"
+    ), {"table": table}).scalar()
+
+
+def create_month(connection, month: datetime.date):
+    """Creates the month's partition of every partitioned table, if missing."""
+    upper = add_months(month, 1)
+    for table, _ in PARTITIONED_TABLES:
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        ))
+
+
+def ensure_partitions(connection, first_month: datetime.date = None, months_ahead: int = None):
+    """
+    Creates monthly partitions from `first_month` (default: this month) up to
+    `months_ahead` months after the current one. Returns the months covered.
+    """
+    # Serializes concurrent maintainers (workers, retention.py) until the caller commits
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('news:partitions'))"))
+    current = month_start(datetime.datetime.utcnow())
+    month = first_month or current
+    last = add_months(current, MONTHS_AHEAD if months_ahead is None else months_ahead)
+    months = []
+    while month <= last:
+        create_month(connection, month)
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def ensure_partitions_periodically(engine):
+    """
+    Runs ensure_partitions() at most once per CHECK_SECONDS in this process, so
+    inserts keep finding a partition even when `retention.py maintain` is not
+    scheduled. Does nothing on other dialects or unpartitioned tables.
+    """
+    global _last_check
+    if engine.dialect.name != 'postgresql':
+        return
+    with _check_lock:
+        if _last_check is not None and time.monotonic() - _last_check < CHECK_SECONDS:
+            return
+        with engine.begin() as connection:
+            if is_partitioned(connection):
+                ensure_partitions(connection)
+        _last_check = time.monotonic()
+
+
+def attached_partitions(connection, table: str):
+    """Returns {month: partition name} for the table's attached monthly partitions."""
+    rows = connection.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :table AND pg_table_is_visible(p.oid)"
+    ), {"table": table}).scalars()
+    return {parsed[1]: name for name in rows if (parsed := parse_partition_name(name)) and parsed[0] == table}
+
+
+def detached_partitions(connection, table: str):
+    """Returns {month: table name} for monthly tables of `table` that are no longer attached."""
+    rows = connection.execute(text(
+        "SELECT c.relname FROM pg_class c "
+        "WHERE c.relkind = 'r' AND c.relname LIKE :pattern AND pg_table_is_visible(c.oid) "
+        "AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid)"
+    ), {"pattern": f"{table}_p%"}).scalars()
+    return {parsed[1]: name for name in rows if (parsed := parse_partition_name(name)) and parsed[0] == table}
+
+
+def detach_month(connection, month: datetime.date):
+    """
+    Detaches the month from both tables: links first, dropping their foreign key
+    to the articles parent, so the articles partition can then be detached too.
+    The month's URL claims are released, so those stories may be stored again.
+    """
+    articles, links = (partition_name(table, month) for table, _ in PARTITIONED_TABLES)
+    if month in attached_partitions(connection, "article_categories"):
+        connection.execute(text(f"ALTER TABLE article_categories DETACH PARTITION {links}"))
+    for constraint in connection.execute(text(
+        "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:table) AND contype = 'f'"
+    ), {"table": links}).scalars():
+        connection.execute(text(f'ALTER TABLE {links} DROP CONSTRAINT "{constraint}"'))
+    if month in attached_partitions(connection, "articles"):
+        connection.execute(text(f"ALTER TABLE articles DETACH PARTITION {articles}"))
+    connection.execute(text(f"DELETE FROM article_urls u USING {articles} a WHERE u.article_id = a.id"))
+
+
+def archive_table(raw_connection, table: str, directory: str):
+    """Writes the table to <directory>/<table>.csv.gz (CSV with a header row) and returns the path."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{table}.csv.gz")
+    partial = path + ".partial"
+    cursor = raw_connection.cursor()
+    try:
+        with gzip.open(partial, "wb") as archive:
+            cursor.copy_expert(f"COPY {table} TO STDOUT WITH (FORMAT csv, HEADER)", archive)
+    finally:
+        cursor.close()
+    # Only complete archives get the final name
+    os.replace(partial, path)
+    return path
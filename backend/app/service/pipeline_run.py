@@ -0,0 +1,78 @@
+import os
+import sys
+import logging
+from .content_prep import prepare_content
+from .metrics import log_event
+
+# Memory a single pipeline run may hold in trimmed article text. With at most
+# NEWS_JOB_WORKERS runs in flight, this bounds the pipeline's content memory per process.
+MAX_RUN_CONTENT_BYTES = int(os.environ.get("NEWS_RUN_MAX_CONTENT_BYTES", 2 * 1024 * 1024))
+
+
+class PipelineRun:
+    """
+    State of one pipeline run: the trimmed raw content of each fetched article,
+    keyed by URL. Content is released as soon as its article is stored, rejected
+    or dropped, and everything left is released when the run closes.
+
+    Articles whose content would push the run over `max_content_bytes` are not
+    admitted. Their URLs are kept in `over_budget_urls` and reported in the run
+    summary; they are not retried until the topic is next refreshed.
+    """
+    def __init__(self, topic: str, max_content_bytes: int = None):
+        self.topic = topic
+        self.max_content_bytes = max_content_bytes or MAX_RUN_CONTENT_BYTES
+        self.held_bytes = 0
+        self.peak_bytes = 0
+        self.over_budget_urls = []
+        self._contents = {} # url -> trimmed raw content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    @property
+    def over_budget(self):
+        return len(self.over_budget_urls)
+
+    def admit(self, articles: list):
+        """
+        Takes ownership of each fetched article's raw content, trimmed once here so
+        fingerprints, cache keys and prompts all see the same text. The untrimmed
+        page is removed from the provider's response as soon as it is trimmed.
+        Returns the admitted articles, without their raw content.
+        """
+        admitted, over_budget = [], []
+        for article in articles:
+            content = prepare_content(article.pop('raw_content', None))
+            size = sys.getsizeof(content) if content else 0
+            if self.held_bytes + size > self.max_content_bytes:
+                over_budget.append(article.get('url'))
+                continue
+            if content and article.get('url'):
+                self.release(article['url'])
+                self._contents[article['url']] = content
+                self.held_bytes += size
+                self.peak_bytes = max(self.peak_bytes, self.held_bytes)
+            admitted.append(article)
+        if over_budget:
+            self.over_budget_urls.extend(over_budget)
+            log_event("run_content_over_budget", logging.WARNING, topic=self.topic, skipped=len(over_budget),
+                      urls=over_budget, held_bytes=self.held_bytes, max_content_bytes=self.max_content_bytes)
+        return admitted
+
+    def content(self, url: str):
+        return self._contents.get(url)
+
+    def release(self, *urls):
+        for url in urls:
+            content = self._contents.pop(url, None)
+            if content is not None:
+                self.held_bytes -= sys.getsizeof(content)
+
+    def close(self):
+        self._contents.clear()
+        self.held_bytes = 0
@@ -0,0 +1,53 @@
+import queue
+import threading
+
+
+class ProgressHub:
+    """
+    Fans pipeline progress events out to in-process subscribers, per topic.
+
+    Events of the run currently in progress are buffered, so a subscriber that
+    joins mid-run first receives everything it missed. Subscribers that stop
+    reading are not waited on: their queues are simply bounded.
+    """
+    def __init__(self, max_queued_events: int = 1000):
+        self.max_queued_events = max_queued_events
+        self._lock = threading.Lock()
+        self._subscribers = {} # topic -> set of queues
+        self._active_runs = {} # topic -> events published so far in the current run
+
+    def begin(self, topic: str):
+        with self._lock:
+            self._active_runs[topic] = []
+
+    def end(self, topic: str):
+        with self._lock:
+            self._active_runs.pop(topic, None)
+
+    def publish(self, topic: str, event: dict):
+        with self._lock:
+            if topic in self._active_runs:
+                self._active_runs[topic].append(event)
+            subscribers = list(self._subscribers.get(topic, ()))
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                pass
+
+    def subscribe(self, topic: str):
+        """Returns a queue that receives the current run's events so far, then every new event."""
+        subscriber = queue.Queue(maxsize=self.max_queued_events)
+        with self._lock:
+            for event in self._active_runs.get(topic, ()):
+                subscriber.put_nowait(event)
+            self._subscribers.setdefault(topic, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, topic: str, subscriber):
+        with self._lock:
+            subscribers = self._subscribers.get(topic)
+            if subscribers:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[topic]
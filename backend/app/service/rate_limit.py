@@ -0,0 +1,252 @@
+import os
+import time
+import random
+import threading
+from collections import Counter
+from .metrics import REGISTRY
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call cannot get rate-limit budget within its wait limit."""
+
+
+class CircuitOpenError(Exception):
+    """Raised when a provider's circuit breaker is open and calls are being shed."""
+
+
+def estimate_tokens(text: str):
+    """Cheap token estimate (~4 characters per token) used for TPM budgeting."""
+    return max(1, len(text or '') // 4)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate_per_minute`."""
+    def __init__(self, rate_per_minute: float, capacity: float = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount: float = 1, timeout: float = None):
+        """
+        Takes `amount` tokens, sleeping until they are available.
+        Returns False straight away if they cannot be available within `timeout` seconds.
+        """
+        amount = min(amount, self.capacity)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return True
+                needed = (amount - self._tokens) / self.rate
+            if deadline is not None and time.monotonic() + needed > deadline:
+                return False
+            time.sleep(needed)
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and sheds calls for
+    `reset_seconds`; then lets a single trial call through (half-open).
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self):
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def cancel_trial(self):
+        """Gives back a half-open trial that was allowed but never made."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+def is_throttled(error: Exception):
+    """Recognises provider throttling / overload errors across the Tavily and Gemini SDKs."""
+    status = getattr(error, 'code', None) or getattr(error, 'status_code', None) \
+        or getattr(getattr(error, 'response', None), 'status_code', None)
+    if status in (429, 503):
+        return True
+    if type(error).__name__ in ('ResourceExhausted', 'TooManyRequests', 'ServiceUnavailable', 'UsageLimitExceededError'):
+        return True
+    message = str(error).lower()
+    return '429' in message or 'rate limit' in message or 'quota' in message
+
+
+class ProviderLimiter:
+    """
+    Client-side rate limiting for one provider/model: request-per-minute and
+    token-per-minute buckets, retries with exponential backoff and full jitter
+    on throttling, and a circuit breaker. Counters are exposed via snapshot().
+    """
+    def __init__(self, name: str, rpm: float, tpm: float = None, max_retries: int = 4,
+                 base_delay: float = 1.0, max_delay: float = 30.0, max_wait: float = 60.0,
+                 failure_threshold: int = 5, reset_seconds: float = 30):
+        self.name = name
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+        self._lock = threading.Lock()
+        self._counters = Counter()
+
+    def _count(self, key: str, amount: float = 1):
+        with self._lock:
+            self._counters[key] += amount
+
+    def _acquire(self, tokens: int, deadline: float = None):
+        start = time.monotonic()
+        # Both buckets share one wait limit, cut short by the caller's deadline
+        limit = start + self.max_wait if deadline is None else min(start + self.max_wait, deadline)
+        if limit <= start or not self.requests.acquire(1, timeout=limit - start) or \
+                (self.tokens and not self.tokens.acquire(tokens, timeout=limit - time.monotonic())):
+            self._count("budget_rejections")
+            raise RateLimitExceeded(f"{self.name}: no rate-limit budget within {max(0, limit - start):.1f}s")
+        self._count("wait_seconds", time.monotonic() - start)
+
+    def call(self, fn, *args, tokens: int = 0, deadline: float = None, **kwargs):
+        """
+        Calls `fn(*args, **kwargs)` within this provider's limits.
+        With a `deadline` (a time.monotonic() value), no attempt starts, and no
+        wait for budget or backoff runs, past it; `fn` itself is not interrupted.
+        """
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow():
+                self._count("circuit_rejections")
+                raise CircuitOpenError(f"{self.name}: circuit open, shedding call")
+
+            try:
+                self._acquire(tokens, deadline)
+            except RateLimitExceeded:
+                self.breaker.cancel_trial()
+                raise
+            self._count("requests")
+            self._count("tokens", tokens)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not is_throttled(e):
+                    self._count("failures")
+                    self.breaker.record_failure()
+                    raise
+                self._count("throttled")
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                if attempt == self.max_retries or (deadline is not None and time.monotonic() + delay >= deadline):
+                    self._count("failures")
+                    self.breaker.record_failure()
+                    raise
+                self._count("retries")
+                time.sleep(delay)
+                continue
+            self._count("successes")
+            self.breaker.record_success()
+            return result
+
+    def snapshot(self):
+        with self._lock:
+            counters = dict(self._counters)
+        return {"provider": self.name, "circuit": self.breaker.state, **counters}
+
+
+# --- Shared limiters ---
+# One limiter per provider/model per process, shared by every NewsService
+# instance. Budgets are per process: divide provider quotas by the number of
+# processes that run pipelines.
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+PROVIDER_DEFAULTS = {
+    # name: (env prefix, default RPM, default TPM)
+    "tavily": ("TAVILY", 100, None),
+    "gemini-2.5-flash": ("GEMINI", 60, 250000),
+}
+
+
+def get_limiter(name: str):
+    """Returns the process-wide limiter for a provider/model, configured from the environment."""
+    with _limiters_lock:
+        if name not in _limiters:
+            prefix, rpm, tpm = PROVIDER_DEFAULTS.get(name, (name.upper().replace('-', '_'), 60, None))
+            tpm = os.environ.get(f"{prefix}_TPM", tpm)
+            _limiters[name] = ProviderLimiter(
+                name,
+                rpm=float(os.environ.get(f"{prefix}_RPM", rpm)),
+                tpm=float(tpm) if tpm else None,
+                max_retries=int(os.environ.get(f"{prefix}_MAX_RETRIES", 4)),
+                max_wait=float(os.environ.get(f"{prefix}_MAX_WAIT_SECONDS", 60)),
+            )
+        return _limiters[name]
+
+
+def all_limiters():
+    with _limiters_lock:
+        return list(_limiters.values())
+
+
+def _collect_metrics():
+    """Scrape-time metric families built from every limiter's snapshot."""
+    events, waits, circuits = [], [], []
+    for snapshot in (limiter.snapshot() for limiter in all_limiters()):
+        provider = snapshot.pop("provider").replace('"', '')
+        circuits.append(f'news_provider_circuit_open{{provider="{provider}"}} {int(snapshot.pop("circuit") != CircuitBreaker.CLOSED)}')
+        waits.append(f'news_provider_wait_seconds_total{{provider="{provider}"}} {snapshot.pop("wait_seconds", 0.0)}')
+        events.extend(f'news_provider_events_total{{provider="{provider}",event="{event}"}} {count}'
+                      for event, count in sorted(snapshot.items()))
+    return [
+        ("news_provider_events_total", "counter", "Rate-limited provider calls by event (requests, throttled, retries, ...).", events),
+        ("news_provider_wait_seconds_total", "counter", "Time spent waiting for rate-limit budget.", waits),
+        ("news_provider_circuit_open", "gauge", "1 while the provider circuit breaker is open or half-open.", circuits),
+    ]
+
+
+REGISTRY.register_collector(_collect_metrics)
@@ -0,0 +1,146 @@
+import os
+import time
+import random
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import func
+from ..extensions import db
+from ..models import Category, CategoryTraffic, user_categories
+from .traffic_service import decayed
+from .metrics import log_event, log_error
+
+# One follower counts as much as this many (decayed) recent reads
+FOLLOWER_WEIGHT = float(os.environ.get("SCHEDULER_FOLLOWER_WEIGHT", 10))
+# Minutes added to the pipeline's refresh cooldown to get the shortest interval ever scheduled
+COOLDOWN_MARGIN_MINUTES = float(os.environ.get("SCHEDULER_COOLDOWN_MARGIN_MINUTES", 5))
+
+
+class RefreshScheduler:
+    """
+    Refreshes categories ahead of demand so readers rarely pay pipeline latency.
+
+    Categories are prioritised by followers (user_categories) and recent read
+    traffic (category_traffic). The top category is refreshed every
+    `min_interval`; lower priorities stretch towards `max_interval` in
+    proportion to their score. Every interval is jittered but never shorter
+    than the pipeline's refresh cooldown plus a margin, so scheduled runs are
+    not skipped as too recent. At most
+    `max_concurrency` runs execute at once, and run starts are spaced to stay
+    within `runs_per_minute`, so provider quotas are spent evenly.
+    """
+    def __init__(self, app, news_service, min_interval_minutes: float = None, max_interval_minutes: float = None,
+                 max_concurrency: int = None, runs_per_minute: float = None, jitter: float = None):
+        self.app = app
+        self.news_service = news_service
+        self.min_interval = datetime.timedelta(
+            minutes=min_interval_minutes or float(os.environ.get("SCHEDULER_MIN_INTERVAL_MINUTES", 30)))
+        self.max_interval = datetime.timedelta(
+            minutes=max_interval_minutes or float(os.environ.get("SCHEDULER_MAX_INTERVAL_MINUTES", 360)))
+        self.max_concurrency = max_concurrency or int(os.environ.get("SCHEDULER_MAX_CONCURRENCY", 2))
+        self.runs_per_minute = runs_per_minute or float(os.environ.get("SCHEDULER_RUNS_PER_MINUTE", 6))
+        self.jitter = jitter if jitter is not None else float(os.environ.get("SCHEDULER_JITTER", 0.2))
+        self.shortest_interval = news_service.freshness.cooldown + datetime.timedelta(minutes=COOLDOWN_MARGIN_MINUTES)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="news-refresh")
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self._next_due = {}
+        self._running = set()
+        self._last_dispatch = 0.0
+        self._stop = threading.Event()
+
+    def priorities(self):
+        """Returns [(category_name, score)] for every category, highest priority first."""
+        now = datetime.datetime.utcnow()
+        followers = dict(
+            db.session.query(Category.category_name, func.count(user_categories.c.user_id))
+            .outerjoin(user_categories, user_categories.c.category_id == Category.id)
+            .group_by(Category.id, Category.category_name)
+        )
+        reads = {row.category_name: decayed(row.read_score, row.updated_at, now)
+                 for row in CategoryTraffic.query.all()}
+        scores = [(name, FOLLOWER_WEIGHT * count + reads.get(name, 0.0)) for name, count in followers.items()]
+        return sorted(scores, key=lambda item: item[1], reverse=True)
+
+    def interval_for(self, score: float, top_score: float):
+        if score > 0 and top_score > 0:
+            interval = min(self.max_interval, self.min_interval * (top_score / score))
+        else:
+            interval = self.max_interval
+        return max(self.shortest_interval, interval * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def run_once(self, force: bool = False):
+        """
+        Dispatches every category that is due (or every category, with `force`),
+        in priority order. Returns how many were dispatched.
+        """
+        with self.app.app_context():
+            try:
+                ranked = self.priorities()
+            except Exception as e:
+                db.session.rollback()
+                log_error("scheduler", "Could not load category priorities", e)
+                return 0
+
+        top_score = ranked[0][1] if ranked else 0
+        now = datetime.datetime.utcnow()
+        dispatched = 0
+        for topic, score in ranked:
+            with self._lock:
+                if topic not in self._next_due:
+                    # Spread first runs over one interval instead of firing everything at start-up
+                    self._next_due[topic] = now + self.interval_for(score, top_score) * random.random()
+                if topic in self._running or (self._next_due[topic] > now and not force):
+                    continue
+            if not self._dispatch(topic, score, top_score):
+                break
+            dispatched += 1
+        return dispatched
+
+    def _dispatch(self, topic: str, score: float, top_score: float):
+        # Wait for a free slot and for the start-rate budget
+        while not self._slots.acquire(timeout=1):
+            if self._stop.is_set():
+                return False
+        spacing = 60.0 / self.runs_per_minute
+        wait = self._last_dispatch + spacing - time.monotonic()
+        if wait > 0 and self._stop.wait(wait):
+            self._slots.release()
+            return False
+        self._last_dispatch = time.monotonic()
+
+        with self._lock:
+            self._running.add(topic)
+        self._executor.submit(self._refresh, topic, score, top_score)
+        return True
+
+    def _refresh(self, topic: str, score: float, top_score: float):
+        try:
+            with self.app.app_context():
+                result, status_code = self.news_service.process_topic(topic)
+            log_event("scheduled_refresh", topic=topic, score=round(score, 1), status_code=status_code, status=result.get('status'))
+        except Exception as e:
+            log_error("scheduler", "Scheduled refresh failed", e, topic=topic)
+        finally:
+            with self._lock:
+                self._running.discard(topic)
+                self._next_due[topic] = datetime.datetime.utcnow() + self.interval_for(score, top_score)
+            self._slots.release()
+
+    def run_forever(self, poll_seconds: float = 30):
+        """Plans and dispatches refreshes until stop() is called."""
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(poll_seconds)
+        self._executor.shutdown(wait=True)
+
+    def stop(self):
+        self._stop.set()
+
+    def wait_idle(self):
+        """Blocks until every dispatched refresh has finished."""
+        for _ in range(self.max_concurrency):
+            self._slots.acquire()
+        for _ in range(self.max_concurrency):
+            self._slots.release()
@@ -0,0 +1,89 @@
+import threading
+from contextlib import contextmanager
+from sqlalchemy import text
+from ..extensions import db
+from ..database import pgbouncer_transaction_mode
+
+
+class _Call:
+    """The shared state of one in-flight SingleFlight execution."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key onto a single execution.
+    The first caller runs the function; callers arriving while it is in
+    flight block and receive the same result (or exception).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: str, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+@contextmanager
+def advisory_lock(key: str):
+    """
+    Holds a Postgres advisory lock on `key` for the duration of the block,
+    so the same work is serialized across gunicorn workers and hosts.
+    Yields True if another session held the lock and we had to wait for it.
+    On databases without advisory locks (e.g. SQLite in local runs) this is a no-op.
+
+    Session-level locks need the lock and unlock to run on the same server
+    connection, which PgBouncer transaction pooling does not guarantee. In that
+    mode a transaction-level lock is taken instead and held by keeping this
+    connection's transaction open until the block exits.
+    """
+    engine = db.engine
+    if engine.dialect.name != 'postgresql':
+        yield False
+        return
+
+    params = {"key": key}
+    if pgbouncer_transaction_mode():
+        with engine.connect() as conn, conn.begin():
+            waited = not conn.execute(text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"), params).scalar()
+            if waited:
+                # The pipeline outlasts the statement timeout, so waiting must not be cut short by it
+                conn.execute(text("SET LOCAL statement_timeout = 0"))
+                conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), params)
+            yield waited
+        return
+
+    with engine.connect() as conn:
+        waited = not conn.execute(text("SELECT pg_try_advisory_lock(hashtext(:key))"), params).scalar()
+        if waited:
+            # Reverted when the connection's transaction ends; the session lock is not
+            conn.execute(text("SET LOCAL statement_timeout = 0"))
+            conn.execute(text("SELECT pg_advisory_lock(hashtext(:key))"), params)
+        try:
+            yield waited
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), params)
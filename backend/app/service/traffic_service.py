@@ -0,0 +1,66 @@
+import os
+import math
+import time
+import datetime
+import threading
+from collections import Counter
+from ..extensions import db
+from ..models import Category, CategoryTraffic
+from .metrics import log_error
+
+# Read scores halve every TRAFFIC_HALF_LIFE_HOURS, so priority follows recent interest
+HALF_LIFE = datetime.timedelta(hours=float(os.environ.get("TRAFFIC_HALF_LIFE_HOURS", 6)))
+
+
+def decayed(score: float, since: datetime.datetime, now: datetime.datetime):
+    """Decays a read score recorded at `since` forward to `now`."""
+    elapsed = max(0.0, (now - since).total_seconds())
+    return score * math.pow(0.5, elapsed / HALF_LIFE.total_seconds())
+
+
+class ReadTraffic:
+    """
+    Counts category reads in memory and flushes them to `category_traffic`
+    at most once per flush interval, so tracking costs no query per request.
+    Names come straight from request paths, so at most `max_pending` distinct
+    names are held between flushes and only existing categories are stored.
+    """
+    _lock = threading.Lock()
+    _pending = Counter()
+    _last_flush = time.monotonic()
+    flush_seconds = float(os.environ.get("TRAFFIC_FLUSH_SECONDS", 60))
+    max_pending = int(os.environ.get("TRAFFIC_MAX_PENDING", 1000))
+
+    @classmethod
+    def record(cls, category_name: str):
+        with cls._lock:
+            if category_name in cls._pending or len(cls._pending) < cls.max_pending:
+                cls._pending[category_name] += 1
+            due = time.monotonic() - cls._last_flush >= cls.flush_seconds
+            if due:
+                pending, cls._pending = cls._pending, Counter()
+                cls._last_flush = time.monotonic()
+        if due:
+            cls._flush(pending)
+
+    @staticmethod
+    def _flush(pending: Counter):
+        now = datetime.datetime.utcnow()
+        try:
+            known = {name for name, in db.session.query(Category.category_name).filter(
+                Category.category_name.in_(list(pending)))}
+            existing = {row.category_name: row for row in
+                        CategoryTraffic.query.filter(CategoryTraffic.category_name.in_(list(known)))}
+            for category_name, hits in pending.items():
+                if category_name not in known:
+                    continue
+                row = existing.get(category_name)
+                if row is None:
+                    db.session.add(CategoryTraffic(category_name=category_name, read_score=hits, updated_at=now))
+                else:
+                    row.read_score = decayed(row.read_score, row.updated_at, now) + hits
+                    row.updated_at = now
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            log_error("traffic", "Error flushing category read traffic", e)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark for News-Man Backend
+Runs NewsService.process_topic end to end against the fake Tavily and Gemini
+clients in benchmarks/fakes.py and a local database, then reports throughput
+and p50/p99 latency per pipeline stage and per LLM call.
+
+Usage:
+    python benchmarks/bench_pipeline.py                       # 20 runs, 4 at a time
+    python benchmarks/bench_pipeline.py --runs 100 --concurrency 8 --llm-median-ms 400 --llm-p99-ms 3000
+    python benchmarks/bench_pipeline.py --llm-throttle-rate 0.05 --llm-error-rate 0.01 --seed-articles 100000
+
+Pipeline settings (NEWS_LLM_CONCURRENCY, NEWS_LLM_BATCH_MODE, ...) are read
+from the environment as usual. Set BENCH_DB_URI to benchmark against Postgres.
+"""
+
+import os
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from common import configure_database, seed, StageRecorder, print_latency_table
+
+configure_database("news_man_bench_pipeline")
+# Provider quotas are not what is being measured here unless asked for
+os.environ.setdefault("GEMINI_RPM", "1000000")
+os.environ.setdefault("GEMINI_TPM", "1000000000")
+os.environ.setdefault("TAVILY_RPM", "1000000")
+
+from app import create_app
+from app.service.news_service import NewsService
+from app.service.metrics import STAGE_SECONDS
+from app.service.rate_limit import all_limiters
+from fakes import FakeTavilyClient, FakeGenerativeModel, LatencyProfile
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the news pipeline against fake providers.")
+    parser.add_argument("--runs", type=int, default=20, help="process_topic calls (one new topic each)")
+    parser.add_argument("--concurrency", type=int, default=4, help="pipeline runs in flight at once")
+    parser.add_argument("--words", type=int, default=800, help="words of prose per synthetic article")
+    parser.add_argument("--seed-articles", type=int, default=1000, help="articles stored before the runs")
+    parser.add_argument("--search-median-ms", type=float, default=300)
+    parser.add_argument("--search-p99-ms", type=float, default=1500)
+    parser.add_argument("--search-error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-median-ms", type=float, default=200)
+    parser.add_argument("--llm-p99-ms", type=float, default=1200)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-throttle-rate", type=float, default=0.0)
+    parser.add_argument("--llm-invalid-rate", type=float, default=0.0, help="fraction of unusable LLM answers")
+    return parser.parse_args()
+
+
+def build_service(args):
+    llm_profile = LatencyProfile(args.llm_median_ms, args.llm_p99_ms, args.llm_error_rate, args.llm_throttle_rate, seed=1)
+    return NewsService(
+        tavily_client=FakeTavilyClient(
+            LatencyProfile(args.search_median_ms, args.search_p99_ms, args.search_error_rate, seed=2),
+            words_per_article=args.words,
+        ),
+        summarization_model=FakeGenerativeModel(llm_profile, json_mode=True, invalid_rate=args.llm_invalid_rate, seed=3),
+        validation_model=FakeGenerativeModel(llm_profile, json_mode=False, invalid_rate=args.llm_invalid_rate, seed=4),
+    )
+
+
+def run_benchmark(args):
+    app = create_app()
+    with app.app_context():
+        seed(args.seed_articles)
+    service = build_service(args)
+
+    def run(number):
+        with app.app_context():
+            start = time.perf_counter()
+            result, status_code = service.process_topic(f"benchmark-topic-{number}")
+            return time.perf_counter() - start, status_code, result.get("metrics", {})
+
+    with StageRecorder(STAGE_SECONDS, "stage") as recorder:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            outcomes = list(pool.map(run, range(args.runs)))
+        wall_seconds = time.perf_counter() - start
+
+    stored = sum(metrics.get("newly_stored_count", 0) for _, _, metrics in outcomes)
+    failed = sum(1 for _, status_code, _ in outcomes if status_code >= 400)
+    print(f"{args.runs} runs in {wall_seconds:.2f}s ({args.runs / wall_seconds:.2f} runs/s), "
+          f"{stored} articles stored ({stored / wall_seconds:.1f}/s), {failed} failed runs")
+    print(f"LLM mode: {service.batch_mode}, concurrency {service.llm_concurrency}")
+    print()
+    samples = dict(recorder.samples)
+    samples["process_topic"] = [seconds for seconds, _, _ in outcomes]
+    print_latency_table(samples, wall_seconds)
+    print()
+    for limiter in all_limiters():
+        print(limiter.snapshot())
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("⏱️  News Pipeline Benchmark")
+    print("=" * 60)
+
+    run_benchmark(parse_args())
+
+    print("=" * 60)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Read Path Benchmark for News-Man Backend
+Measures the /articles endpoints through the Flask test client on a local
+database seeded with synthetic articles, with the response cache cold
+(cleared before every request), warm, and revalidated (If-None-Match -> 304).
+
+Usage:
+    python benchmarks/bench_reads.py                    # 1k and 100k articles
+    python benchmarks/bench_reads.py 1000000 --requests 500
+
+Set BENCH_DB_URI to benchmark against Postgres instead of SQLite.
+"""
+
+import time
+import argparse
+
+from common import configure_database, seed, print_latency_table
+
+configure_database("news_man_bench_reads")
+
+from app import create_app
+from app.routes.http_cache import response_cache
+
+# The unpaged feed returns every row; past this size it only measures JSON volume
+FULL_FEED_MAX_ROWS = 50000
+
+
+def endpoints(client, size: int, category: str):
+    paths = {
+        "feed page 1": "/articles/?limit=20",
+        "category page 1": f"/articles/by-category/{category}?limit=20",
+        "search": "/articles/search?q=headline&limit=20",
+        "categories": "/articles/categories",
+    }
+    next_cursor = client.get(paths["feed page 1"]).headers.get("X-Next-Cursor")
+    if next_cursor:
+        paths["feed page 2"] = f"/articles/?limit=20&after={next_cursor}"
+    if size <= FULL_FEED_MAX_ROWS:
+        paths["feed unpaged"] = "/articles/"
+    return paths
+
+
+def measure(client, path: str, requests: int, mode: str):
+    timings = []
+    etag = client.get(path).headers.get("ETag")
+    headers = {"If-None-Match": etag} if mode == "304" and etag else {}
+    for _ in range(requests):
+        if mode == "cold":
+            response_cache.clear()
+        start = time.perf_counter()
+        response = client.get(path, headers=headers)
+        timings.append(time.perf_counter() - start)
+        assert response.status_code in (200, 304), (path, response.status_code)
+    return timings
+
+
+def run_benchmark(sizes, requests: int):
+    app = create_app()
+    client = app.test_client()
+    for size in sizes:
+        with app.app_context():
+            categories = seed(size)
+        print(f"--- {size:,} articles ---")
+        samples = {}
+        for name, path in endpoints(client, size, categories[0]).items():
+            for mode in ("cold", "warm", "304"):
+                samples[f"{name} [{mode}]"] = measure(client, path, requests, mode)
+        print_latency_table(samples, label="endpoint")
+        print()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("⏱️  Article Read Path Benchmark")
+    print("=" * 60)
+
+    parser = argparse.ArgumentParser(description="Benchmark the /articles read endpoints.")
+    parser.add_argument("sizes", type=int, nargs="*", default=[1000, 100000], help="articles to seed")
+    parser.add_argument("--requests", type=int, default=200, help="requests per endpoint and cache mode")
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.requests)
+
+    print("=" * 60)
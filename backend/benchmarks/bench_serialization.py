@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark for News-Man Backend
+Compares the original read path (full ORM instances + flask_restx marshal + json)
+with the column-only fast path (row tuples + serialize_articles + orjson)
+on a local SQLite database seeded with synthetic articles.
+
+Usage:
+    python benchmarks/bench_serialization.py            # 1k and 10k articles
+    python benchmarks/bench_serialization.py 1000 50000 # custom sizes
+"""
+
+import sys
+import json
+import time
+
+from common import configure_database, seed
+
+configure_database("news_man_bench_serialization")
+
+from flask_restx import marshal
+from sqlalchemy import desc
+from app import create_app
+from app.extensions import db
+from app.models import Article
+from app.routes.article_routes import article_display_dto
+from app.routes.serializers import dumps, serialize_articles, orjson
+from app.service.article_service import ArticleService
+
+REPEAT = 5
+
+
+def marshal_path():
+    articles = Article.query.order_by(desc(Article.created_at)).all()
+    return json.dumps(marshal(articles, article_display_dto)).encode("utf-8")
+
+
+def fast_path():
+    return dumps(serialize_articles(ArticleService.get_all_articles()))
+
+
+def best_of(fn):
+    """Returns the fastest of REPEAT runs in seconds, starting each run with a clean session."""
+    timings = []
+    for _ in range(REPEAT):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmark(sizes):
+    app = create_app()
+    print(f"JSON encoder for fast path: {'orjson' if orjson else 'json (orjson not installed)'}")
+    print(f"{'articles':>10} {'path':>10} {'ms/request':>12} {'articles/s':>14}")
+
+    with app.app_context():
+        for size in sizes:
+            seed(size)
+            assert json.loads(marshal_path()) == json.loads(fast_path())
+            for name, fn in (("marshal", marshal_path), ("fast", fast_path)):
+                seconds = best_of(fn)
+                print(f"{size:>10} {name:>10} {seconds * 1000:>12.1f} {size / seconds:>14,.0f}")
+        db.drop_all()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("⏱️  Feed Serialization Benchmark")
+    print("=" * 60)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000]
+    run_benchmark(sizes)
+
+    print("=" * 60)
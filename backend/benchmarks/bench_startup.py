@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for News-Man Backend
+Measures how long a fresh worker process takes to import the app and run
+create_app(), in the full and read-only app modes, using `python -X importtime`.
+Reports the wall time per mode, the slowest imports and whether the
+AI SDKs (Tavily, Gemini) were loaded at startup.
+
+Usage:
+    python benchmarks/bench_startup.py                 # 5 runs per mode, top 15 imports
+    python benchmarks/bench_startup.py 10 25           # 10 runs per mode, top 25 imports
+"""
+
+import os
+import sys
+import subprocess
+
+from common import configure_database, percentile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ("full", "read")
+# Modules that a read-only worker should not pay for at startup
+WATCHED_MODULES = ("tavily", "google.generativeai", "app.service.news_service", "app.routes.news_routes")
+
+STARTUP_SCRIPT = (
+    "import time; start = time.perf_counter(); "
+    "from app import create_app; create_app(); "
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure(mode: str):
+    """Runs one fresh interpreter; returns (create_app wall seconds, {module: (self_us, cumulative_us, depth)})."""
+    env = dict(os.environ, APP_MODE=mode)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    imports = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return float(completed.stdout.strip().splitlines()[-1]), imports
+
+
+def run_benchmark(runs: int, top: int):
+    reports = {}
+    for mode in MODES:
+        walls, last_imports = [], {}
+        for _ in range(runs):
+            wall, last_imports = measure(mode)
+            walls.append(wall)
+        reports[mode] = (walls, last_imports)
+
+    print(f"{'mode':<8} {'runs':>5} {'p50 ms':>10} {'max ms':>10} {'imports':>8} {'import ms':>10}")
+    for mode, (walls, imports) in reports.items():
+        import_ms = sum(self_us for self_us, _, _ in imports.values()) / 1000
+        print(f"{mode:<8} {runs:>5} {percentile(walls, 50) * 1000:>10.1f} {max(walls) * 1000:>10.1f} "
+              f"{len(imports):>8} {import_ms:>10.1f}")
+
+    for mode, (_, imports) in reports.items():
+        print()
+        print(f"📦 Slowest imports, two levels deep ({mode} mode, last run):")
+        top_level = [(cumulative, name) for name, (_, cumulative, depth) in imports.items() if depth <= 1]
+        for cumulative, name in sorted(top_level, reverse=True)[:top]:
+            print(f"   {cumulative / 1000:>9.1f} ms  {name}")
+        for module in WATCHED_MODULES:
+            loaded = "loaded" if module in imports else "not loaded"
+            print(f"   {'':>12}{module}: {loaded}")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🚀 News-Man Startup Benchmark")
+    print("=" * 60)
+
+    configure_database("news_man_bench_startup")
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    run_benchmark(runs, top)
+
+    print("=" * 60)
@@ -0,0 +1,112 @@
+"""
+Shared helpers for the benchmarks: database setup, synthetic seeding,
+latency recording and report formatting.
+"""
+
+import os
+import sys
+import math
+import uuid
+import datetime
+import tempfile
+import threading
+from collections import defaultdict
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def configure_database(name: str):
+    """
+    Points the app at BENCH_DB_URI (e.g. a local Postgres) or, by default, a
+    throwaway SQLite file. Must run before the app package is imported.
+    """
+    uri = os.environ.get("BENCH_DB_URI") or f"sqlite:///{os.path.join(tempfile.gettempdir(), name)}.sqlite"
+    os.environ["SUPABASE_DB_URI"] = uri
+    # Benchmarks inject fake clients, so the real SDKs are never configured; any key will do
+    os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+    os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+    return uri
+
+
+SEED_BATCH_SIZE = 10000
+SUMMARY = "A synthetic summary paragraph used for benchmarking the feed endpoints. " * 6
+
+
+def seed(count: int, categories: int = 20):
+    """
+    Recreates the schema with `count` synthetic articles spread over `categories`
+    categories (one link per article), inserted in batches so 1M rows fit in memory.
+    Returns the category names.
+    """
+    from app.extensions import db
+    from app.models import Article, Category, article_categories
+
+    db.drop_all()
+    db.create_all()
+    names = [f"category-{i}" for i in range(categories)]
+    db.session.execute(Category.__table__.insert(), [{"category_name": name} for name in names])
+    category_ids = [row.id for row in db.session.query(Category.id).order_by(Category.id)]
+
+    base = datetime.datetime(2025, 1, 1)
+    for start in range(0, count, SEED_BATCH_SIZE):
+        rows = [{
+            "id": str(uuid.uuid4()), "created_at": base + datetime.timedelta(seconds=i),
+            "title": f"Original title {i}", "headline": f"Headline {i} about {names[i % categories]}",
+            "summary": SUMMARY, "source_url": f"https://example.com/articles/{i}", "image_url": None,
+            "published_at": base, "source_name": "Example News",
+        } for i in range(start, min(count, start + SEED_BATCH_SIZE))]
+        db.session.execute(Article.__table__.insert(), rows)
+        db.session.execute(article_categories.insert(), [
+            {"article_id": row["id"], "category_id": category_ids[i % categories],
+             "article_created_at": row["created_at"]}
+            for i, row in enumerate(rows, start)
+        ])
+        db.session.commit()
+    return names
+
+
+def percentile(values: list, q: float):
+    """Nearest-rank percentile of `values` (q in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class StageRecorder:
+    """
+    Captures every raw observation of a metrics Histogram (e.g. STAGE_SECONDS)
+    by label, so exact p50/p99 can be reported instead of bucket estimates.
+    """
+    def __init__(self, histogram, label: str):
+        self.histogram = histogram
+        self.label = label
+        self.samples = defaultdict(list)
+        self._lock = threading.Lock()
+        self._original = None
+
+    def __enter__(self):
+        self._original = self.histogram.observe
+
+        def observe(value, **labels):
+            with self._lock:
+                self.samples[labels.get(self.label, '')].append(value)
+            self._original(value, **labels)
+
+        self.histogram.observe = observe
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe = self._original
+        return False
+
+
+def print_latency_table(samples: dict, wall_seconds: float = None, label: str = "stage"):
+    """Prints count, throughput, p50, p99 and max (ms) for each named list of samples in seconds."""
+    print(f"{label:<24} {'count':>7} {'per s':>9} {'p50 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    for name, values in sorted(samples.items()):
+        rate = f"{len(values) / wall_seconds:>9.1f}" if wall_seconds else f"{'':>9}"
+        print(f"{name:<24} {len(values):>7} {rate} {percentile(values, 50) * 1000:>10.1f} "
+              f"{percentile(values, 99) * 1000:>10.1f} {max(values) * 1000:>10.1f}")
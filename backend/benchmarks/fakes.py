@@ -0,0 +1,144 @@
+"""
+Local stand-ins for the Tavily and Gemini clients used by the benchmarks.
+
+Both fakes sleep for a latency drawn from a LatencyProfile and can fail or
+throttle a configurable fraction of calls, so pipeline behaviour under slow or
+flaky providers can be measured without network access.
+"""
+
+import re
+import json
+import math
+import time
+import random
+import threading
+
+VOCABULARY = (
+    "government market election climate energy technology research company report policy "
+    "minister economy growth inflation court ruling health vaccine study players season "
+    "league championship satellite launch mission space agency storm coast city council "
+    "budget tax investors shares profits bank rates central program officials announced "
+    "statement according data analysts expected week year people country region local"
+).split()
+
+BOILERPLATE = [
+    "[Home](https://news.example) | [World](https://news.example/world) | [Business](https://news.example/business)",
+    "Skip to main content",
+    "Advertisement",
+    "Share this article",
+    "Subscribe to our newsletter",
+    "© 2025 Example News. All rights reserved.",
+]
+
+
+class ResourceExhausted(Exception):
+    """Mimics the SDK throttling error (HTTP 429) that the rate limiter retries."""
+    code = 429
+
+
+class LatencyProfile:
+    """
+    Latency and failure behaviour of a fake provider.
+    Latencies are log-normal around `median_ms`; `p99_ms` sets the tail.
+    """
+    def __init__(self, median_ms: float = 0, p99_ms: float = None, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, seed: int = None):
+        self.median = median_ms / 1000.0
+        # For a log-normal, p99 = median * exp(2.326 * sigma)
+        self.sigma = max(0.0, math.log(p99_ms / median_ms) / 2.326) if median_ms and p99_ms else 0.0
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def simulate(self):
+        """Sleeps for one sampled latency, then raises an error or throttle if the dice say so."""
+        with self._lock:
+            delay = self._random.lognormvariate(0, self.sigma) * self.median if self.median else 0.0
+            roll = self._random.random()
+        if delay:
+            time.sleep(delay)
+        if roll < self.throttle_rate:
+            raise ResourceExhausted("429 Resource has been exhausted (e.g. check quota).")
+        if roll < self.throttle_rate + self.error_rate:
+            raise RuntimeError("503 simulated provider failure")
+
+
+def synthetic_article(rng: random.Random, words: int):
+    """Returns scraped-page-like text: a little boilerplate around `words` words of prose."""
+    paragraphs = []
+    remaining = words
+    while remaining > 0:
+        length = min(remaining, rng.randint(40, 120))
+        sentence = ' '.join(rng.choice(VOCABULARY) for _ in range(length))
+        paragraphs.append(sentence.capitalize() + '.')
+        remaining -= length
+    return '\n'.join(BOILERPLATE[:3] + paragraphs + BOILERPLATE[3:])
+
+
+class FakeTavilyClient:
+    """Answers search() with unique synthetic articles."""
+    def __init__(self, profile: LatencyProfile = None, words_per_article: int = 800, seed: int = 0):
+        self.profile = profile or LatencyProfile()
+        self.words_per_article = words_per_article
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counter = 0
+
+    def search(self, query: str, max_results: int = 5, **kwargs):
+        self.profile.simulate()
+        results = []
+        with self._lock:
+            for _ in range(max_results):
+                self._counter += 1
+                number = self._counter
+                results.append({
+                    "title": f"Synthetic story {number}",
+                    "url": f"https://news.example/story/{number}",
+                    "raw_content": synthetic_article(self._random, self.words_per_article),
+                })
+        return {"results": results}
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGenerativeModel:
+    """
+    Stand-in for genai.GenerativeModel. Recognises the single, batched and
+    combined prompts of NewsService and answers each in the expected shape.
+    `invalid_rate` makes that fraction of summaries or verdicts come back unusable.
+    """
+    def __init__(self, profile: LatencyProfile = None, json_mode: bool = True, invalid_rate: float = 0.0, seed: int = 0):
+        self.profile = profile or LatencyProfile()
+        self.json_mode = json_mode
+        self.invalid_rate = invalid_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _valid(self):
+        with self._lock:
+            return self._random.random() >= self.invalid_rate
+
+    def _summary(self, number: int):
+        return {"headline": f"Synthetic headline {number}",
+                "summary": f"Synthetic summary {number} of the key points in the article.",
+                "published_at": "2025-01-02", "source_name": "Example News"}
+
+    def generate_content(self, prompt: str, request_options: dict = None):
+        self.profile.simulate()
+        if "Process each of the following" in prompt:
+            count = len(re.findall(r"^\s*Article \d+: ---", prompt, re.MULTILINE))
+            self_check = '"faithful"' in prompt
+            return _Response(json.dumps([
+                {"id": i, **self._summary(i), **({"faithful": True} if self_check else {})}
+                for i in range(1, count + 1) if self._valid()
+            ]))
+        if "For each item" in prompt:
+            count = len(re.findall(r"^Item \d+:", prompt, re.MULTILINE))
+            return _Response(json.dumps([{"id": i, "accurate": True} for i in range(1, count + 1) if self._valid()]))
+        if self.json_mode:
+            return _Response(json.dumps(self._summary(0)) if self._valid() else "not json")
+        return _Response("YES" if self._valid() else "I cannot tell.")
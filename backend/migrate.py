@@ -114,6 +114,30 @@ def drop_tables():
             print(f"❌ Error dropping tables: {e}")
             return False
 
+def rebuild_category_stats():
+    """Recompute category_stats from the article and follower links (backfill after upgrading)."""
+    print("📊 Rebuilding category statistics...")
+
+    # The stats service is bound to the application's own db instance
+    from app import create_app as create_news_app
+    from app.extensions import db as app_db
+    from app.service.category_stats_service import CategoryStatsService
+
+    app = create_news_app()
+
+    with app.app_context():
+        try:
+            app_db.create_all()
+            count = CategoryStatsService.rebuild()
+            app_db.session.commit()
+            print(f"✅ Rebuilt statistics for {count} categor{'y' if count == 1 else 'ies'}.")
+            return True
+
+        except Exception as e:
+            app_db.session.rollback()
+            print(f"❌ Error rebuilding category statistics: {e}")
+            return False
+
 if __name__ == "__main__":
     print("=" * 60)
     print("🗄️  News-Man Database Migration Script")
@@ -128,9 +152,11 @@ if __name__ == "__main__":
             drop_tables()
         elif command == "migrate":
             run_migration()
+        elif command == "stats":
+            rebuild_category_stats()
         else:
             print(f"❌ Unknown command: {command}")
-            print("Available commands: check, drop, migrate")
+            print("Available commands: check, drop, migrate, stats")
     else:
         # Default action: run migration
         run_migration()
@@ -0,0 +1,89 @@
+"""Create the baseline schema
+
+The tables the application started with: categories, users, user_categories,
+articles and article_categories. Each is only created where missing, so
+databases built by `python migrate.py migrate` or db.create_all() upgrade from
+here without being stamped first.
+
+Revision ID: 1b0e6c4a9d27
+Revises:
+Create Date: 2026-10-18 08:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b0e6c4a9d27'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'categories' not in tables:
+        op.create_table(
+            'categories',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('category_name', sa.String(length=50), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('category_name'),
+        )
+    if 'users' not in tables:
+        op.create_table(
+            'users',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('email_id', sa.String(length=120), nullable=False),
+            sa.Column('password', sa.String(length=255), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=True),
+            sa.Column('joined_at', sa.DateTime(), nullable=True),
+            sa.Column('date_of_birth', sa.Date(), nullable=True),
+            sa.Column('phone_number', sa.String(length=20), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('email_id'),
+            sa.UniqueConstraint('phone_number'),
+        )
+    if 'user_categories' not in tables:
+        op.create_table(
+            'user_categories',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('category_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+            sa.PrimaryKeyConstraint('user_id', 'category_id'),
+        )
+    if 'articles' not in tables:
+        op.create_table(
+            'articles',
+            sa.Column('id', sa.String(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column('title', sa.Text(), nullable=False),
+            sa.Column('headline', sa.Text(), nullable=True),
+            sa.Column('summary', sa.Text(), nullable=False),
+            sa.Column('source_url', sa.Text(), nullable=False),
+            sa.Column('image_url', sa.Text(), nullable=True),
+            sa.Column('published_at', sa.DateTime(), nullable=True),
+            sa.Column('source_name', sa.Text(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('source_url'),
+        )
+    if 'article_categories' not in tables:
+        op.create_table(
+            'article_categories',
+            sa.Column('article_id', sa.String(), nullable=False),
+            sa.Column('category_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['article_id'], ['articles.id']),
+            sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+            sa.PrimaryKeyConstraint('article_id', 'category_id'),
+        )
+
+
+def downgrade():
+    op.drop_table('article_categories')
+    op.drop_table('articles')
+    op.drop_table('user_categories')
+    op.drop_table('users')
+    op.drop_table('categories')
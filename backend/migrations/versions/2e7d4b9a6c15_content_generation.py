@@ -0,0 +1,37 @@
+"""Add the content_generation table
+
+A single-row counter bumped whenever a pipeline run commits new content; the
+read endpoints derive their ETags and response cache keys from it. Only
+created where missing, so databases built by db.create_all() are left as
+they are.
+
+Revision ID: 2e7d4b9a6c15
+Revises: c6a1e8d3f7b2
+Create Date: 2026-10-18 11:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2e7d4b9a6c15'
+down_revision = 'c6a1e8d3f7b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'content_generation' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'content_generation',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('generation', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade():
+    op.drop_table('content_generation')
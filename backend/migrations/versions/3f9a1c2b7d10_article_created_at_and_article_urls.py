@@ -0,0 +1,59 @@
+"""Copy created_at onto article_categories and add the article_urls guard table
+
+Prepares any database for monthly partitioning: article_categories gets the
+article's created_at (the links' partition key), and article_urls takes over
+cross-partition uniqueness of source_url. Both are backfilled. A plain index on
+articles.source_url backs stored-URL lookups once the unique constraint is gone.
+Safe to run on a schema created by db.create_all(), which already has them.
+
+Revision ID: 3f9a1c2b7d10
+Revises: f1b9d6e4a273
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c2b7d10'
+down_revision = 'f1b9d6e4a273'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    link_columns = {column['name'] for column in inspector.get_columns('article_categories')}
+    if 'article_created_at' not in link_columns:
+        op.add_column('article_categories', sa.Column('article_created_at', sa.DateTime(), nullable=True))
+    op.execute("""
+        UPDATE article_categories SET article_created_at = (
+            SELECT a.created_at FROM articles a WHERE a.id = article_categories.article_id
+        ) WHERE article_created_at IS NULL
+    """)
+
+    if 'article_urls' not in inspector.get_table_names():
+        op.create_table(
+            'article_urls',
+            sa.Column('source_url', sa.Text(), nullable=False),
+            sa.Column('article_id', sa.String(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.PrimaryKeyConstraint('source_url'),
+        )
+        op.create_index('ix_article_urls_created_at', 'article_urls', ['created_at'])
+    # "WHERE true" keeps SQLite from reading ON CONFLICT as part of the SELECT's join syntax
+    op.execute("""
+        INSERT INTO article_urls (source_url, article_id, created_at)
+        SELECT source_url, id, created_at FROM articles WHERE true
+        ON CONFLICT DO NOTHING
+    """)
+    op.create_index('ix_articles_source_url', 'articles', ['source_url'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_articles_source_url', table_name='articles', if_exists=True)
+    op.drop_index('ix_article_urls_created_at', table_name='article_urls')
+    op.drop_table('article_urls')
+    with op.batch_alter_table('article_categories') as batch_op:
+        batch_op.drop_column('article_created_at')
@@ -0,0 +1,49 @@
+"""Add the feed keyset indexes and normalize SQLite created_at values
+
+The (created_at, id) index on articles and the (category_id, article_id) index
+on article_categories back the cursor-paginated feeds. On SQLite, rows stored
+with the CURRENT_TIMESTAMP server default hold second-precision text, which
+compares wrongly against cursor values; they are rewritten in the format
+SQLAlchemy writes ('YYYY-MM-DD HH:MM:SS.ffffff'). Indexes are only created
+where missing, so databases built by db.create_all() are left as they are.
+
+Revision ID: 5d2e7f1a9b64
+Revises: 1b0e6c4a9d27
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e7f1a9b64'
+down_revision = '1b0e6c4a9d27'
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs holding article creation times
+TIMESTAMP_COLUMNS = (('articles', 'created_at'), ('article_categories', 'article_created_at'))
+
+
+def upgrade():
+    op.create_index('ix_articles_created_at_id', 'articles', ['created_at', 'id'], if_not_exists=True)
+    op.create_index('ix_article_categories_category_id_article_id', 'article_categories',
+                    ['category_id', 'article_id'], if_not_exists=True)
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        inspector = sa.inspect(bind)
+        for table, column in TIMESTAMP_COLUMNS:
+            # article_created_at only exists on schemas built by db.create_all()
+            if column not in {existing['name'] for existing in inspector.get_columns(table)}:
+                continue
+            # strftime's %f gives milliseconds ("SS.SSS"), padded here to microseconds
+            op.execute(f"UPDATE {table} SET {column} = strftime('%Y-%m-%d %H:%M:%f', {column}) || '000' "
+                       f"WHERE length({column}) = 19")
+
+
+def downgrade():
+    # The normalized timestamps are left as they are: both formats are valid
+    op.drop_index('ix_article_categories_category_id_article_id', table_name='article_categories', if_exists=True)
+    op.drop_index('ix_articles_created_at_id', table_name='articles', if_exists=True)
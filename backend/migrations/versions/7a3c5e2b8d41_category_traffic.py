@@ -0,0 +1,36 @@
+"""Add the category_traffic table
+
+Holds each category's decayed read score, which the refresh scheduler uses
+to decide how often a topic is refreshed. Only created where missing, so
+databases built by db.create_all() are left as they are.
+
+Revision ID: 7a3c5e2b8d41
+Revises: b7e3c9d14f2a
+Create Date: 2026-10-18 11:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a3c5e2b8d41'
+down_revision = 'b7e3c9d14f2a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'category_traffic' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'category_traffic',
+        sa.Column('category_name', sa.String(length=50), nullable=False),
+        sa.Column('read_score', sa.Float(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('category_name'),
+    )
+
+
+def downgrade():
+    op.drop_table('category_traffic')
@@ -0,0 +1,160 @@
+"""Partition articles and article_categories by month (Postgres only)
+
+Rebuilds both tables as RANGE-partitioned parents with one partition per month,
+from the oldest stored article up to PARTITION_MONTHS_AHEAD months ahead, and
+copies the data across. Keys that must hold per partition now include the
+partition key: articles (id, created_at) and article_categories (article_id,
+category_id, article_created_at), with a composite foreign key between them.
+source_url uniqueness moves to article_urls (previous revision).
+
+The copy runs in one transaction and locks both tables; run it in a quiet window.
+Other dialects are left untouched.
+
+Revision ID: 8c41e6d2a5f3
+Revises: 3f9a1c2b7d10
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+import os
+import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c41e6d2a5f3'
+down_revision = '3f9a1c2b7d10'
+branch_labels = None
+depends_on = None
+
+TABLES = ('article_categories', 'articles')
+MONTHS_AHEAD = int(os.environ.get("PARTITION_MONTHS_AHEAD", 3))
+
+# Same statements as app/models/article_search.py, frozen here with the migration
+SEARCH_DDL = [
+    """
+    ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(headline, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(source_name, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_articles_search_vector ON articles USING GIN (search_vector)",
+]
+
+
+def _is_partitioned(bind):
+    return bind.execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'articles' AND pg_table_is_visible(c.oid))"
+    )).scalar()
+
+
+def _create_partitions(first: datetime.date):
+    """Monthly partitions (named <table>_pYYYY_MM, as app/service/partitions.py expects) through MONTHS_AHEAD."""
+    today = datetime.datetime.utcnow()
+    last = today.year * 12 + today.month - 1 + MONTHS_AHEAD
+    index = first.year * 12 + first.month - 1
+    while index <= last:
+        lower = datetime.date(index // 12, index % 12 + 1, 1)
+        upper = datetime.date((index + 1) // 12, (index + 1) % 12 + 1, 1)
+        for table in ('articles', 'article_categories'):
+            op.execute(f"CREATE TABLE {table}_p{lower.year:04d}_{lower.month:02d} PARTITION OF {table} "
+                       f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')")
+        index += 1
+
+
+def _move_aside(bind, suffix: str):
+    """Renames both tables and their indexes (index names are schema-wide) out of the way."""
+    for table in TABLES:
+        indexes = bind.execute(sa.text(
+            "SELECT indexname FROM pg_indexes WHERE tablename = :table AND schemaname = current_schema()"
+        ), {"table": table}).scalars().all()
+        for index in indexes:
+            op.execute(f'ALTER INDEX "{index}" RENAME TO "{index}_{suffix}"')
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_{suffix}")
+
+
+def _article_columns(bind, table: str):
+    # search_vector is generated, so it is never copied
+    return [column['name'] for column in sa.inspect(bind).get_columns(table) if column['name'] != 'search_vector']
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or _is_partitioned(bind):
+        return
+
+    # The copy can outlast the app's statement timeout
+    op.execute("SET LOCAL statement_timeout = 0")
+    _move_aside(bind, 'legacy')
+
+    op.execute("CREATE TABLE articles (LIKE articles_legacy INCLUDING DEFAULTS INCLUDING GENERATED) "
+               "PARTITION BY RANGE (created_at)")
+    op.execute("ALTER TABLE articles ADD PRIMARY KEY (id, created_at)")
+    op.execute("CREATE INDEX ix_articles_created_at_id ON articles (created_at, id)")
+    op.execute("CREATE INDEX ix_articles_source_url ON articles (source_url)")
+    for statement in SEARCH_DDL:
+        op.execute(statement)
+
+    op.execute("CREATE TABLE article_categories (LIKE article_categories_legacy INCLUDING DEFAULTS) "
+               "PARTITION BY RANGE (article_created_at)")
+    op.execute("ALTER TABLE article_categories ADD PRIMARY KEY (article_id, category_id, article_created_at)")
+    op.execute("ALTER TABLE article_categories ADD FOREIGN KEY (article_id, article_created_at) "
+               "REFERENCES articles (id, created_at)")
+    op.execute("ALTER TABLE article_categories ADD FOREIGN KEY (category_id) REFERENCES categories (id)")
+    op.execute("CREATE INDEX ix_article_categories_category_id_article_id ON article_categories (category_id, article_id)")
+
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM articles_legacy")).scalar()
+    _create_partitions(oldest or datetime.datetime.utcnow())
+
+    columns = _article_columns(bind, 'articles_legacy')
+    select_list = ', '.join('COALESCE(created_at, now())' if name == 'created_at' else name for name in columns)
+    op.execute(f"INSERT INTO articles ({', '.join(columns)}) SELECT {select_list} FROM articles_legacy")
+    op.execute("""
+        INSERT INTO article_categories (article_id, category_id, article_created_at)
+        SELECT l.article_id, l.category_id, a.created_at
+        FROM article_categories_legacy l JOIN articles a ON a.id = l.article_id
+    """)
+
+    op.execute("DROP TABLE article_categories_legacy")
+    op.execute("DROP TABLE articles_legacy")
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or not _is_partitioned(bind):
+        return
+
+    op.execute("SET LOCAL statement_timeout = 0")
+    _move_aside(bind, 'partitioned')
+
+    op.execute("CREATE TABLE articles (LIKE articles_partitioned INCLUDING DEFAULTS INCLUDING GENERATED)")
+    op.execute("ALTER TABLE articles ALTER COLUMN created_at DROP NOT NULL")
+    op.execute("ALTER TABLE articles ADD PRIMARY KEY (id)")
+    op.execute("ALTER TABLE articles ADD UNIQUE (source_url)")
+    op.execute("CREATE INDEX ix_articles_source_url ON articles (source_url)")
+    op.execute("CREATE INDEX ix_articles_created_at_id ON articles (created_at, id)")
+    for statement in SEARCH_DDL:
+        op.execute(statement)
+
+    op.execute("CREATE TABLE article_categories (LIKE article_categories_partitioned INCLUDING DEFAULTS)")
+    op.execute("ALTER TABLE article_categories ALTER COLUMN article_created_at DROP NOT NULL")
+    op.execute("ALTER TABLE article_categories ADD PRIMARY KEY (article_id, category_id)")
+    op.execute("ALTER TABLE article_categories ADD FOREIGN KEY (article_id) REFERENCES articles (id)")
+    op.execute("ALTER TABLE article_categories ADD FOREIGN KEY (category_id) REFERENCES categories (id)")
+    op.execute("CREATE INDEX ix_article_categories_category_id_article_id ON article_categories (category_id, article_id)")
+
+    columns = ', '.join(_article_columns(bind, 'articles_partitioned'))
+    op.execute(f"INSERT INTO articles ({columns}) SELECT {columns} FROM articles_partitioned ON CONFLICT DO NOTHING")
+    op.execute("""
+        INSERT INTO article_categories (article_id, category_id, article_created_at)
+        SELECT l.article_id, l.category_id, l.article_created_at
+        FROM article_categories_partitioned l JOIN articles a ON a.id = l.article_id
+        ON CONFLICT DO NOTHING
+    """)
+
+    # Dropping the parents drops their attached partitions
+    op.execute("DROP TABLE article_categories_partitioned")
+    op.execute("DROP TABLE articles_partitioned")
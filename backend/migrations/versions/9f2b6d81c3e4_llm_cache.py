@@ -0,0 +1,39 @@
+"""Add the llm_cache table
+
+Caches LLM summaries and validation verdicts keyed by a hash of the content
+and prompt version. Only created where missing, so databases built by
+db.create_all() are left as they are.
+
+Revision ID: 9f2b6d81c3e4
+Revises: 5d2e7f1a9b64
+Create Date: 2026-10-18 11:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9f2b6d81c3e4'
+down_revision = '5d2e7f1a9b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'llm_cache' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'llm_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('value', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('cache_key'),
+    )
+    op.create_index('ix_llm_cache_created_at', 'llm_cache', ['created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_llm_cache_created_at', table_name='llm_cache')
+    op.drop_table('llm_cache')
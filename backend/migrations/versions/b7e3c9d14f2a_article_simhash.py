@@ -0,0 +1,30 @@
+"""Add articles.simhash for near-duplicate detection
+
+Stores the 64-bit SimHash fingerprint of each article's content (signed, to
+fit BIGINT). Existing rows keep NULL and are simply not matched against.
+
+Revision ID: b7e3c9d14f2a
+Revises: d4f81a3c9e60
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3c9d14f2a'
+down_revision = 'd4f81a3c9e60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('articles')}
+    if 'simhash' not in columns:
+        op.add_column('articles', sa.Column('simhash', sa.BigInteger(), nullable=True))
+
+
+def downgrade():
+    # A plain DROP COLUMN (SQLite 3.35+): batch mode would rebuild the table and lose the search triggers
+    op.drop_column('articles', 'simhash')
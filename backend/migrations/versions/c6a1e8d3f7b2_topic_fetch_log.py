@@ -0,0 +1,38 @@
+"""Add the topic_fetch_log table
+
+Records when each topic was last run and how it went, backing the refresh
+cooldown. Only created where missing, so databases built by db.create_all()
+are left as they are.
+
+Revision ID: c6a1e8d3f7b2
+Revises: 9f2b6d81c3e4
+Create Date: 2026-10-18 11:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6a1e8d3f7b2'
+down_revision = '9f2b6d81c3e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'topic_fetch_log' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'topic_fetch_log',
+        sa.Column('topic', sa.String(length=50), nullable=False),
+        sa.Column('last_run_at', sa.DateTime(), nullable=False),
+        sa.Column('outcome', sa.String(length=20), nullable=False),
+        sa.Column('fetched_count', sa.Integer(), nullable=False),
+        sa.Column('stored_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('topic'),
+    )
+
+
+def downgrade():
+    op.drop_table('topic_fetch_log')
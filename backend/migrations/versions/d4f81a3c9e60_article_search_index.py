@@ -0,0 +1,79 @@
+"""Add the full-text search index over articles
+
+On Postgres, a generated tsvector column over headline, summary and source
+name with a GIN index; on SQLite, an FTS5 table kept in sync by triggers and
+built from the stored articles. Other dialects are left untouched. Every
+statement is a no-op where the index already exists.
+
+Revision ID: d4f81a3c9e60
+Revises: 2e7d4b9a6c15
+Create Date: 2026-10-18 11:20:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f81a3c9e60'
+down_revision = '2e7d4b9a6c15'
+branch_labels = None
+depends_on = None
+
+# Same statements as app/models/article_search.py, frozen here with the migration
+SEARCH_DDL = {
+    'postgresql': [
+        """
+        ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(headline, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(source_name, '')), 'C')
+        ) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_articles_search_vector ON articles USING GIN (search_vector)",
+    ],
+    'sqlite': [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+            headline, summary, source_name, content='articles', content_rowid='rowid'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+            INSERT INTO articles_fts(rowid, headline, summary, source_name)
+            VALUES (new.rowid, new.headline, new.summary, new.source_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+            INSERT INTO articles_fts(articles_fts, rowid, headline, summary, source_name)
+            VALUES ('delete', old.rowid, old.headline, old.summary, old.source_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+            INSERT INTO articles_fts(articles_fts, rowid, headline, summary, source_name)
+            VALUES ('delete', old.rowid, old.headline, old.summary, old.source_name);
+            INSERT INTO articles_fts(rowid, headline, summary, source_name)
+            VALUES (new.rowid, new.headline, new.summary, new.source_name);
+        END
+        """,
+        "INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')",
+    ],
+}
+
+
+def upgrade():
+    for statement in SEARCH_DDL.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_articles_search_vector")
+        op.execute("ALTER TABLE articles DROP COLUMN IF EXISTS search_vector")
+    elif dialect == 'sqlite':
+        for trigger in ('articles_fts_insert', 'articles_fts_delete', 'articles_fts_update'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS articles_fts")
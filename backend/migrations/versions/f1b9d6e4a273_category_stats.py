@@ -0,0 +1,49 @@
+"""Add the category_stats table
+
+Per-category article counts, newest article time and follower counts, where
+missing, backfilled here for categories without a row. Safe to run on a
+schema created by db.create_all(), which already has the table.
+
+Revision ID: f1b9d6e4a273
+Revises: 7a3c5e2b8d41
+Create Date: 2026-10-18 11:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b9d6e4a273'
+down_revision = '7a3c5e2b8d41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'category_stats' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            'category_stats',
+            sa.Column('category_id', sa.Integer(), nullable=False),
+            sa.Column('article_count', sa.Integer(), nullable=False),
+            sa.Column('latest_created_at', sa.DateTime(), nullable=True),
+            sa.Column('follower_count', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('category_id'),
+        )
+    # Categories without a row get one, with the same values CategoryStatsService.rebuild() computes
+    op.execute("""
+        INSERT INTO category_stats (category_id, article_count, latest_created_at, follower_count)
+        SELECT c.id,
+               (SELECT count(*) FROM article_categories l JOIN articles a ON a.id = l.article_id
+                WHERE l.category_id = c.id),
+               (SELECT max(a.created_at) FROM article_categories l JOIN articles a ON a.id = l.article_id
+                WHERE l.category_id = c.id),
+               (SELECT count(*) FROM user_categories u WHERE u.category_id = c.id)
+        FROM categories c
+        WHERE NOT EXISTS (SELECT 1 FROM category_stats s WHERE s.category_id = c.id)
+    """)
+
+
+def downgrade():
+    op.drop_table('category_stats')
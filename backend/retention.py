@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Partition Retention Script for News-Man Backend
+Manages the monthly partitions of articles and article_categories on Postgres
+(see migrations/versions/8c41e6d2a5f3_partition_articles_by_month.py).
+
+Usage:
+    python retention.py plan            # list partitions and what is past the horizon
+    python retention.py maintain        # create partitions for the coming months now
+                                        # (pipeline runs also do this every PARTITION_CHECK_SECONDS)
+    python retention.py archive         # archive months past the horizon to gzip files, then drop them
+    python retention.py archive 6       # same, keeping only the last 6 months
+    python retention.py detach          # detach months past the horizon, keeping their tables
+
+Settings (environment variables):
+    RETENTION_MONTHS          months kept in the live tables, including the current one (default 12)
+    RETENTION_ARCHIVE_DIR     where archives are written (default: archive/ next to this script)
+    PARTITION_MONTHS_AHEAD    months of partitions created ahead of time (default 3)
+"""
+
+import os
+import sys
+import datetime
+from dotenv import load_dotenv
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Load environment variables
+load_dotenv()
+# Detaching and copying out large partitions can outlast the web statement timeout
+os.environ["DB_STATEMENT_TIMEOUT_MS"] = "0"
+
+from app import create_app
+from app.extensions import db
+from app.service import partitions
+from app.service.category_stats_service import CategoryStatsService
+from app.service.generation_service import GenerationService
+
+ARCHIVE_DIR = os.environ.get(
+    "RETENTION_ARCHIVE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "archive")
+)
+
+
+def retention_cutoff(months: int):
+    """First month that is kept; every month before it is past the horizon."""
+    current = partitions.month_start(datetime.datetime.utcnow())
+    return partitions.add_months(current, -(max(1, months) - 1))
+
+
+def check_partitioned():
+    """Returns True if the database has partitioned tables to manage."""
+    if db.engine.dialect.name != 'postgresql':
+        print("❌ Partitioning is only supported on Postgres.")
+        return False
+    with db.engine.connect() as connection:
+        if not partitions.is_partitioned(connection):
+            print("❌ The articles table is not partitioned. Run `python -m flask db upgrade` first.")
+            return False
+    return True
+
+
+def print_plan(months: int):
+    """Print the monthly partitions, their size, and which are past the horizon."""
+    cutoff = retention_cutoff(months)
+    with db.engine.connect() as connection:
+        attached = partitions.attached_partitions(connection, "articles")
+        detached = partitions.detached_partitions(connection, "articles")
+        sizes = dict(connection.execute(db.text(
+            "SELECT c.relname, pg_total_relation_size(c.oid) FROM pg_class c WHERE c.relname LIKE 'article%\\_p%'"
+        )).all())
+
+    print(f"📋 Keeping {months} month(s): everything before {cutoff.isoformat()} is past the horizon")
+    print(f"{'month':<10} {'state':<10} {'articles':>12} {'links':>12}  action")
+    for month in sorted(set(attached) | set(detached)):
+        state = "attached" if month in attached else "detached"
+        action = "archive" if month < cutoff or month in detached else ""
+        article_size = sizes.get(partitions.partition_name("articles", month), 0)
+        link_size = sizes.get(partitions.partition_name("article_categories", month), 0)
+        print(f"{month.strftime('%Y-%m'):<10} {state:<10} {article_size / 1048576:>9.1f} MB {link_size / 1048576:>9.1f} MB  {action}")
+
+
+def maintain():
+    """Create the partitions for the current and coming months."""
+    with db.engine.begin() as connection:
+        months = partitions.ensure_partitions(connection)
+    print(f"✅ Partitions in place through {months[-1].strftime('%Y-%m')}.")
+    return True
+
+
+def expire(months: int, archive: bool):
+    """Detach every month past the horizon; with `archive`, write it to gzip files and drop it."""
+    cutoff = retention_cutoff(months)
+    with db.engine.connect() as connection:
+        expired = sorted(
+            month for month in partitions.attached_partitions(connection, "articles") if month < cutoff
+        )
+        # Months detached by an earlier, interrupted or detach-only run
+        leftovers = sorted(set(partitions.detached_partitions(connection, "articles")) - set(expired))
+    if not expired and not (archive and leftovers):
+        print("📋 Nothing past the horizon.")
+        return True
+
+    try:
+        for month in expired:
+            # One short transaction per month: DETACH locks the parent tables
+            with db.engine.begin() as connection:
+                partitions.detach_month(connection, month)
+            print(f"🔌 Detached {month.strftime('%Y-%m')}")
+
+        if archive:
+            for month in expired + leftovers:
+                for table, _ in reversed(partitions.PARTITIONED_TABLES):
+                    name = partitions.partition_name(table, month)
+                    with db.engine.connect() as connection:
+                        exists = connection.execute(db.text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+                    if not exists:
+                        continue
+                    raw_connection = db.engine.raw_connection()
+                    try:
+                        path = partitions.archive_table(raw_connection, name, ARCHIVE_DIR)
+                    finally:
+                        raw_connection.close()
+                    with db.engine.begin() as connection:
+                        connection.execute(db.text(f"DROP TABLE {name}"))
+                    print(f"📦 Archived {name} to {path}")
+
+        # Counts and cached feeds no longer include the expired months
+        CategoryStatsService.rebuild()
+        db.session.commit()
+        GenerationService.invalidate()
+        print(f"✅ {'Archived' if archive else 'Detached'} {len(expired + (leftovers if archive else []))} month(s).")
+        return True
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Retention failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🗓️  News-Man Partition Retention")
+    print("=" * 60)
+
+    command = sys.argv[1].lower() if len(sys.argv) > 1 else "plan"
+    months = int(sys.argv[2]) if len(sys.argv) > 2 else int(os.environ.get("RETENTION_MONTHS", 12))
+
+    app = create_app("read")
+    with app.app_context():
+        if command not in ("plan", "maintain", "archive", "detach"):
+            print(f"❌ Unknown command: {command}")
+            print("Available commands: plan, maintain, archive, detach")
+        elif check_partitioned():
+            if command == "plan":
+                print_plan(months)
+            elif command == "maintain":
+                maintain()
+            else:
+                expire(months, archive=command == "archive")
+
+    print("=" * 60)
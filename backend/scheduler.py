@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Background Refresh Scheduler for News-Man Backend
+Refreshes categories ahead of demand, prioritised by followers and recent reads.
+
+Usage:
+    python scheduler.py          # run until interrupted
+    python scheduler.py once     # one planning pass, wait for its runs, then exit
+    python scheduler.py plan     # print category priorities and exit
+
+Tuning (environment variables):
+    SCHEDULER_MIN_INTERVAL_MINUTES  refresh interval of the top category (default 30)
+    SCHEDULER_MAX_INTERVAL_MINUTES  refresh interval of unfollowed, unread categories (default 360)
+    SCHEDULER_MAX_CONCURRENCY       pipeline runs in flight at once (default 2)
+    SCHEDULER_RUNS_PER_MINUTE       global budget for run starts (default 6)
+    SCHEDULER_JITTER                +/- fraction applied to every interval (default 0.2)
+    SCHEDULER_COOLDOWN_MARGIN_MINUTES  no interval is shorter than NEWS_REFRESH_COOLDOWN_MINUTES
+                                    plus this margin (default 5)
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Load environment variables
+load_dotenv()
+
+from app import create_app
+from app.routes.news_routes import news_service
+from app.service.refresh_scheduler import RefreshScheduler
+
+
+def print_plan(scheduler):
+    """Print the current refresh priorities."""
+    with scheduler.app.app_context():
+        ranked = scheduler.priorities()
+    if not ranked:
+        print("📋 No categories to refresh.")
+        return
+    top_score = ranked[0][1]
+    print(f"{'category':<30} {'score':>10} {'interval':>12}")
+    for topic, score in ranked:
+        minutes = scheduler.interval_for(score, top_score).total_seconds() / 60
+        print(f"{topic:<30} {score:>10.1f} {minutes:>9.0f} min")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("⏰ News-Man Refresh Scheduler")
+    print("=" * 60)
+
+    scheduler = RefreshScheduler(create_app(), news_service)
+    command = sys.argv[1].lower() if len(sys.argv) > 1 else "run"
+
+    if command == "plan":
+        print_plan(scheduler)
+    elif command == "once":
+        print(f"🔄 Dispatched {scheduler.run_once(force=True)} refresh(es)")
+        scheduler.wait_idle()
+    elif command == "run":
+        print("🔄 Scheduler running. Press Ctrl+C to stop.")
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            scheduler.stop()
+            print("\n🛑 Scheduler stopped.")
+    else:
+        print(f"❌ Unknown command: {command}")
+        print("Available commands: run, once, plan")
+
+    print("=" * 60)
@@ -0,0 +1,106 @@
+import os
+import sys
+import json
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.service.news_service import NewsService
+from app.service.pipeline_run import PipelineRun
+
+parse = NewsService._parse_batch_response
+is_summary = NewsService._is_summary_entry
+
+
+def _summary(id, text="s"):
+    return {"id": id, "headline": f"h{id}", "summary": text}
+
+
+def test_parse_maps_entries_by_id_regardless_of_order():
+    text = json.dumps([_summary(3), _summary(1), _summary(2)])
+    parsed = parse(text, 3, is_summary)
+    assert sorted(parsed) == [0, 1, 2]
+    assert parsed[2]["headline"] == "h3"
+
+
+def test_parse_unwraps_an_array_inside_an_object():
+    parsed = parse(json.dumps({"articles": [_summary(1)]}), 1, is_summary)
+    assert parsed[0]["headline"] == "h1"
+
+
+@pytest.mark.parametrize("text", ["not json", "", None, "42", json.dumps({"error": "x"})])
+def test_parse_returns_nothing_for_malformed_responses(text):
+    assert parse(text, 2, is_summary) == {}
+
+
+def test_parse_keeps_only_well_formed_entries():
+    text = json.dumps([
+        _summary(1),
+        _summary(1, "duplicate"),     # first entry for an id wins
+        {"id": 2, "headline": "h2"},  # no summary
+        _summary(3, "   "),           # blank summary
+        _summary(9),                  # out of range
+        {"id": "x", "headline": "h", "summary": "s"},
+        "stray string",
+    ])
+    parsed = parse(text, 3, is_summary)
+    assert list(parsed) == [0]
+    assert parsed[0]["summary"] == "s"
+
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+
+
+class ScriptedModel:
+    """Answers batch prompts with a canned response and per-article prompts itself."""
+    def __init__(self, batch_text):
+        self.batch_text = batch_text
+        self.prompts = []
+
+    def generate_content(self, prompt, request_options=None):
+        self.prompts.append(prompt)
+        if "JSON array" in prompt:
+            return _Response(self.batch_text)
+        if "factually accurate" in prompt:
+            return _Response("YES")
+        return _Response(json.dumps({"headline": "single", "summary": "per-article summary"}))
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("NEWS_LLM_CONCURRENCY", "1")
+    monkeypatch.setenv("NEWS_LLM_BATCH_MODE", "batch")
+
+    def build(model):
+        service = NewsService(tavily_client=object(), summarization_model=model, validation_model=model)
+        monkeypatch.setattr(service.llm_cache, "get_many", lambda kind, keys: {})
+        monkeypatch.setattr(service.llm_cache, "put_many", lambda kind, values: None)
+        return service
+    return build
+
+
+def _articles(run, count):
+    return run.admit([{"url": f"https://example.com/{i}", "title": f"t{i}", "raw_content": f"article {i} " * 50}
+                      for i in range(count)])
+
+
+@pytest.mark.parametrize("batch_text, headlines", [
+    ("{not json", ["single", "single", "single"]),                           # malformed
+    (json.dumps([_summary(1), _summary(3)]), ["h1", "single", "h3"]),        # partial
+    (json.dumps([_summary(3), _summary(2), _summary(1)]), ["h1", "h2", "h3"]),  # misordered
+])
+def test_batched_requests_fall_back_per_article(service, batch_text, headlines):
+    model = ScriptedModel(batch_text)
+    service = service(model)
+    with PipelineRun("tech") as run:
+        articles = _articles(run, 3)
+        summaries, validated = service._summarize_and_validate_batched(articles, run)
+
+    assert [summary["source_url"] for summary in summaries] == [article["url"] for article in articles]
+    assert [summary["headline"] for summary in summaries] == headlines
+    assert sum("Process the following article" in prompt for prompt in model.prompts) == headlines.count("single")
+    # The canned response has no verdicts, so every summary is validated on its own
+    assert len(validated) == 3
+    assert sum("Original Text" in prompt and "JSON array" not in prompt for prompt in model.prompts) == 3
@@ -0,0 +1,51 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.service.content_prep import prepare_content
+
+PARAGRAPH = "The council approved the new budget on Tuesday after a long debate about transport funding."
+
+
+def test_boilerplate_and_navigation_are_dropped():
+    page = "\n".join([
+        "[Home](https://news.example) | [World](https://news.example/world) | [Business](https://news.example/b)",
+        "Skip to main content",
+        "![A photo](https://cdn.example/photo.jpg)",
+        PARAGRAPH,
+        "Advertisement",
+        "Share this article",
+        "Subscribe to our newsletter",
+        "© 2025 Example News. All rights reserved.",
+    ])
+    assert prepare_content(page) == PARAGRAPH
+
+
+def test_links_keep_their_labels_and_bare_urls_are_removed():
+    line = f"{PARAGRAPH} Read the [full report](https://example.com/report) at https://example.com/x today."
+    assert prepare_content(line) == f"{PARAGRAPH} Read the full report at today."
+
+
+def test_long_lines_that_start_like_boilerplate_are_kept():
+    line = "Subscribe numbers rose sharply this quarter as the paper expanded into three new regional markets."
+    assert prepare_content(line) == line
+
+
+def test_repeated_paragraphs_are_kept_once():
+    page = "\n".join([PARAGRAPH, PARAGRAPH.upper(), f"  {PARAGRAPH}  ", "Second paragraph about 2026 plans."])
+    assert prepare_content(page).splitlines() == [PARAGRAPH, "Second paragraph about 2026 plans."]
+
+
+def test_content_is_cut_at_a_word_boundary_within_the_budget():
+    page = "\n".join(f"{PARAGRAPH} Paragraph {i}." for i in range(50))
+    prepared = prepare_content(page, max_tokens=100)
+    assert len(prepared) <= 400
+    assert prepared.splitlines()[0] == f"{PARAGRAPH} Paragraph 0."
+    last_word = prepared.split()[-1]
+    assert last_word in page.split()
+
+
+def test_empty_content_passes_through():
+    assert prepare_content(None) is None
+    assert prepare_content("") == ""
@@ -0,0 +1,85 @@
+import os
+import sys
+import uuid
+import random
+import datetime
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.extensions import db
+from app.models import Article
+from app.service.dedup import SimHashIndex, simhash, hamming_distance, to_signed, to_unsigned
+
+
+def _flip(fingerprint, bits):
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+def test_find_returns_fingerprints_within_max_distance():
+    index = SimHashIndex(max_distance=6, window_days=7, max_entries=100)
+    fingerprint = random.Random(1).getrandbits(64)
+    index.add(fingerprint, "a")
+
+    # Spread the flipped bits across bands; pigeonhole still leaves one band intact
+    assert index.find(_flip(fingerprint, [0, 11, 22, 33, 44, 55])) == "a"
+    assert index.find(_flip(fingerprint, range(0, 63, 9))) is None
+    assert index.find(fingerprint ^ (2 ** 64 - 1)) is None
+
+
+def test_oldest_entries_are_evicted():
+    index = SimHashIndex(max_distance=3, window_days=7, max_entries=2)
+    fingerprints = [random.Random(seed).getrandbits(64) for seed in range(3)]
+    for article_id, fingerprint in zip("abc", fingerprints):
+        index.add(fingerprint, article_id)
+    assert index.find(fingerprints[0]) is None
+    assert index.find(fingerprints[1]) == "b"
+    assert index.find(fingerprints[2]) == "c"
+
+
+def test_simhash_keeps_reworded_copies_close():
+    words = " ".join(f"word{i}" for i in range(400))
+    reworded = words.replace("word200", "changed")
+    assert hamming_distance(simhash(words), simhash(reworded)) <= 6
+    assert hamming_distance(simhash(words), simhash(words[::-1])) > 6
+    assert to_unsigned(to_signed(2 ** 64 - 1)) == 2 ** 64 - 1
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("SUPABASE_DB_URI", f"sqlite:///{tmp_path / 'dedup.sqlite'}")
+    app = create_app("read")
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _store(fingerprint, created_at):
+    article_id = str(uuid.uuid4())
+    db.session.add(Article(id=article_id, title="t", summary="s", source_url=f"https://example.com/{article_id}",
+                           simhash=to_signed(fingerprint), created_at=created_at))
+    db.session.commit()
+    return article_id
+
+
+def test_sync_loads_the_window_and_late_commits(app):
+    now = datetime.datetime.utcnow()
+    recent, old = random.Random(2).getrandbits(64), random.Random(3).getrandbits(64)
+    recent_id = _store(recent, now - datetime.timedelta(days=1))
+    _store(old, now - datetime.timedelta(days=30))
+
+    index = SimHashIndex(max_distance=3, window_days=7, max_entries=100)
+    index.sync()
+    assert index.find(recent) == recent_id
+    assert index.find(old) is None
+
+    # A row created before the last synced one but committed after it is still picked up
+    late = random.Random(4).getrandbits(64)
+    late_id = _store(late, now - datetime.timedelta(days=1, minutes=2))
+    index.sync()
+    assert index.find(late) == late_id
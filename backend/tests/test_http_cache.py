@@ -0,0 +1,107 @@
+import os
+import sys
+import gzip
+import json
+import uuid
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.extensions import db
+from app.models import Article
+from app.routes import http_cache
+from app.routes.http_cache import ResponseCache
+from app.service.generation_service import GenerationService
+
+ARTICLE_COUNT = 20
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("SUPABASE_DB_URI", f"sqlite:///{tmp_path / 'cache.sqlite'}")
+    monkeypatch.setattr(http_cache, "response_cache", ResponseCache())
+    GenerationService.invalidate()
+    app = create_app("read")
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+    GenerationService.invalidate()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def _store_articles(count=ARTICLE_COUNT):
+    db.session.execute(Article.__table__.insert().values([
+        {"id": str(uuid.uuid4()), "title": f"title {i}", "headline": f"headline {i}",
+         "summary": "A summary long enough to push the feed past the compression threshold.",
+         "source_url": f"https://example.com/{uuid.uuid4()}"}
+        for i in range(count)
+    ]))
+    GenerationService.bump()
+    db.session.commit()
+    GenerationService.invalidate()
+
+
+def test_conditional_get_returns_304_until_content_changes(client):
+    _store_articles()
+    first = client.get("/articles/")
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert "Accept-Encoding" in first.headers["Vary"]
+    etag = first.headers["ETag"]
+
+    cached = client.get("/articles/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.data == b""
+
+    _store_articles(1)
+    changed = client.get("/articles/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.get_json()) == ARTICLE_COUNT + 1
+
+
+def test_empty_responses_are_not_tagged(client):
+    response = client.get("/articles/")
+    assert response.status_code == 200
+    assert response.get_json() == []
+    assert "ETag" not in response.headers
+
+
+def test_gzip_variant_has_its_own_etag_and_revalidates(client):
+    _store_articles()
+    plain = client.get("/articles/")
+    compressed = client.get("/articles/", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+
+    # Served from the response cache the second time, same bytes
+    again = client.get("/articles/", headers={"Accept-Encoding": "gzip"})
+    assert again.data == compressed.data
+
+    revalidated = client.get("/articles/", headers={"Accept-Encoding": "gzip",
+                                                    "If-None-Match": compressed.headers["ETag"]})
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip;q=0", "deflate"])
+def test_unsupported_or_refused_encodings_get_the_plain_body(client, accept_encoding):
+    _store_articles()
+    response = client.get("/articles/", headers={"Accept-Encoding": accept_encoding})
+    assert "Content-Encoding" not in response.headers
+    assert len(response.get_json()) == ARTICLE_COUNT
+
+
+def test_small_bodies_are_not_compressed(client):
+    _store_articles(1)
+    response = client.get("/articles/categories/stats", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
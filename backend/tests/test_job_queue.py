@@ -0,0 +1,77 @@
+import os
+import sys
+import threading
+import pytest
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.service.job_queue import JobQueue, COMPLETED, FAILED
+
+
+@pytest.fixture
+def queue():
+    queue = JobQueue(max_workers=2)
+    yield queue
+    queue._executor.shutdown(wait=True)
+
+
+def _wait(job, timeout=5):
+    for _ in range(timeout * 100):
+        if job.is_finished:
+            return
+        threading.Event().wait(0.01)
+    pytest.fail("job did not finish")
+
+
+def test_submit_coalesces_onto_the_active_job(queue):
+    release = threading.Event()
+    calls = []
+
+    def run(topic):
+        calls.append(topic)
+        release.wait(5)
+        return {"status": "success"}, 200
+
+    app = Flask(__name__)
+    first, created = queue.submit(app, "tech", run)
+    second, coalesced = queue.submit(app, "tech", run)
+    assert created and not coalesced
+    assert second is first
+
+    release.set()
+    _wait(first)
+    assert calls == ["tech"]
+    assert first.status == COMPLETED and first.http_status == 200
+
+    third, created = queue.submit(app, "tech", run)
+    assert created and third is not first
+    _wait(third)
+
+
+def test_failed_job_is_finished_with_a_500(queue):
+    def run(topic):
+        raise RuntimeError("boom")
+
+    job, _ = queue.submit(Flask(__name__), "tech", run)
+    _wait(job)
+    assert job.status == FAILED
+    assert job.http_status == 500
+    assert job.finished_at is not None
+
+
+def test_prune_skips_running_jobs_and_forgets_old_finished_ones(queue):
+    release = threading.Event()
+    app = Flask(__name__)
+    running, _ = queue.submit(app, "world", lambda topic: (release.wait(5), 200))
+    done, _ = queue.submit(app, "tech", lambda topic: ({}, 200))
+    _wait(done)
+
+    queue.retention_seconds = -1
+    with queue._lock:
+        queue._prune()
+    assert queue.get(done.id) is None
+    assert queue.get(running.id) is running
+
+    release.set()
+    _wait(running)
@@ -0,0 +1,80 @@
+import os
+import sys
+import uuid
+import datetime
+import pytest
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.extensions import db
+from app.models import Article, Category, article_categories
+from app.service.article_service import ArticleService
+
+ARTICLE_COUNT = 45
+PAGE_SIZE = 7
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("SUPABASE_DB_URI", f"sqlite:///{tmp_path / 'feed.sqlite'}")
+    app = create_app("read")
+    with app.app_context():
+        db.create_all()
+        db.session.add(Category(category_name="tech"))
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _article_row(i, **values):
+    return {"id": str(uuid.uuid4()), "title": f"t{i}", "headline": f"h{i}", "summary": "s",
+            "source_url": f"https://example.com/{i}", **values}
+
+
+def _link_all():
+    category_id = db.session.query(Category.id).scalar()
+    db.session.execute(article_categories.insert().from_select(
+        ["article_id", "category_id", "article_created_at"],
+        db.select(Article.id, db.literal(category_id), Article.created_at)
+    ))
+    db.session.commit()
+
+
+def _walk(fetch_page):
+    """Follows next cursors to the last page; fails instead of looping forever."""
+    ids, after = [], None
+    for _ in range(ARTICLE_COUNT):
+        page, after = fetch_page(after)
+        ids.extend(row.id for row in page)
+        if after is None:
+            return ids
+    pytest.fail("pagination did not reach the last page")
+
+
+def _assert_complete(ids):
+    assert len(ids) == len(set(ids)) == ARTICLE_COUNT
+    stored = db.session.execute(text("SELECT id FROM articles ORDER BY created_at DESC, id DESC")).scalars().all()
+    assert ids == stored
+
+
+def test_pages_walk_to_the_end_with_default_timestamps(app):
+    # Inserted like _store_articles does, in one statement and so within the same second
+    db.session.execute(Article.__table__.insert().values([_article_row(i) for i in range(ARTICLE_COUNT)]))
+    db.session.commit()
+    _link_all()
+
+    _assert_complete(_walk(lambda after: ArticleService.get_articles_page(PAGE_SIZE, after)))
+    _assert_complete(_walk(lambda after: ArticleService.get_articles_by_category_page("tech", PAGE_SIZE, after)))
+
+
+def test_pages_walk_to_the_end_with_identical_timestamps(app):
+    created_at = datetime.datetime(2026, 1, 1, 12, 0, 0)
+    db.session.execute(Article.__table__.insert(), [_article_row(i, created_at=created_at) for i in range(ARTICLE_COUNT)])
+    db.session.commit()
+    _link_all()
+
+    _assert_complete(_walk(lambda after: ArticleService.get_articles_page(PAGE_SIZE, after)))
+    _assert_complete(_walk(lambda after: ArticleService.get_articles_by_category_page("tech", PAGE_SIZE, after)))
@@ -0,0 +1,139 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.service import rate_limit
+from app.service.rate_limit import (
+    TokenBucket, CircuitBreaker, ProviderLimiter, RateLimitExceeded, CircuitOpenError, is_throttled
+)
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances monotonic() instantly."""
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class Throttled(Exception):
+    code = 429
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    monkeypatch.setattr(rate_limit.random, "uniform", lambda low, high: high)
+    return clock
+
+
+def test_bucket_refills_at_its_rate(clock):
+    bucket = TokenBucket(rate_per_minute=60, capacity=2)
+    assert bucket.acquire() and bucket.acquire()
+    assert clock.slept == []
+    assert bucket.acquire()
+    assert clock.slept == [pytest.approx(1.0)]
+
+
+def test_bucket_gives_up_when_tokens_cannot_arrive_in_time(clock):
+    bucket = TokenBucket(rate_per_minute=60, capacity=1)
+    assert bucket.acquire()
+    assert bucket.acquire(timeout=0.5) is False
+    assert clock.slept == []
+    assert bucket.acquire(timeout=1.5)
+
+
+def test_breaker_opens_then_allows_one_half_open_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    clock.now += 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_only_throttling_is_retried(clock):
+    limiter = ProviderLimiter("test", rpm=600, max_retries=3, failure_threshold=10)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise Throttled("slow down")
+        return "ok"
+
+    assert limiter.call(flaky) == "ok"
+    assert len(attempts) == 3
+    assert limiter.snapshot()["retries"] == 2
+
+    def broken():
+        attempts.append(1)
+        raise ValueError("bad request")
+
+    attempts.clear()
+    with pytest.raises(ValueError):
+        limiter.call(broken)
+    assert len(attempts) == 1
+
+
+def test_retries_stop_at_the_deadline(clock):
+    limiter = ProviderLimiter("test", rpm=600, max_retries=4, base_delay=1.0, failure_threshold=10)
+    attempts = []
+
+    def throttled():
+        attempts.append(clock.now)
+        raise Throttled("slow down")
+
+    with pytest.raises(Throttled):
+        limiter.call(throttled, deadline=clock.now + 2.5)
+    # Backoffs of 1s and 2s; the second would end past the deadline
+    assert len(attempts) == 2
+
+    with pytest.raises(RateLimitExceeded):
+        limiter.call(throttled, deadline=clock.now - 1)
+
+
+def test_circuit_sheds_calls_and_gives_back_unused_trials(clock):
+    limiter = ProviderLimiter("test", rpm=1, max_retries=0, failure_threshold=1, reset_seconds=30)
+
+    def broken():
+        raise ValueError("down")
+
+    with pytest.raises(ValueError):
+        limiter.call(broken)
+    with pytest.raises(CircuitOpenError):
+        limiter.call(broken)
+
+    clock.now += 30
+    # The half-open trial is refused budget, so the next caller may still make it
+    with pytest.raises(RateLimitExceeded):
+        limiter.call(broken, deadline=clock.now)
+    assert limiter.breaker.allow()
+
+
+def test_is_throttled_recognises_provider_errors():
+    assert is_throttled(Throttled())
+    assert is_throttled(Exception("429 Too Many Requests"))
+    assert is_throttled(Exception("Quota exceeded for requests"))
+    assert not is_throttled(ValueError("invalid JSON"))
@@ -0,0 +1,91 @@
+import os
+import sys
+import threading
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.service.topic_lock import SingleFlight
+
+
+def _followers(flight, key, fn, count, results):
+    threads = [threading.Thread(target=lambda: results.append(_capture(flight, key, fn))) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def _capture(flight, key, fn):
+    try:
+        return flight.do(key, fn)
+    except Exception as e:
+        return e
+
+
+def _wait_for_waiters(flight, key, count):
+    # Releasing the leader before every follower is blocked on it would let a late one run fn itself
+    condition = flight._calls[key].done._cond
+    for _ in range(500):
+        if len(condition._waiters) == count:
+            return
+        threading.Event().wait(0.01)
+    pytest.fail("followers did not block on the leader")
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("tech", fn)))
+    leader.start()
+    started.wait(5)
+    followers = _followers(flight, "tech", fn, 3, results)
+    _wait_for_waiters(flight, "tech", 3)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ["result"] * 4
+    assert flight._calls == {}
+
+
+def test_followers_receive_the_leaders_exception():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(_capture(flight, "tech", fn)))
+    leader.start()
+    started.wait(5)
+    followers = _followers(flight, "tech", fn, 2, results)
+    _wait_for_waiters(flight, "tech", 2)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(results) == 3
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_calls_after_completion_run_again():
+    flight = SingleFlight()
+    calls = []
+    assert flight.do("tech", lambda: calls.append(1) or len(calls)) == 1
+    assert flight.do("tech", lambda: calls.append(1) or len(calls)) == 2
+    with pytest.raises(KeyError):
+        flight.do("world", lambda: {}["missing"])
+    assert flight._calls == {}
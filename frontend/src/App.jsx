@@ -6,6 +6,7 @@ import React, { useState, useEffect, useMemo } from "react";
 const API_BASE_URL =
   import.meta.env.VITE_API_BASE_URL || "http://127.0.0.1:5000";
 const ARTICLES_PER_PAGE = 5;
+const JOB_POLL_INTERVAL_MS = 1500;
 
 // --- Icon Components ---
 const RefreshIcon = ({ className = "h-4 w-4" }) => (
@@ -75,6 +76,17 @@ const SkeletonCard = () => (
   </div>
 );
 
+// Stored timestamps are naive UTC; e.g. "5 min ago"
+const timeAgo = (timestamp) => {
+  if (!timestamp) return null;
+  const utc = /(Z|[+-]\d\d:\d\d)$/.test(timestamp) ? timestamp : `${timestamp}Z`;
+  const minutes = Math.max(0, Math.floor((Date.now() - new Date(utc).getTime()) / 60000));
+  if (minutes < 1) return "just now";
+  if (minutes < 60) return `${minutes} min ago`;
+  if (minutes < 24 * 60) return `${Math.floor(minutes / 60)} h ago`;
+  return `${Math.floor(minutes / (24 * 60))} d ago`;
+};
+
 const ArticleCard = ({ article }) => {
   const formattedDate = article.published_at
     ? new Date(article.published_at).toLocaleDateString("en-US", {
@@ -167,10 +179,78 @@ const App = () => {
     return response.json();
   };
 
+  // Returns a finished job's result, or throws with the same error shape as
+  // apiRequest when the run was skipped or failed.
+  const jobResult = (status) => {
+    if (status.http_status >= 400) {
+      const error = new Error(status.result?.message || "Request failed");
+      error.response = { status: status.http_status, data: status.result };
+      throw error;
+    }
+    return status.result;
+  };
+
+  const pollJob = async (statusUrl, status = {}) => {
+    while (status.status !== "completed" && status.status !== "failed") {
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+      status = await apiRequest(`${API_BASE_URL}${statusUrl}`);
+    }
+    return jobResult(status);
+  };
+
+  // Queues a pipeline run and polls its job until it finishes.
+  const runPipeline = async (categoryName) => {
+    const job = await apiRequest(`${API_BASE_URL}/news/process/${categoryName}`);
+    return pollJob(job.status_url, job);
+  };
+
+  // Runs the pipeline over Server-Sent Events, calling onArticle for each article
+  // as soon as it is stored. Settles like runPipeline, and falls back to polling
+  // if the stream cannot be opened or drops mid-run.
+  const streamPipeline = (categoryName, onArticle) => {
+    if (typeof EventSource === "undefined") return runPipeline(categoryName);
+    return new Promise((resolve, reject) => {
+      const source = new EventSource(
+        `${API_BASE_URL}/news/stream/${categoryName}`
+      );
+      let jobId = null;
+      source.addEventListener("job", (e) => {
+        jobId = JSON.parse(e.data).job_id;
+      });
+      source.addEventListener("article", (e) =>
+        onArticle(JSON.parse(e.data).article)
+      );
+      source.addEventListener("complete", (e) => {
+        source.close();
+        try {
+          resolve(jobResult(JSON.parse(e.data)));
+        } catch (err) {
+          reject(err);
+        }
+      });
+      source.onerror = () => {
+        source.close();
+        const fallback = jobId
+          ? pollJob(`/news/jobs/${jobId}`)
+          : runPipeline(categoryName);
+        fallback.then(resolve, reject);
+      };
+    });
+  };
+
+  // Shows a streamed article at the top of the list, once
+  const addStreamedArticle = (article) =>
+    setArticles((prev) =>
+      prev.some((existing) => existing.id === article.id)
+        ? prev
+        : [article, ...prev]
+    );
+
   const fetchCategories = async () => {
     try {
       setLoading((prev) => ({ ...prev, categories: true }));
-      const data = await apiRequest(`${API_BASE_URL}/articles/categories`);
+      // Names plus article counts and freshness, from one indexed query
+      const data = await apiRequest(`${API_BASE_URL}/articles/categories/stats`);
       setCategories(data);
     } catch (err) {
       console.error("Error fetching categories:", err);
@@ -214,8 +294,22 @@ const App = () => {
     try {
       setError(null);
       setLoading((prev) => ({ ...prev, refresh: categoryName }));
-      await apiRequest(`${API_BASE_URL}/news/process/${categoryName}`);
-      await fetchArticles(selectedCategory);
+      const streamsIntoView =
+        selectedCategory === categoryName || selectedCategory === "general";
+      const result = await streamPipeline(categoryName, (article) => {
+        if (streamsIntoView) addStreamedArticle(article);
+      });
+      // Linked, previously stored articles are not streamed
+      if (!streamsIntoView || result?.metrics?.linked_existing_count) {
+        await fetchArticles(selectedCategory);
+      }
+      // Article counts and "updated" times in the sidebar
+      if (
+        result?.metrics?.newly_stored_count ||
+        result?.metrics?.linked_existing_count
+      ) {
+        fetchCategories();
+      }
     } catch (err) {
       console.error(`Error refreshing category ${categoryName}:`, err);
       if (err.response && err.response.status === 429) {
@@ -238,13 +332,22 @@ const App = () => {
     try {
       setError(null);
       setLoading((prev) => ({ ...prev, refresh: categoryName }));
-      await apiRequest(`${API_BASE_URL}/news/process/${categoryName}`);
+      // Switch to the new category right away and fill it as articles arrive
+      setSelectedCategory(categoryName);
+      setArticles([]);
+      setCurrentPage(1);
+      const result = await streamPipeline(categoryName, addStreamedArticle);
       setNewCategory("");
       await fetchCategories();
-      handleCategorySelect(categoryName);
+      // Linked, previously stored articles are not streamed
+      if (result?.metrics?.linked_existing_count) {
+        await fetchArticles(categoryName);
+      }
     } catch (err) {
       console.error(`Error adding category ${categoryName}:`, err);
       if (err.response && err.response.status === 429) {
+        // The category exists and was refreshed recently; show what it has
+        fetchArticles(categoryName);
         setError(err.response.data.message);
       } else {
         setError(`Could not add "${categoryName}".`);
@@ -310,6 +413,18 @@ const App = () => {
                     >
                       {cat.category_name.charAt(0).toUpperCase() +
                         cat.category_name.slice(1)}
+                      <span
+                        className={`block text-xs font-normal ${
+                          selectedCategory === cat.category_name
+                            ? "text-blue-100"
+                            : "text-gray-400"
+                        }`}
+                      >
+                        {cat.article_count} article
+                        {cat.article_count === 1 ? "" : "s"}
+                        {cat.latest_created_at &&
+                          ` · updated ${timeAgo(cat.latest_created_at)}`}
+                      </span>
                     </button>
                     <button
                       onClick={() => handleRefresh(cat.category_name)}